@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Simple interactive chat interface for Mini-JARVIS."""
 
+import argparse
 import asyncio
+import atexit
 import logging
 import sys
+import threading
 from pathlib import Path
+from typing import List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -12,6 +16,7 @@ sys.path.insert(0, str(project_root))
 
 from src.brain.orchestrator import Orchestrator
 from src.brain.router import InferenceTarget
+from src.common.httpclient import close_shared_client
 
 # Optional RAG import
 try:
@@ -21,6 +26,15 @@ except ImportError:
     RAG_AVAILABLE = False
     RAGServer = None
 
+# Optional async prompt with history (falls back to readline)
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory
+except ImportError:
+    PromptSession = None
+
+HISTORY_FILE = Path.home() / ".mini_jarvis_history"
+
 # Setup logging (less verbose for interactive use)
 logging.basicConfig(
     level=logging.WARNING,  # Only show warnings/errors
@@ -31,12 +45,95 @@ logging.basicConfig(
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
 
-async def chat_loop():
-    """Interactive chat loop with JARVIS."""
+async def _input_in_thread(prompt: str) -> str:
+    """Read a line without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def reader():
+        try:
+            line = input(prompt)
+        except Exception as e:
+            loop.call_soon_threadsafe(future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(future.set_result, line)
+    
+    # Daemon thread so a pending input() never blocks interpreter exit
+    threading.Thread(target=reader, daemon=True).start()
+    return await future
+
+
+def create_prompt():
+    """Return an async prompt function with history saved to HISTORY_FILE."""
+    if PromptSession is not None:
+        session = PromptSession(history=FileHistory(str(HISTORY_FILE)))
+        return session.prompt_async
+    
+    try:
+        import readline
+        try:
+            readline.read_history_file(str(HISTORY_FILE))
+        except OSError:
+            pass
+        atexit.register(readline.write_history_file, str(HISTORY_FILE))
+    except ImportError:
+        pass  # No readline on this platform; input still works
+    return _input_in_thread
+
+
+def read_prompts(path: str) -> List[str]:
+    """Read one prompt per non-empty line from a file ('-' for stdin)."""
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip()]
+
+
+async def run_batch(orchestrator: Orchestrator, prompts: List[str]):
+    """
+    Answer all prompts concurrently.
+    
+    Requests are in flight together, so Ollama can batch their decode steps
+    (up to OLLAMA_NUM_PARALLEL) instead of generating one reply at a time.
+    """
+    print(f"🚀 Dispatching {len(prompts)} prompts concurrently...\n")
+    results = await asyncio.gather(
+        *[orchestrator.think(prompt) for prompt in prompts],
+        return_exceptions=True
+    )
+    
+    for prompt, result in zip(prompts, results):
+        print(f"You: {prompt}")
+        if isinstance(result, Exception):
+            print(f"❌ Error: {result}\n")
+            continue
+        response, target, tool_calls = result
+        brain_indicator = "☁️" if target == InferenceTarget.CLOUD else "🏠"
+        if tool_calls:
+            tools_used = ", ".join([tc.get("tool") or tc.get("name", "unknown") for tc in tool_calls])
+            print(f"🔧 Tools used: {tools_used}")
+        print(f"JARVIS {brain_indicator}: {response}\n")
+
+
+async def chat_loop(batch_file: Optional[str] = None):
+    """
+    Interactive chat loop with JARVIS.
+    
+    Args:
+        batch_file: Optional prompts file (one per line, '-' for stdin) to
+                    answer concurrently instead of starting the REPL
+    """
+    prompts = read_prompts(batch_file) if batch_file else None
+    
     print("\n" + "="*60)
     print("Mini-JARVIS - Interactive Chat")
     print("="*60)
-    print("Ask me anything! (Type 'quit' or 'exit' to end)\n")
+    if prompts is None:
+        print("Ask me anything! (Type 'quit' or 'exit' to end)\n")
+    else:
+        print("Batch mode: for server-side batching, start Ollama with")
+        print("  OLLAMA_NUM_PARALLEL=8 OLLAMA_MAX_LOADED_MODELS=1 ollama serve\n")
     
     # Initialize RAG server if available (with tiering enabled)
     rag_server = None
@@ -78,10 +175,19 @@ async def chat_loop():
         else:
             print("⚠️  Cloud Burst not configured (OLLAMA_CLOUD_API_KEY not set)\n")
         
+        if prompts is not None:
+            await run_batch(orchestrator, prompts)
+            return
+        
+        prompt = create_prompt()
+        
         while True:
             try:
+                # Warm up the Ollama connection while the user is typing
+                prewarm = asyncio.create_task(orchestrator.local_brain.check_health())
+                
                 # Get user input
-                question = input("You: ").strip()
+                question = (await prompt("You: ")).strip()
                 
                 if not question:
                     continue
@@ -90,9 +196,11 @@ async def chat_loop():
                     print("\n👋 Goodbye!")
                     break
                 
-                # Get response from orchestrator
+                await prewarm
+                
+                # Stream response from orchestrator
                 print("🤔 Thinking...", end="", flush=True)
-                response, target, tool_calls = await orchestrator.think(question)
+                stream, target, tool_calls = await orchestrator.think_stream(question)
                 print("\r" + " "*20 + "\r", end="")  # Clear "Thinking..." line
                 
                 # Show which brain was used
@@ -103,18 +211,40 @@ async def chat_loop():
                     tools_used = ", ".join([tc.get("tool") or tc.get("name", "unknown") for tc in tool_calls])
                     print(f"🔧 Tools used: {tools_used}")
                 
-                print(f"JARVIS {brain_indicator}: {response}\n")
+                # Print tokens as they arrive instead of waiting for the full reply
+                print(f"JARVIS {brain_indicator}: ", end="", flush=True)
+                async for fragment in stream:
+                    print(fragment, end="", flush=True)
+                print("\n")
             
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\n\n👋 Goodbye!")
                 break
             except Exception as e:
                 print(f"\n❌ Error: {e}\n")
 
 
+async def main(batch_file: Optional[str] = None):
+    """Run the chat, then close pooled HTTP connections."""
+    try:
+        await chat_loop(batch_file=batch_file)
+    finally:
+        await close_shared_client()
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Interactive chat with Mini-JARVIS")
+    parser.add_argument(
+        "--batch",
+        type=str,
+        default=None,
+        metavar="PROMPTS_FILE",
+        help="Answer prompts from a file concurrently (one per line, '-' for stdin)"
+    )
+    args = parser.parse_args()
+    
     try:
-        asyncio.run(chat_loop())
+        asyncio.run(main(batch_file=args.batch))
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
 
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Check if all prerequisites are installed for Mini-JARVIS."""
 
+import asyncio
 import sys
-import subprocess
 import shutil
 from pathlib import Path
 
@@ -13,17 +13,28 @@ RED = '\033[0;31m'
 BLUE = '\033[0;34m'
 NC = '\033[0m'  # No Color
 
-def check_command(cmd, name, version_flag="--version"):
+# Precomputed status markers and banner
+OK = f"{GREEN}✓{NC}"
+WARN = f"{YELLOW}⚠{NC}"
+ERR = f"{RED}✗{NC}"
+BANNER = f"{BLUE}{'='*60}{NC}"
+
+async def check_command(cmd, name, version_flag="--version"):
     """Check if a command exists and optionally get version."""
     if shutil.which(cmd):
         try:
-            result = subprocess.run(
-                [cmd, version_flag],
-                capture_output=True,
-                text=True,
-                timeout=5
+            proc = await asyncio.create_subprocess_exec(
+                cmd, version_flag,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-            version = result.stdout.strip() or result.stderr.strip() or "installed"
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=5)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+            version = stdout.decode().strip() or stderr.decode().strip() or "installed"
             return True, version.split('\n')[0]
         except Exception as e:
             return True, "installed (version check failed)"
@@ -37,51 +48,60 @@ def check_python_version():
         return True, version_str
     return False, version_str
 
-def check_ollama_model(model_name="llama3.2:3b"):
-    """Check if Ollama model is installed."""
-    try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        if model_name in result.stdout:
-            return True, "installed"
-        return False, "not found"
-    except Exception as e:
-        return False, f"error: {str(e)}"
+def check_ollama_model(model_name="llama3.2:3b", models=None):
+    """Check if Ollama model is installed (using the /api/tags model list)."""
+    if models is None:
+        return False, "unknown (Ollama service not reachable)"
+    if any(m.get("name", "").startswith(model_name) for m in models):
+        return True, "installed"
+    return False, "not found"
 
-def check_ollama_service():
-    """Check if Ollama service is running."""
+async def check_ollama_service():
+    """Check if Ollama service is running.
+    
+    Returns:
+        Tuple of (ok, status, models) where models is the parsed
+        /api/tags model list (None if the service wasn't reachable)
+    """
     try:
         # Try to connect to Ollama API
         import httpx
-        response = httpx.get("http://localhost:11434/api/tags", timeout=2.0)
+        async with httpx.AsyncClient(timeout=2.0) as client:
+            response = await client.get("http://localhost:11434/api/tags")
         if response.status_code == 200:
-            return True, "running"
-        return False, f"HTTP {response.status_code}"
+            return True, "running", response.json().get("models", [])
+        return False, f"HTTP {response.status_code}", None
     except ImportError:
-        return None, "httpx not installed (can't check)"
+        return None, "httpx not installed (can't check)", None
     except Exception as e:
-        return False, f"not accessible: {str(e)}"
+        return False, f"not accessible: {str(e)}", None
+
+async def check_rag_daemon():
+    """Check if the optional RAG daemon is running."""
+    try:
+        import httpx
+        async with httpx.AsyncClient(timeout=1.0) as client:
+            response = await client.get("http://127.0.0.1:5102/health")
+        return response.status_code == 200
+    except Exception:
+        return False
 
 def check_python_packages():
-    """Check if required Python packages are installed."""
-    # Map package names to their import names
-    package_map = {
-        "httpx": "httpx",
-        "python-dotenv": "dotenv"
-    }
-    missing = []
-    installed = []
+    """Check if required Python packages are installed.
     
-    for package, import_name in package_map.items():
-        try:
-            __import__(import_name)
-            installed.append(package)
-        except ImportError:
-            missing.append(package)
+    Reads installed distribution metadata instead of importing each
+    package, so the check has no import side effects.
+    """
+    import importlib.metadata as im
+    
+    required = ["httpx", "python-dotenv"]
+    # Normalize names (e.g. python_dotenv -> python-dotenv)
+    installed_dists = {
+        (d.metadata["Name"] or "").lower().replace("_", "-")
+        for d in im.distributions()
+    }
+    installed = [p for p in required if p in installed_dists]
+    missing = [p for p in required if p not in installed_dists]
     
     return len(missing) == 0, installed, missing
 
@@ -91,11 +111,19 @@ def check_venv():
         hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix
     )
 
-def main():
+async def main():
     """Run all checks."""
-    print(f"\n{BLUE}{'='*60}{NC}")
+    # Run the I/O-bound probes concurrently, then report in the usual order
+    (pkgs_ok, installed, missing), (ollama_ok, ollama_ver), service_result, daemon_ok = await asyncio.gather(
+        asyncio.to_thread(check_python_packages),
+        check_command("ollama", "Ollama"),
+        check_ollama_service(),
+        check_rag_daemon()
+    )
+    
+    print(f"\n{BANNER}")
     print(f"{BLUE}Mini-JARVIS: Prerequisites Check{NC}")
-    print(f"{BLUE}{'='*60}{NC}\n")
+    print(f"{BANNER}\n")
     
     all_ok = True
     
@@ -103,52 +131,51 @@ def main():
     print(f"{YELLOW}Python Version:{NC}")
     py_ok, py_ver = check_python_version()
     if py_ok:
-        print(f"  {GREEN}✓ Python {py_ver} (3.11+ required){NC}")
+        print(f"  {OK} Python {py_ver} (3.11+ required)")
     else:
-        print(f"  {RED}✗ Python {py_ver} (need 3.11+){NC}")
+        print(f"  {ERR} Python {py_ver} (need 3.11+)")
         all_ok = False
     print()
     
     # Check virtual environment
     print(f"{YELLOW}Virtual Environment:{NC}")
     if check_venv():
-        print(f"  {GREEN}✓ Virtual environment active{NC}")
+        print(f"  {OK} Virtual environment active")
     else:
-        print(f"  {YELLOW}⚠ Not in virtual environment (recommended){NC}")
+        print(f"  {WARN} Not in virtual environment (recommended)")
     print()
     
     # Check Python packages
     print(f"{YELLOW}Python Packages:{NC}")
-    pkgs_ok, installed, missing = check_python_packages()
     if pkgs_ok:
-        print(f"  {GREEN}✓ All required packages installed: {', '.join(installed)}{NC}")
+        print(f"  {OK} All required packages installed: {', '.join(installed)}")
     else:
-        print(f"  {RED}✗ Missing packages: {', '.join(missing)}{NC}")
+        print(f"  {ERR} Missing packages: {', '.join(missing)}")
         print(f"  {YELLOW}  Run: pip install -r requirements.txt{NC}")
         all_ok = False
     print()
     
     # Check Ollama
     print(f"{YELLOW}Ollama:{NC}")
-    ollama_ok, ollama_ver = check_command("ollama", "Ollama")
     if ollama_ok:
-        print(f"  {GREEN}✓ Ollama installed: {ollama_ver}{NC}")
+        print(f"  {OK} Ollama installed: {ollama_ver}")
     else:
-        print(f"  {RED}✗ Ollama not installed{NC}")
+        print(f"  {ERR} Ollama not installed")
         print(f"  {YELLOW}  Run: curl -fsSL https://ollama.com/install.sh | sh{NC}")
         all_ok = False
     print()
     
-    # Check Ollama service
+    # Check Ollama service (its /api/tags response also lists installed models)
+    ollama_models = None
     if ollama_ok:
         print(f"{YELLOW}Ollama Service:{NC}")
-        service_ok, service_status = check_ollama_service()
+        service_ok, service_status, ollama_models = service_result
         if service_ok:
-            print(f"  {GREEN}✓ Ollama service is {service_status}{NC}")
+            print(f"  {OK} Ollama service is {service_status}")
         elif service_ok is None:
-            print(f"  {YELLOW}⚠ {service_status}{NC}")
+            print(f"  {WARN} {service_status}")
         else:
-            print(f"  {RED}✗ Ollama service is {service_status}{NC}")
+            print(f"  {ERR} Ollama service is {service_status}")
             print(f"  {YELLOW}  Run: ollama serve{NC}")
             all_ok = False
         print()
@@ -156,37 +183,46 @@ def main():
     # Check Llama 3.2 3B model
     if ollama_ok:
         print(f"{YELLOW}Llama 3.2 3B Model:{NC}")
-        model_ok, model_status = check_ollama_model("llama3.2:3b")
+        model_ok, model_status = check_ollama_model("llama3.2:3b", ollama_models)
         if model_ok:
-            print(f"  {GREEN}✓ Llama 3.2 3B is {model_status}{NC}")
+            print(f"  {OK} Llama 3.2 3B is {model_status}")
         else:
-            print(f"  {RED}✗ Llama 3.2 3B is {model_status}{NC}")
+            print(f"  {ERR} Llama 3.2 3B is {model_status}")
             print(f"  {YELLOW}  Run: ollama pull llama3.2:3b{NC}")
             all_ok = False
         print()
     
+    # Check RAG daemon (optional, speeds up RAG CLI scripts)
+    print(f"{YELLOW}RAG Daemon:{NC}")
+    if daemon_ok:
+        print(f"  {OK} RAG daemon is running")
+    else:
+        print(f"  {WARN} RAG daemon not running (optional)")
+        print(f"  {YELLOW}  Run: python -m src.memory.rag_daemon{NC}")
+    print()
+    
     # Check .env file
     print(f"{YELLOW}Environment File:{NC}")
     project_root = Path(__file__).parent.parent
     env_file = project_root / ".env"
     if env_file.exists():
-        print(f"  {GREEN}✓ .env file exists{NC}")
+        print(f"  {OK} .env file exists")
     else:
-        print(f"  {YELLOW}⚠ .env file not found (will use defaults){NC}")
+        print(f"  {WARN} .env file not found (will use defaults)")
     print()
     
     # Summary
-    print(f"{BLUE}{'='*60}{NC}")
+    print(f"{BANNER}")
     if all_ok:
-        print(f"{GREEN}✓ All prerequisites are installed!{NC}")
+        print(f"{OK} All prerequisites are installed!")
         print(f"{GREEN}You're ready to test: python scripts/test_brain.py{NC}")
     else:
-        print(f"{RED}✗ Some prerequisites are missing{NC}")
+        print(f"{ERR} Some prerequisites are missing")
         print(f"{YELLOW}Run: bash scripts/setup.sh to install missing components{NC}")
-    print(f"{BLUE}{'='*60}{NC}\n")
+    print(f"{BANNER}\n")
     
     return 0 if all_ok else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
 
@@ -10,7 +10,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.memory.rag_server import RAGServer
+from src.memory.rag_daemon import RAGDaemonClient
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,17 +26,39 @@ async def main():
     print("=" * 60)
     
     try:
-        # Initialize RAG server with tiering enabled
-        rag_server = RAGServer(enable_tiering=True)
+        # Prefer a running RAG daemon (model and ChromaDB already loaded)
+        daemon = RAGDaemonClient()
+        if await daemon.is_running():
+            print(f"⚡ Using RAG daemon at {daemon.base_url}")
+            get_stats = daemon.get_stats
+            cleanup_expired = daemon.cleanup_expired
+        else:
+            # Fall back to an in-process RAG server with tiering enabled
+            from src.memory.rag_server import RAGServer
+            rag_server = RAGServer(enable_tiering=True)
+            
+            async def get_stats():
+                return rag_server.get_stats()
+            cleanup_expired = rag_server.cleanup_expired
         
         # Get stats before cleanup
-        stats_before = rag_server.get_stats()
+        stats_before = await get_stats()
         print(f"\n📊 Before cleanup:")
         print(f"   Total chunks: {stats_before['total_chunks']}")
         if stats_before.get('tier_counts'):
             for tier, count in stats_before['tier_counts'].items():
                 print(f"   {tier.capitalize()}: {count} chunks")
         
+        if stats_before.get('index_stats'):
+            print(f"\n🔎 Search backend: {stats_before['backend']}")
+            for tier, index_stats in stats_before['index_stats'].items():
+                print(
+                    f"   {tier.capitalize()}: {index_stats['index_type']} "
+                    f"({index_stats['ntotal']} vectors, {index_stats['quantization']}, "
+                    f"{index_stats['bytes_per_vector']} B/vector, "
+                    f"device={index_stats['device']}, GPUs={index_stats['num_gpus']})"
+                )
+        
         metadata_stats = stats_before.get('metadata_stats', {})
         expired_count = metadata_stats.get('expired_documents', 0)
         print(f"\n⏰ Expired documents: {expired_count}")
@@ -47,14 +69,14 @@ async def main():
         
         # Perform cleanup
         print("\n🧹 Cleaning up expired documents...")
-        result = await rag_server.cleanup_expired()
+        result = await cleanup_expired()
         
         print(f"\n✅ Cleanup complete:")
         print(f"   Expired documents removed: {result['expired_count']}")
         print(f"   Chunks deleted: {result['chunks_deleted']}")
         
         # Get stats after cleanup
-        stats_after = rag_server.get_stats()
+        stats_after = await get_stats()
         print(f"\n📊 After cleanup:")
         print(f"   Total chunks: {stats_after['total_chunks']}")
         if stats_after.get('tier_counts'):
@@ -20,29 +20,6 @@ async def debug_auth():
     print(f"API Key: {api_key[:30]}...{api_key[-10:] if api_key else 'MISSING'}")
     print(f"Base URL: {base_url}\n")
     
-    # Test 1: List models (Ollama-native endpoint, no /v1 prefix)
-    print("=" * 60)
-    print("TEST 1: List Models (GET /v1/models)")
-    print("=" * 60)
-    try:
-        async with httpx.AsyncClient(verify=False, timeout=10.0) as client:
-            r = await client.get(
-                f"{base_url}/v1/models",
-                headers={"Authorization": f"Bearer {api_key}"}
-            )
-            print(f"Status: {r.status_code}")
-            if r.status_code == 200:
-                print("✅ Models endpoint works")
-            else:
-                print(f"Response: {r.text[:300]}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    # Test 2: Chat completions (OpenAI-compatible endpoint with /v1 prefix)
-    print("\n" + "=" * 60)
-    print("TEST 2: Chat Completions (POST /v1/chat/completions)")
-    print("=" * 60)
-    
     url = f"{base_url}/v1/chat/completions"
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -54,27 +31,52 @@ async def debug_auth():
         "max_tokens": 5
     }
     
+    # One client for both probes (single TLS handshake), and the two
+    # independent requests run concurrently
+    async with httpx.AsyncClient(verify=False, timeout=10.0, headers=headers) as client:
+        models_r, chat_r = await asyncio.gather(
+            client.get(f"{base_url}/v1/models"),
+            client.post(url, json=payload),
+            return_exceptions=True
+        )
+    
+    # Test 1: List models (Ollama-native endpoint, no /v1 prefix)
+    print("=" * 60)
+    print("TEST 1: List Models (GET /v1/models)")
+    print("=" * 60)
+    if isinstance(models_r, Exception):
+        print(f"❌ Error: {models_r}")
+    else:
+        print(f"Status: {models_r.status_code}")
+        if models_r.status_code == 200:
+            print("✅ Models endpoint works")
+        else:
+            print(f"Response: {models_r.text[:300]}")
+    
+    # Test 2: Chat completions (OpenAI-compatible endpoint with /v1 prefix)
+    print("\n" + "=" * 60)
+    print("TEST 2: Chat Completions (POST /v1/chat/completions)")
+    print("=" * 60)
+    
     print(f"URL: {url}")
     print(f"Headers: {headers}")
     print(f"Payload: {payload}\n")
     
-    try:
-        async with httpx.AsyncClient(verify=False, timeout=10.0) as client:
-            r = await client.post(url, json=payload, headers=headers)
-            print(f"Status: {r.status_code}")
-            print(f"Response: {r.text[:500]}")
-            
-            if r.status_code == 200:
-                result = r.json()
-                print(f"\n✅ Success! Response: {result.get('choices', [{}])[0].get('message', {}).get('content', '')}")
-            elif r.status_code == 401:
-                print("\n❌ 401 Unauthorized")
-                print("Possible issues:")
-                print("  - API key format might be wrong")
-                print("  - API key might not have access to this endpoint")
-                print("  - Authentication header format might be incorrect")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+    if isinstance(chat_r, Exception):
+        print(f"❌ Error: {chat_r}")
+    else:
+        print(f"Status: {chat_r.status_code}")
+        print(f"Response: {chat_r.text[:500]}")
+        
+        if chat_r.status_code == 200:
+            result = chat_r.json()
+            print(f"\n✅ Success! Response: {result.get('choices', [{}])[0].get('message', {}).get('content', '')}")
+        elif chat_r.status_code == 401:
+            print("\n❌ 401 Unauthorized")
+            print("Possible issues:")
+            print("  - API key format might be wrong")
+            print("  - API key might not have access to this endpoint")
+            print("  - Authentication header format might be incorrect")
 
 if __name__ == "__main__":
     asyncio.run(debug_auth())
@@ -4,6 +4,7 @@
 import asyncio
 import sys
 import tempfile
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -11,66 +12,81 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.memory.rag_server import RAGServer
 from src.memory.document_ingester import DocumentIngester
 
+
+class Console:
+    """Buffers output and writes it to stdout in one call per flush."""
+    
+    def __init__(self):
+        self._buf = []
+    
+    def p(self, text: str = "") -> None:
+        """Queue a line of output."""
+        self._buf.append(text + "\n")
+    
+    def flush(self) -> None:
+        """Write queued output (call before any step that might hang)."""
+        sys.stdout.write("".join(self._buf))
+        self._buf.clear()
+        sys.stdout.flush()
+    
+    def error(self, text: str) -> None:
+        """Write an error line followed by the current traceback."""
+        import traceback
+        self.p(text)
+        self.flush()
+        traceback.print_exc()
+
+
 async def test():
-    print("Step 1: Creating test file...")
+    c = Console()
+    c.p("Step 1: Creating test file...")
     temp_dir = tempfile.mkdtemp()
     test_file = Path(temp_dir) / "test.md"
     test_file.write_text("# Test\nThis is a test document.")
-    print(f"   Created: {test_file}")
-    sys.stdout.flush()
+    c.p(f"   Created: {test_file}")
     
-    print("\nStep 2: Initializing RAG server...")
-    sys.stdout.flush()
+    c.p("\nStep 2: Initializing RAG server...")
+    c.flush()
     rag_server = RAGServer(
         persist_directory=temp_dir,
         collection_name="debug_test"
     )
-    print("   RAG server initialized")
-    sys.stdout.flush()
+    c.p("   RAG server initialized")
     
-    print("\nStep 3: Testing DocumentIngester directly...")
-    sys.stdout.flush()
+    c.p("\nStep 3: Testing DocumentIngester directly...")
+    c.flush()
     ingester = DocumentIngester()
-    print("   Ingester created")
-    sys.stdout.flush()
+    c.p("   Ingester created")
     
-    print("\nStep 4: Calling ingest_file...")
-    sys.stdout.flush()
+    c.p("\nStep 4: Calling ingest_file...")
+    c.flush()
     try:
         chunks, metadatas = await ingester.ingest_file(str(test_file), chunk_size=150, chunk_overlap=30)
-        print(f"   Success! Got {len(chunks)} chunks")
-        sys.stdout.flush()
+        c.p(f"   Success! Got {len(chunks)} chunks")
     except Exception as e:
-        print(f"   Error in ingest_file: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.stdout.flush()
+        c.error(f"   Error in ingest_file: {e}")
         return
     
-    print("\nStep 5: Testing embed_chunks...")
-    sys.stdout.flush()
+    c.p("\nStep 5: Testing embed_chunks...")
+    c.flush()
     try:
+        start = time.time()
         embeddings = await ingester.embed_chunks(chunks)
-        print(f"   Success! Got {len(embeddings)} embeddings")
-        sys.stdout.flush()
+        elapsed = time.time() - start
+        rate = len(embeddings) / elapsed if elapsed > 0 else 0
+        c.p(f"   Success! Got {len(embeddings)} embeddings in {elapsed:.2f}s ({rate:.1f} embeddings/sec)")
     except Exception as e:
-        print(f"   Error in embed_chunks: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.stdout.flush()
+        c.error(f"   Error in embed_chunks: {e}")
         return
     
-    print("\nStep 6: Calling rag_server.ingest_documents...")
-    sys.stdout.flush()
+    c.p("\nStep 6: Calling rag_server.ingest_documents...")
+    c.flush()
     try:
         result = await rag_server.ingest_documents([str(test_file)], chunk_size=150, chunk_overlap=30)
-        print(f"   Success! Result: {result}")
-        sys.stdout.flush()
+        c.p(f"   Success! Result: {result}")
     except Exception as e:
-        print(f"   Error in ingest_documents: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.stdout.flush()
+        c.error(f"   Error in ingest_documents: {e}")
+    c.flush()
 
 if __name__ == "__main__":
     asyncio.run(test())
@@ -2,10 +2,15 @@
 """Diagnostic script to test Gemini API key and connection."""
 
 import asyncio
-import httpx
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.common.httpclient import get_shared_client
+
 load_dotenv()
 
 async def test_gemini_api():
@@ -38,41 +43,56 @@ async def test_gemini_api():
         }
     }
     
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        for model in models_to_test:
-            url = f"{base_url}/models/{model}:generateContent"
-            params = {"key": api_key}
-            
+    params = {"key": api_key}
+    headers = {"Content-Type": "application/json"}
+    client = get_shared_client()
+    # Fire all probes at once; wall time is the slowest probe, not the sum
+    tasks = [
+        asyncio.create_task(
+            client.post(
+                f"{base_url}/models/{model}:generateContent",
+                json=payload,
+                params=params,
+                headers=headers,
+                timeout=10.0
+            )
+        )
+        for model in models_to_test
+    ]
+    
+    try:
+        # Report in priority order so the first working model wins
+        for model, task in zip(models_to_test, tasks):
             try:
-                response = await client.post(
-                    url,
-                    json=payload,
-                    params=params,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    print(f"✅ {model}: SUCCESS")
-                    if "candidates" in result:
-                        text = result["candidates"][0]["content"]["parts"][0]["text"]
-                        print(f"   Response: {text[:50]}...")
-                    return model  # Return the first working model
-                elif response.status_code == 401:
-                    print(f"❌ {model}: UNAUTHORIZED (Invalid API key)")
-                    print(f"   Response: {response.text[:200]}")
-                    return None
-                elif response.status_code == 404:
-                    print(f"⚠️  {model}: NOT FOUND (Model doesn't exist or wrong endpoint)")
-                elif response.status_code == 403:
-                    print(f"❌ {model}: FORBIDDEN (API key doesn't have access)")
-                    print(f"   Response: {response.text[:200]}")
-                else:
-                    print(f"❌ {model}: ERROR {response.status_code}")
-                    print(f"   Response: {response.text[:200]}")
-                    
+                response = await task
             except Exception as e:
                 print(f"❌ {model}: EXCEPTION - {e}")
+                continue
+            
+            if response.status_code == 200:
+                result = response.json()
+                print(f"✅ {model}: SUCCESS")
+                if "candidates" in result:
+                    text = result["candidates"][0]["content"]["parts"][0]["text"]
+                    print(f"   Response: {text[:50]}...")
+                return model  # Return the first working model
+            elif response.status_code == 401:
+                # Auth is global to the key, remaining probes can't succeed
+                print(f"❌ {model}: UNAUTHORIZED (Invalid API key)")
+                print(f"   Response: {response.text[:200]}")
+                return None
+            elif response.status_code == 404:
+                print(f"⚠️  {model}: NOT FOUND (Model doesn't exist or wrong endpoint)")
+            elif response.status_code == 403:
+                print(f"❌ {model}: FORBIDDEN (API key doesn't have access)")
+                print(f"   Response: {response.text[:200]}")
+            else:
+                print(f"❌ {model}: ERROR {response.status_code}")
+                print(f"   Response: {response.text[:200]}")
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     print("\n❌ None of the model names worked.")
     print("\n💡 Troubleshooting:")
@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.memory.rag_server import RAGServer
+from src.memory.document_ingester import DocumentIngester
 
 async def diagnose():
     print("="*60)
@@ -28,15 +29,31 @@ async def diagnose():
         start = time.time()
         rag_server = RAGServer(
             persist_directory=temp_dir,
-            collection_name="diagnose_test"
+            collection_name="diagnose_test",
+            embedding_device="auto"  # MPS/CUDA when available
         )
         print(f"   ✅ Server created in {time.time() - start:.2f}s")
         
         print(f"\n2. Testing with chunk_size=150, chunk_overlap=30...")
         print(f"   Document size: {len(content)} chars")
         
+        # Embed chunks on their own first so a hang can be pinned to
+        # embedding vs. ChromaDB, and throughput is visible
+        print(f"\n3. Embedding chunks directly...")
+        ingester = DocumentIngester()
+        chunks, _ = await ingester.ingest_file(str(test_file), chunk_size=150, chunk_overlap=30)
+        start = time.time()
+        try:
+            embeddings = await asyncio.wait_for(ingester.embed_chunks(chunks), timeout=300)
+            elapsed = time.time() - start
+            rate = len(embeddings) / elapsed if elapsed > 0 else 0
+            print(f"   ✅ {len(embeddings)} embeddings in {elapsed:.2f}s ({rate:.1f} embeddings/sec)")
+        except asyncio.TimeoutError:
+            print(f"   ❌ Embedding timed out after {time.time() - start:.2f}s")
+            return
+        
         # Test ingestion with timeout at each step
-        print(f"\n3. Starting ingestion (5 min timeout)...")
+        print(f"\n4. Starting ingestion (5 min timeout)...")
         start = time.time()
         
         try:
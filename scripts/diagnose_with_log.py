@@ -7,6 +7,8 @@ import time
 import tempfile
 import shutil
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
 
@@ -17,18 +19,26 @@ log_dir = Path(__file__).parent.parent / "logs"
 log_dir.mkdir(exist_ok=True)
 log_file = log_dir / f"rag_diagnostic_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Log calls only enqueue records; a listener thread formats them and does the
+# file/console writes, so DEBUG tracing doesn't block the event loop on disk I/O
+log_queue = queue.Queue(-1)
+file_handler = logging.FileHandler(log_file)
+stream_handler = logging.StreamHandler(sys.stdout)
+for handler in (file_handler, stream_handler):
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+log_listener.start()
+
+queue_handler = logging.handlers.QueueHandler(log_queue)
+# Leave the real formatting to the listener's handlers
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+logging.basicConfig(level=logging.DEBUG, handlers=[queue_handler])
 
 logger = logging.getLogger(__name__)
 
 from src.memory.rag_server import RAGServer
+from src.memory.document_ingester import chunk_starts
 
 async def diagnose():
     logger.info("="*60)
@@ -79,8 +89,8 @@ This document provides comprehensive technical documentation."""
         # Calculate expected chunks
         chunk_size = 150
         chunk_overlap = 30
-        expected_chunks = max(1, (len(content) - chunk_overlap) // (chunk_size - chunk_overlap) + 1)
-        logger.info(f"Expected chunks (chunk_size={chunk_size}, overlap={chunk_overlap}): ~{expected_chunks}")
+        expected_chunks = len(chunk_starts(len(content), chunk_size, chunk_overlap))
+        logger.info(f"Expected chunks (chunk_size={chunk_size}, overlap={chunk_overlap}): {expected_chunks}")
         
         # Initialize RAG server
         logger.info("\n" + "="*60)
@@ -91,7 +101,9 @@ This document provides comprehensive technical documentation."""
         try:
             rag_server = RAGServer(
                 persist_directory=temp_dir,
-                collection_name="diagnostic_test"
+                collection_name="diagnostic_test",
+                embedding_device="auto",  # MPS/CUDA when available
+                ephemeral=True  # In-memory ChromaDB, nothing to persist
             )
             elapsed = time.time() - start
             logger.info(f"✅ RAG server initialized in {elapsed:.2f}s")
@@ -149,5 +161,9 @@ This document provides comprehensive technical documentation."""
 
 if __name__ == "__main__":
     print(f"Running diagnostic - log will be saved to: logs/rag_diagnostic_*.log")
-    asyncio.run(diagnose())
+    try:
+        asyncio.run(diagnose())
+    finally:
+        # Flush queued records before exit
+        log_listener.stop()
 
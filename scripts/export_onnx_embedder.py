@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Export all-MiniLM-L6-v2 to ONNX and quantize it to INT8.
+
+Creates the model directory used by RAGServer(embedder_backend="onnx-int8").
+Dynamic INT8 quantization roughly halves embedding time on CPU (int8 GEMM
+kernels, 4x smaller weights) with negligible retrieval quality loss.
+
+Requires (export only, not at runtime):
+    pip install optimum[exporters] onnxruntime
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.memory.onnx_embedder import DEFAULT_MODEL_DIR, QUANTIZED_MODEL_FILE
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def export_quantized_model(output: Path = DEFAULT_MODEL_DIR) -> Path:
+    """
+    Export the model to ONNX and write its INT8-quantized copy.
+
+    Args:
+        output: Model directory
+
+    Returns:
+        Path to the quantized model
+
+    Raises:
+        ImportError: If optimum or onnxruntime isn't installed
+    """
+    from optimum.exporters.onnx import main_export
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    output = Path(output)
+    print(f"📥 Exporting {MODEL_NAME} to ONNX: {output}")
+    main_export(MODEL_NAME, output=output, task="feature-extraction")
+
+    print("🔧 Quantizing weights to INT8...")
+    quantize_dynamic(
+        str(output / "model.onnx"),
+        str(output / QUANTIZED_MODEL_FILE),
+        weight_type=QuantType.QInt8
+    )
+
+    return output / QUANTIZED_MODEL_FILE
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export an INT8 ONNX embedding model")
+    parser.add_argument(
+        "--output",
+        default=str(DEFAULT_MODEL_DIR),
+        help=f"Output directory (default: {DEFAULT_MODEL_DIR})"
+    )
+    args = parser.parse_args()
+
+    try:
+        model_path = export_quantized_model(Path(args.output))
+    except ImportError:
+        print("❌ Error: export requires optimum and onnxruntime")
+        print("   Install with: pip install optimum[exporters] onnxruntime")
+        sys.exit(1)
+
+    print(f"✅ Done: {model_path}")
+    print("   Use with: python scripts/ingest_documents.py --embedder onnx-int8 ...")
+    print("   or set MINI_JARVIS_EMBEDDER=onnx-int8 for every RAGServer")
+
+
+if __name__ == "__main__":
+    main()
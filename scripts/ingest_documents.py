@@ -55,6 +55,46 @@ async def main():
         default=None,
         help="Time to live in seconds (only for ephemeral tier, default: permanent)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=512,
+        help="Chunks per ChromaDB add() call (default: 512)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for embedding (one model copy each) and PDF parsing (default: 1)"
+    )
+    parser.add_argument(
+        "--embedder",
+        choices=["sentence-transformers", "onnx-int8"],
+        default=None,
+        help="Embedding backend (default: $MINI_JARVIS_EMBEDDER or sentence-transformers; "
+             "onnx-int8 needs scripts/export_onnx_embedder.py first; "
+             "queries must use the same backend)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["chroma", "faiss", "flat"],
+        default="chroma",
+        help="Vector search backend (ChromaDB stays the document store either way)"
+    )
+    parser.add_argument(
+        "--index-type",
+        choices=["auto", "hnsw"],
+        default="auto",
+        help="FAISS index for the faiss backend: exact flat or HNSW graph "
+             "below the IVF-PQ training threshold (default: auto)"
+    )
+    parser.add_argument(
+        "--flat-dtype",
+        choices=["float32", "float16", "int8"],
+        default="float32",
+        help="Matrix precision for the flat backend (float16 halves memory, int8 "
+             "quarters it; default: float32)"
+    )
     parser.add_argument(
         "--no-tiering",
         action="store_true",
@@ -66,7 +106,11 @@ async def main():
     # Initialize RAG server with tiering enabled by default
     rag_server = RAGServer(
         persist_directory=args.memory_dir,
-        enable_tiering=not args.no_tiering
+        enable_tiering=not args.no_tiering,
+        embedder_backend=args.embedder,
+        backend=args.backend,
+        index_type=args.index_type,
+        flat_dtype=args.flat_dtype
     )
     
     # Check files exist
@@ -101,7 +145,9 @@ async def main():
         chunk_size=args.chunk_size,
         chunk_overlap=args.chunk_overlap,
         tier=args.tier if not args.no_tiering else "reference",
-        ttl_seconds=args.ttl if args.tier == "ephemeral" else None
+        ttl_seconds=args.ttl if args.tier == "ephemeral" else None,
+        batch_size=args.batch_size,
+        jobs=args.jobs
     )
     
     if result["success"]:
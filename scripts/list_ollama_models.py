@@ -2,7 +2,6 @@
 """List available models from Ollama Cloud API."""
 
 import asyncio
-import httpx
 import os
 import sys
 from pathlib import Path
@@ -14,6 +13,8 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.common.httpclient import get_shared_client, close_shared_client
+
 async def list_models():
     api_key = os.getenv("OLLAMA_CLOUD_API_KEY")
     base_url = os.getenv("OLLAMA_CLOUD_BASE_URL", "https://api.ollama.cloud/v1")
@@ -29,23 +30,29 @@ async def list_models():
     }
     
     try:
-        async with httpx.AsyncClient(verify=False, timeout=10.0) as client:
-            response = await client.get(url, headers=headers)
-            if response.status_code == 200:
-                result = response.json()
-                models = result.get('data', [])
-                print(f"✅ Found {len(models)} available models:\n")
-                for model in models:
-                    model_id = model.get('id', 'unknown')
-                    print(f"  - {model_id}")
-                return models
-            else:
-                print(f"❌ Error {response.status_code}: {response.text}")
-                return None
+        client = get_shared_client()
+        response = await client.get(url, headers=headers, timeout=10.0)
+        if response.status_code == 200:
+            result = response.json()
+            models = result.get('data', [])
+            print(f"✅ Found {len(models)} available models:\n")
+            for model in models:
+                model_id = model.get('id', 'unknown')
+                print(f"  - {model_id}")
+            return models
+        else:
+            print(f"❌ Error {response.status_code}: {response.text}")
+            return None
     except Exception as e:
         print(f"❌ Error: {e}")
         return None
 
+async def main():
+    try:
+        return await list_models()
+    finally:
+        await close_shared_client()
+
 if __name__ == "__main__":
-    asyncio.run(list_models())
+    asyncio.run(main())
 
@@ -47,7 +47,11 @@ These technologies are transforming industries from healthcare to transportation
         print("\n🔧 Step 2: Initializing RAG server...")
         rag_server = RAGServer(
             persist_directory=temp_dir,
-            collection_name="manual_test_1"
+            collection_name="manual_test_1",
+            embedding_device="auto",  # MPS/CUDA when available
+            ephemeral=True,  # In-memory ChromaDB, nothing to persist
+            backend="flat",  # Brute force beats HNSW for a handful of chunks
+            flat_dtype="float16"  # Half the bytes per vector scanned
         )
         print("   ✅ RAG server initialized")
         
@@ -88,7 +88,9 @@ This document provides comprehensive technical documentation."""
         print("\n🔧 Step 2: Initializing RAG server...")
         rag_server = RAGServer(
             persist_directory=temp_dir,
-            collection_name="manual_test_2"
+            collection_name="manual_test_2",
+            embedding_device="auto",  # MPS/CUDA when available
+            ephemeral=True  # In-memory ChromaDB, nothing to persist
         )
         print("   ✅ RAG server initialized")
         
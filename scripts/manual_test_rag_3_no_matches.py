@@ -41,7 +41,11 @@ The recipes include spaghetti carbonara and margherita pizza."""
         print("\n🔧 Step 2: Initializing RAG server...")
         rag_server = RAGServer(
             persist_directory=temp_dir,
-            collection_name="manual_test_3"
+            collection_name="manual_test_3",
+            embedding_device="auto",  # MPS/CUDA when available
+            ephemeral=True,  # In-memory ChromaDB, nothing to persist
+            backend="flat",  # Brute force beats HNSW for a handful of chunks
+            flat_dtype="float16"  # Half the bytes per vector scanned
         )
         print("   ✅ RAG server initialized")
         
@@ -81,7 +85,11 @@ The recipes include spaghetti carbonara and margherita pizza."""
         print("\n🔍 Step 6: Testing query on empty collection...")
         empty_server = RAGServer(
             persist_directory=temp_dir,
-            collection_name="manual_test_3_empty"
+            collection_name="manual_test_3_empty",
+            embedding_device="auto",  # MPS/CUDA when available
+            ephemeral=True,  # In-memory ChromaDB, nothing to persist
+            backend="flat",  # Brute force beats HNSW for a handful of chunks
+            flat_dtype="float16"  # Half the bytes per vector scanned
         )
         empty_chunks = await empty_server.retrieve_context("any query", top_k=5)
         
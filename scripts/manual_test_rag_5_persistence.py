@@ -12,19 +12,29 @@ import sys
 import tempfile
 import shutil
 from pathlib import Path
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.memory.rag_server import RAGServer
 
-
-async def main():
+async def main(persist_directory: Optional[str] = None, collection_name: str = "manual_test_5"):
+    """
+    Run Test 5.
+    
+    Args:
+        persist_directory: Existing directory to work in (e.g. one shared by the
+                           test runner); default: a fresh temp dir, removed after
+        collection_name: ChromaDB collection to use
+    """
+    # Deferred: pulls in chromadb and the embedding stack
+    from src.memory.rag_server import RAGServer
+    
     print("="*60)
     print("Manual Test 5: Reboot → Persistence Check")
     print("="*60)
     
-    temp_dir = tempfile.mkdtemp()
+    temp_dir = persist_directory or tempfile.mkdtemp()
     try:
         # Create test document
         print("\n📄 Step 1: Creating test document...")
@@ -43,7 +53,8 @@ The system must maintain data integrity and accessibility."""
         print("\n🔧 Step 2: Server Instance 1 - Ingesting document...")
         server1 = RAGServer(
             persist_directory=temp_dir,
-            collection_name="manual_test_5"
+            collection_name=collection_name,
+            embedding_device="auto"  # MPS/CUDA when available
         )
         
         result = await server1.ingest_documents([str(test_file)])
@@ -64,16 +75,15 @@ The system must maintain data integrity and accessibility."""
         
         # Simulate "reboot" - close server1, create new server2 with same directory
         print("\n🔄 Step 4: Simulating reboot (closing server, creating new instance)...")
-        del server1
-        
-        # Wait a moment to ensure cleanup
-        await asyncio.sleep(0.5)
+        embedding_model = server1.retriever._embedding_model
+        await server1.close()
         
         # Second server instance - should see same data
         print("\n🔧 Step 5: Server Instance 2 - Opening same collection...")
         server2 = RAGServer(
             persist_directory=temp_dir,
-            collection_name="manual_test_5"
+            collection_name=collection_name,
+            embedding_device="auto"  # MPS/CUDA when available
         )
         
         stats2 = server2.get_stats()
@@ -94,13 +104,15 @@ The system must maintain data integrity and accessibility."""
             return
         
         print(f"   ✅ Retrieved {len(chunks_after)} chunks")
+        # The embedding model is cached per process, so the "rebooted"
+        # server reuses it instead of loading it again
+        if server2.retriever._embedding_model is embedding_model:
+            print(f"   ✅ Embedding model reused from instance 1 (no reload)")
+        else:
+            print(f"   ⚠️  Embedding model was loaded again for instance 2")
         
         # Verify content is correct
-        found_persistence = False
-        for chunk in chunks_after:
-            if "persistence" in chunk["text"].lower():
-                found_persistence = True
-                break
+        found_persistence = any("persistence" in chunk["text"].lower() for chunk in chunks_after)
         
         if not found_persistence:
             print(f"   ⚠️  Retrieved chunks may not match expected content")
@@ -119,7 +131,8 @@ The system must maintain data integrity and accessibility."""
         import traceback
         traceback.print_exc()
     finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        if persist_directory is None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
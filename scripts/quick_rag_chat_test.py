@@ -1,28 +1,98 @@
 #!/usr/bin/env python3
-"""Quick test of chat with RAG - single query."""
+"""Quick test of chat with RAG - single query, or a REPL with --repl."""
 
+import argparse
 import asyncio
 import sys
 import logging
+import threading
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.brain.orchestrator import Orchestrator
-from src.memory.rag_server import RAGServer
-
 logging.basicConfig(level=logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
+# REPL: queries arriving together (e.g. pasted lines) are answered concurrently
+REPL_MAX_BATCH = 4
+REPL_MAX_WAIT = 0.1  # seconds to wait for more queries after the first
+
+
+def start_stdin_reader(queue: asyncio.Queue) -> None:
+    """Feed stripped non-empty stdin lines into queue from a thread; None marks EOF."""
+    loop = asyncio.get_running_loop()
+    
+    def reader():
+        for line in sys.stdin:
+            if line.strip():
+                loop.call_soon_threadsafe(queue.put_nowait, line.strip())
+        loop.call_soon_threadsafe(queue.put_nowait, None)
+    
+    # Daemon thread so a pending read never blocks interpreter exit
+    threading.Thread(target=reader, daemon=True).start()
+
+
+async def collect_queries(queue: asyncio.Queue) -> Tuple[List[str], bool]:
+    """Wait for one query, then up to REPL_MAX_WAIT for more; returns (queries, eof)."""
+    first = await queue.get()
+    if first is None:
+        return [], True
+    queries = [first]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + REPL_MAX_WAIT
+    while len(queries) < REPL_MAX_BATCH:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            query = await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            break
+        if query is None:
+            return queries, True
+        queries.append(query)
+    return queries, False
+
+
+def print_response(result) -> None:
+    """Print one think() result (or the exception it raised)."""
+    if isinstance(result, Exception):
+        print(f"❌ Error: {result}")
+        return
+    response, target, tool_calls = result
+    brain = "☁️ Cloud" if target.value == "cloud" else "🏠 Local"
+    print(f"\n{brain} Response:")
+    print("-" * 70)
+    print(response)
+    print("-" * 70)
+    
+    if tool_calls:
+        print(f"\n🔧 Tools used: {len(tool_calls)}")
+
 
-async def quick_test():
-    """Quick test with one query."""
+async def quick_test(repl: bool = False):
+    """
+    Quick test with one query.
+    
+    Args:
+        repl: Keep the orchestrator (Ollama client, RAG, embedding model)
+              alive and answer queries read from stdin until EOF
+    """
+    # Deferred: pulls in chromadb and the embedding stack
+    from src.brain.orchestrator import Orchestrator
+    from src.memory.rag_server import RAGServer
+    
     print("="*70)
     print("Quick RAG Chat Test")
     print("="*70)
     
     # Initialize RAG
-    rag_server = RAGServer(enable_tiering=True)
+    rag_server = RAGServer(
+        enable_tiering=True,
+        enable_dynamic_batching=True,  # Concurrent queries share one encode()
+        enable_semantic_cache=True  # Repeated queries skip the vector search
+    )
     stats = rag_server.get_stats()
     print(f"\n📚 RAG Memory: {stats['total_chunks']} chunks loaded")
     
@@ -34,21 +104,39 @@ async def quick_test():
             print("❌ Ollama not running")
             return
         
-        print(f"\n❓ Query: {query}")
-        print("🤔 Processing...")
-        
-        response, target, tool_calls = await orchestrator.think(query, use_rag_context=True)
-        
-        brain = "☁️ Cloud" if target.value == "cloud" else "🏠 Local"
-        print(f"\n{brain} Response:")
-        print("-" * 70)
-        print(response)
-        print("-" * 70)
+        if not repl:
+            print(f"\n❓ Query: {query}")
+            print("🤔 Processing...")
+            
+            result = await orchestrator.think(query, use_rag_context=True)
+            print_response(result)
+            return
         
-        if tool_calls:
-            print(f"\n🔧 Tools used: {len(tool_calls)}")
+        print("\nEnter queries, one per line (Ctrl-D to quit)")
+        queue: asyncio.Queue = asyncio.Queue()
+        start_stdin_reader(queue)
+        eof = False
+        while not eof:
+            queries, eof = await collect_queries(queue)
+            if not queries:
+                break
+            print(f"🤔 Processing {len(queries)} quer{'y' if len(queries) == 1 else 'ies'}...")
+            results = await asyncio.gather(
+                *(orchestrator.think(q, use_rag_context=True) for q in queries),
+                return_exceptions=True
+            )
+            for q, result in zip(queries, results):
+                print(f"\n❓ Query: {q}")
+                print_response(result)
 
 
 if __name__ == "__main__":
-    asyncio.run(quick_test())
-
+    parser = argparse.ArgumentParser(description="Quick test of chat with RAG")
+    parser.add_argument(
+        "--repl",
+        action="store_true",
+        help="Keep the orchestrator warm and answer queries from stdin until EOF"
+    )
+    args = parser.parse_args()
+    
+    asyncio.run(quick_test(repl=args.repl))
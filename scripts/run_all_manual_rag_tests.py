@@ -3,48 +3,86 @@
 
 This script runs all 5 manual test scenarios one by one.
 Each test can be run individually or all together.
+
+All tests run in this process, so torch, sentence-transformers and
+ChromaDB are imported once and the embedding model is loaded once
+(RAGServers share it), instead of once per test subprocess.
 """
 
+import argparse
 import asyncio
+import importlib.util
+import shutil
 import sys
-import subprocess
+import tempfile
+import time
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Test groups for --parallel: tests in a group share no state (3 and 4
+# use different directories and collections), so they can overlap
+PARALLEL_GROUPS = [[1], [2], [3, 4], [5]]
+MAX_CONCURRENT_TESTS = 2  # Each test holds a ChromaDB client and its data in RAM
+# Tests whose main() takes persist_directory: they share one temp directory
+# (distinct files and collections) instead of each creating and removing one
+SHARED_DIR_TESTS = {4, 5}
+
+
+def load_test_module(script_path: Path):
+    """Import a manual test script as a module (scripts/ isn't a package)."""
+    spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 
-async def run_test(test_number: int, test_name: str, script_path: str):
-    """Run a single manual test."""
+async def run_test(test_number: int, test_name: str, script_path: str, **kwargs):
+    """Run a single manual test in this process (kwargs go to its main())."""
     print("\n" + "="*70)
     print(f"Running Test {test_number}: {test_name}")
     print("="*70)
     
+    if not Path(script_path).exists():
+        print(f"\n❌ Script not found: {script_path}")
+        return False
+    
+    start_time = time.perf_counter()
     try:
-        result = subprocess.run(
-            [sys.executable, script_path],
-            capture_output=False,
-            text=True,
+        module = load_test_module(Path(script_path))
+        await asyncio.wait_for(
+            module.main(**kwargs),
             timeout=120  # 2 minute timeout per test
         )
-        
-        if result.returncode == 0:
-            print(f"\n✅ Test {test_number} completed successfully")
-            return True
-        else:
-            print(f"\n❌ Test {test_number} failed with exit code {result.returncode}")
-            return False
+        elapsed = time.perf_counter() - start_time
+        print(f"\n✅ Test {test_number} completed successfully ({elapsed:.1f}s)")
+        return True
             
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         print(f"\n⏱️  Test {test_number} timed out after 2 minutes")
         return False
+    except SystemExit as e:
+        # A test script exits at import when an optional dependency is missing
+        elapsed = time.perf_counter() - start_time
+        if e.code in (0, None):
+            print(f"\n✅ Test {test_number} completed successfully ({elapsed:.1f}s)")
+            return True
+        print(f"\n❌ Test {test_number} failed with exit code {e.code} ({elapsed:.1f}s)")
+        return False
     except Exception as e:
-        print(f"\n❌ Test {test_number} error: {e}")
+        elapsed = time.perf_counter() - start_time
+        print(f"\n❌ Test {test_number} error: {e} ({elapsed:.1f}s)")
         return False
 
 
-async def main():
-    """Run all manual tests."""
+async def main(parallel: bool = False):
+    """
+    Run all manual tests.
+    
+    Args:
+        parallel: Run independent tests (PARALLEL_GROUPS) concurrently
+    """
     print("="*70)
     print("Mini-JARVIS RAG Pipeline - Manual Testing Suite")
     print("="*70)
@@ -69,22 +107,33 @@ async def main():
         (5, "Reboot → Persistence Check", scripts_dir / "manual_test_rag_5_persistence.py"),
     ]
     
+    tests_by_number = {test[0]: test for test in tests}
+    groups = PARALLEL_GROUPS if parallel else [[test_num] for test_num, _, _ in tests]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
+    
+    shared_dir = tempfile.mkdtemp()
+    
+    async def run_limited(test_num):
+        _, test_name, script_path = tests_by_number[test_num]
+        kwargs = {"persist_directory": shared_dir} if test_num in SHARED_DIR_TESTS else {}
+        async with semaphore:
+            return await run_test(test_num, test_name, str(script_path), **kwargs)
+    
     results = []
-    for test_num, test_name, script_path in tests:
-        if not script_path.exists():
-            print(f"\n❌ Script not found: {script_path}")
-            results.append(False)
-            continue
-        
-        success = await run_test(test_num, test_name, str(script_path))
-        results.append(success)
-        
-        # Ask if user wants to continue after each test
-        if test_num < len(tests):
-            response = input(f"\nContinue to next test? (y/n): ").strip().lower()
-            if response != 'y':
-                print("Stopped by user.")
-                break
+    suite_start = time.perf_counter()
+    try:
+        for group_index, group in enumerate(groups):
+            # Groups run in order; tests within a group (--parallel) overlap
+            results.extend(await asyncio.gather(*(run_limited(test_num) for test_num in group)))
+            
+            # Ask if user wants to continue after each test (group)
+            if group_index < len(groups) - 1:
+                response = input(f"\nContinue to next test? (y/n): ").strip().lower()
+                if response != 'y':
+                    print("Stopped by user.")
+                    break
+    finally:
+        shutil.rmtree(shared_dir, ignore_errors=True)
     
     # Summary
     print("\n" + "="*70)
@@ -98,12 +147,21 @@ async def main():
         print(f"{status} - Test {test_num}: {test_name}")
     
     print(f"\nTotal: {passed}/{total} tests passed")
+    print(f"Wall time: {time.perf_counter() - suite_start:.1f}s (includes time at prompts)")
     print("="*70)
     
     return 0 if passed == total else 1
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run all manual RAG tests")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run independent tests (3 and 4) concurrently; their output interleaves"
+    )
+    args = parser.parse_args()
+    
+    exit_code = asyncio.run(main(parallel=args.parallel))
     sys.exit(exit_code)
 
@@ -5,31 +5,45 @@ Usage:
     python scripts/run_with_logging.py scripts/manual_test_rag_2_pdf_chunking.py
 """
 
+import importlib.util
 import sys
 import logging
+import queue
 import traceback
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
+# Validate arguments before creating a log file or importing anything heavy
+if len(sys.argv) < 2:
+    print("Usage: python scripts/run_with_logging.py <script_to_run> [args...]")
+    sys.exit(1)
+if not Path(sys.argv[1]).is_file():
+    print(f"Script not found: {sys.argv[1]}")
+    sys.exit(1)
+
 # Setup logging to both file and console
 log_file = Path(__file__).parent.parent / "logs" / f"rag_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
 log_file.parent.mkdir(exist_ok=True)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging: records are queued and written by a background thread,
+# so the script doesn't block on file/console I/O for every DEBUG line
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+file_handler = logging.FileHandler(log_file)
+file_handler.setLevel(logging.DEBUG)
+file_handler.setFormatter(formatter)
+console_handler = logging.StreamHandler(sys.stdout)
+console_handler.setLevel(logging.INFO)  # Full DEBUG detail goes to the file only
+console_handler.setFormatter(formatter)
 
-logger = logging.getLogger(__name__)
+log_queue = queue.Queue(-1)
+listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.DEBUG)
+root_logger.addHandler(QueueHandler(log_queue))  # Unformatted: the listener's handlers format
+listener.start()
 
-if len(sys.argv) < 2:
-    print("Usage: python scripts/run_with_logging.py <script_to_run> [args...]")
-    sys.exit(1)
+logger = logging.getLogger(__name__)
 
 script_to_run = sys.argv[1]
 script_args = sys.argv[2:]
@@ -39,8 +53,7 @@ logger.info(f"Log file: {log_file}")
 logger.info(f"Arguments: {script_args}")
 
 try:
-    # Import and run the script
-    import importlib.util
+    # Import and run the script (its src.* imports happen after logging is set up)
     spec = importlib.util.spec_from_file_location("script", script_to_run)
     if spec is None:
         logger.error(f"Could not load script: {script_to_run}")
@@ -67,3 +80,6 @@ except Exception as e:
     logger.error(traceback.format_exc())
     sys.exit(1)
 
+finally:
+    # Flush queued records before exiting
+    listener.stop()
@@ -15,19 +15,27 @@ Features:
 """
 
 import asyncio
+import contextlib
 import hashlib
+import io
 import json
 import logging
 import os
+import sqlite3
 import sys
 import tempfile
-from datetime import datetime
+import threading
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 # Google Drive API imports
 try:
+    import httplib2
     from google.auth.transport.requests import Request
+    from google_auth_httplib2 import AuthorizedHttp
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
@@ -42,7 +50,7 @@ except ImportError as e:
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.memory.rag_server import RAGServer
+from src.memory.rag_server import get_default_rag_server
 
 # Setup logging
 logging.basicConfig(
@@ -65,6 +73,184 @@ FOLDER_TIER_MAP = {
 # Supported file extensions
 SUPPORTED_EXTENSIONS = {'.txt', '.md', '.markdown', '.pdf', '.docx', '.doc'}
 
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+
+# Most calls Drive accepts in one batch (multipart/mixed) request
+BATCH_REQUEST_LIMIT = 100
+
+# Downloads in flight at once, and retries (exponential backoff) on 429,
+# rate-limit 403 and 5xx responses
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
+DOWNLOAD_RETRIES = 5
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+HTTP_TIMEOUT = 30  # Seconds per Drive HTTP request
+
+# Files up to this size (and Google Docs exports, which Drive caps at 10 MB)
+# are downloaded into memory and ingested from there instead of a temp file
+IN_MEMORY_MAX_BYTES = 8 * 1024 * 1024
+
+# Google Docs export formats
+GOOGLE_DOCS_EXPORT = {
+    'application/vnd.google-apps.document': 'text/plain',  # Export as plain text
+    'application/vnd.google-apps.spreadsheet': 'text/csv',  # Export as CSV
+    'application/vnd.google-apps.presentation': 'text/plain',  # Export as plain text
+}
+
+# files.list query and fields for listing a folder's children
+LIST_QUERY_TEMPLATE = "'%s' in parents and trashed=false"
+LIST_FIELDS = "nextPageToken, files(id, name, mimeType, modifiedTime, md5Checksum, size)"
+
+# Fields requested from changes.list (only what incremental sync needs)
+CHANGES_FIELDS = (
+    "nextPageToken, newStartPageToken, "
+    "changes(fileId, removed, file(id, name, mimeType, modifiedTime, md5Checksum, size, parents, trashed))"
+)
+
+
+class HashingWriter(io.RawIOBase):
+    """Write-only file wrapper that SHA256-hashes everything written through it."""
+    
+    def __init__(self, f):
+        super().__init__()
+        self.f = f
+        self._hasher = hashlib.sha256()
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data: bytes) -> int:
+        self._hasher.update(data)
+        return self.f.write(data)
+    
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+class _FetchedCursor:
+    """Rows of an executed statement, fetched while SyncState held its lock."""
+    
+    def __init__(self, rows: List[Tuple], rowcount: int):
+        self._rows = rows
+        self.rowcount = rowcount
+    
+    def fetchone(self) -> Optional[Tuple]:
+        return self._rows[0] if self._rows else None
+    
+    def fetchall(self) -> List[Tuple]:
+        return self._rows
+
+
+class SyncStateTable(MutableMapping):
+    """Dict view of one map in the sync state database (e.g. file_id -> hash)."""
+    
+    def __init__(self, state: "SyncState", name: str):
+        self._state = state
+        self._name = name
+    
+    def __getitem__(self, key: str) -> str:
+        row = self._state._execute(
+            "SELECT value FROM entries WHERE map = ? AND key = ?", (self._name, key)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+    
+    def __setitem__(self, key: str, value: str) -> None:
+        self._state._execute(
+            "INSERT OR REPLACE INTO entries (map, key, value) VALUES (?, ?, ?)",
+            (self._name, key, value)
+        )
+    
+    def __delitem__(self, key: str) -> None:
+        cursor = self._state._execute(
+            "DELETE FROM entries WHERE map = ? AND key = ?", (self._name, key)
+        )
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter([key for key, _ in self.items()])
+    
+    def __len__(self) -> int:
+        return self._state._execute(
+            "SELECT COUNT(*) FROM entries WHERE map = ?", (self._name,)
+        ).fetchone()[0]
+    
+    def items(self) -> List[Tuple[str, str]]:
+        return self._state._execute(
+            "SELECT key, value FROM entries WHERE map = ?", (self._name,)
+        ).fetchall()
+
+
+class SyncState:
+    """
+    Sync state in SQLite: each map (file_hashes, file_versions, ...) is a
+    SyncStateTable, other keys (last_sync, start_page_token) are scalars.
+    
+    Changes are written as they happen and committed together by commit(),
+    so a sync writes only the entries it changed instead of rewriting the
+    whole state. Safe to use from several threads.
+    """
+    
+    MAPS = ('file_hashes', 'file_versions', 'file_paths', 'file_folders', 'folder_roots', 'folder_ids')
+    SCALARS = ('last_sync', 'start_page_token')
+    
+    def __init__(self, path: Path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                map TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT,
+                PRIMARY KEY (map, key)
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+        self._tables = {name: SyncStateTable(self, name) for name in self.MAPS}
+    
+    def _execute(self, sql: str, params: Tuple = ()) -> _FetchedCursor:
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            # Fetch while holding the lock; the cursor is shared state
+            return _FetchedCursor(cursor.fetchall(), cursor.rowcount)
+    
+    def __getitem__(self, key: str):
+        if key in self._tables:
+            return self._tables[key]
+        if key not in self.SCALARS:
+            raise KeyError(key)
+        row = self._execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def __setitem__(self, key: str, value: Optional[str]) -> None:
+        if key not in self.SCALARS:
+            raise KeyError(key)
+        self._execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    
+    def is_empty(self) -> bool:
+        """Whether nothing has been synced yet."""
+        return self._execute("SELECT 1 FROM meta UNION ALL SELECT 1 FROM entries LIMIT 1").fetchone() is None
+    
+    def update(self, data: Dict) -> None:
+        """Import a state dict (the old JSON sync state format)."""
+        for key, value in data.items():
+            if key in self._tables:
+                self._tables[key].update(value)
+            elif key in self.SCALARS:
+                self[key] = value
+    
+    def commit(self) -> None:
+        with self._lock:
+            self._conn.commit()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
 
 class GoogleDriveSync:
     """Google Drive sync manager for RAG memory."""
@@ -73,8 +259,9 @@ class GoogleDriveSync:
         self,
         credentials_file: str = "credentials.json",
         token_file: str = "token.json",
-        sync_state_file: str = ".drive_sync_state.json",
-        memory_dir: Optional[str] = None
+        sync_state_file: str = ".drive_sync_state.db",
+        memory_dir: Optional[str] = None,
+        download_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY
     ):
         """
         Initialize Google Drive sync.
@@ -82,46 +269,73 @@ class GoogleDriveSync:
         Args:
             credentials_file: Path to OAuth 2.0 credentials JSON file
             token_file: Path to store OAuth token
-            sync_state_file: Path to sync state (last sync time, file hashes)
+            sync_state_file: Path to sync state database (last sync time, file hashes)
             memory_dir: Directory for RAG memory (default: ~/.jarvis/memory)
+            download_concurrency: Files downloaded concurrently
         """
+        if download_concurrency < 1:
+            raise ValueError(f"Invalid download_concurrency: {download_concurrency}. Must be >= 1")
+
         self.credentials_file = Path(credentials_file)
         self.token_file = Path(token_file)
         self.sync_state_file = Path(sync_state_file)
         self.memory_dir = memory_dir
+        self.download_concurrency = download_concurrency
         
         # Load sync state
         self.sync_state = self._load_sync_state()
         
-        # Initialize RAG server
-        self.rag_server = RAGServer(
+        # Initialize RAG server (shared with anything else in this process)
+        self.rag_server = get_default_rag_server(
             persist_directory=memory_dir,
             enable_tiering=True
         )
         
         # Google Drive service (initialized after auth)
         self.service = None
+        self.credentials = None
+        # httplib2 connections aren't thread-safe: one per Drive thread. Drive
+        # calls all run on one pool, so at most download_concurrency
+        # connections are opened and each is kept alive across calls
+        self._thread_local = threading.local()
+        self._drive_pool = ThreadPoolExecutor(
+            max_workers=download_concurrency, thread_name_prefix="drive"
+        )
+        # Folders sync concurrently; their ingests and sync_state updates don't
+        self._ingest_lock = asyncio.Lock()
     
-    def _load_sync_state(self) -> Dict:
-        """Load sync state from file."""
-        if self.sync_state_file.exists():
+    def _load_sync_state(self) -> SyncState:
+        """
+        Open the sync state database.
+        
+        Maps: file_hashes (file_id -> Drive md5Checksum, SHA256 of the export
+        for Google Docs), file_versions (file_id -> modifiedTime), file_paths
+        (file_id -> path it was ingested from, to delete its chunks),
+        file_folders (file_id -> synced top-level folder it was ingested from),
+        folder_roots (folder_id -> synced top-level folder it is in) and
+        folder_ids (synced top-level folder name -> folder_id). Scalars:
+        last_sync and start_page_token (Drive changes.list cursor, None =
+        full sync).
+        """
+        state = SyncState(self.sync_state_file)
+        
+        # Import the JSON state file older versions wrote
+        legacy_file = self.sync_state_file.with_suffix('.json')
+        if legacy_file != self.sync_state_file and legacy_file.exists() and state.is_empty():
             try:
-                with open(self.sync_state_file, 'r') as f:
-                    return json.load(f)
+                with open(legacy_file, 'r') as f:
+                    state.update(json.load(f))
+                state.commit()
+                logger.info(f"Imported sync state from {legacy_file}")
             except Exception as e:
-                logger.warning(f"Failed to load sync state: {e}")
+                logger.warning(f"Failed to import sync state from {legacy_file}: {e}")
         
-        return {
-            'last_sync': None,
-            'file_hashes': {},  # file_id -> hash
-            'file_versions': {}  # file_id -> version (modifiedTime)
-        }
+        return state
     
     def _save_sync_state(self):
-        """Save sync state to file."""
+        """Commit sync state changes."""
         try:
-            with open(self.sync_state_file, 'w') as f:
-                json.dump(self.sync_state, f, indent=2)
+            self.sync_state.commit()
         except Exception as e:
             logger.error(f"Failed to save sync state: {e}")
     
@@ -168,26 +382,27 @@ class GoogleDriveSync:
         
         # Build service
         try:
-            self.service = build('drive', 'v3', credentials=creds)
+            self.service = build('drive', 'v3', credentials=creds, cache_discovery=False)
+            self.credentials = creds
             logger.info("✅ Authenticated with Google Drive")
             return True
         except Exception as e:
             logger.error(f"Failed to build Drive service: {e}")
             return False
     
-    def _get_file_hash(self, file_content: bytes) -> str:
-        """Calculate SHA256 hash of file content."""
-        return hashlib.sha256(file_content).hexdigest()
-    
     def _find_folder_by_name(self, folder_name: str) -> Optional[str]:
-        """Find Google Drive folder by name."""
+        """Find Google Drive folder by name (IDs are cached in the sync state)."""
+        folder_ids = self.sync_state['folder_ids']
+        if folder_name in folder_ids:
+            return folder_ids[folder_name]
+        
         try:
             query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
             results = self.service.files().list(
                 q=query,
                 fields="files(id, name)",
                 pageSize=10
-            ).execute()
+            ).execute(http=self._thread_http())
             
             folders = results.get('files', [])
             if not folders:
@@ -197,77 +412,198 @@ class GoogleDriveSync:
             if len(folders) > 1:
                 logger.warning(f"Multiple folders named '{folder_name}', using first: {folders[0]['id']}")
             
+            folder_ids[folder_name] = folders[0]['id']
             return folders[0]['id']
         except HttpError as e:
             logger.error(f"Error finding folder '{folder_name}': {e}")
             return None
     
-    def _list_files_in_folder(self, folder_id: str) -> List[Dict]:
-        """List all files in a Google Drive folder (recursively)."""
-        files = []
-        page_token = None
+    def _classify_file(self, item: Dict) -> Optional[Dict]:
+        """Return a file item if it can be ingested (marking Docs for export), else None."""
+        mime_type = item.get('mimeType', '')
+        # Called for every listed item: slice the extension off instead of
+        # building a Path
+        name = item.get('name', '')
+        dot = name.rfind('.')
+        ext = name[dot:].lower() if dot > 0 else ''
         
-        # Google Docs export formats
-        GOOGLE_DOCS_EXPORT = {
-            'application/vnd.google-apps.document': 'text/plain',  # Export as plain text
-            'application/vnd.google-apps.spreadsheet': 'text/csv',  # Export as CSV
-            'application/vnd.google-apps.presentation': 'text/plain',  # Export as plain text
-        }
+        # Check if it's a Google Docs file (needs export)
+        if mime_type in GOOGLE_DOCS_EXPORT:
+            # Add export format to metadata
+            item['export_mime_type'] = GOOGLE_DOCS_EXPORT[mime_type]
+            return item
+        # Check if regular file type is supported
+        if ext in SUPPORTED_EXTENSIONS or mime_type.startswith('text/'):
+            return item
+        return None
+    
+    def _list_files_in_folder(
+        self,
+        folder_id: str,
+        root_folder: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> List[Dict]:
+        """List all files in a Google Drive folder (recursively); see _iter_file_batches."""
+        return [item for files in self._iter_file_batches(folder_id, root_folder, since) for item in files]
+    
+    async def _iter_files_in_folder(
+        self,
+        folder_id: str,
+        root_folder: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield a folder's files batch by batch, listing on the Drive thread pool."""
+        batches = self._iter_file_batches(folder_id, root_folder, since)
+        while True:
+            files = await self._in_drive_thread(next, batches, None)
+            if files is None:
+                return
+            yield files
+    
+    def _iter_file_batches(
+        self,
+        folder_id: str,
+        root_folder: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        List all files in a Google Drive folder (recursively), yielding the
+        files found by each batch request as soon as it returns.
         
-        try:
-            while True:
-                # Query for files in folder
-                query = f"'{folder_id}' in parents and trashed=false"
-                results = self.service.files().list(
-                    q=query,
-                    fields="nextPageToken, files(id, name, mimeType, modifiedTime, size)",
-                    pageToken=page_token,
-                    pageSize=100
-                ).execute()
-                
-                items = results.get('files', [])
+        Folders are walked breadth-first, and each level's files.list calls
+        (one per folder or next page) go out together in batch requests of
+        up to BATCH_REQUEST_LIMIT, one HTTP round trip per batch instead of
+        one per folder.
+        
+        Args:
+            folder_id: Folder to list
+            root_folder: Synced top-level folder name; every folder visited is
+                         recorded under it so changes.list results can be mapped
+                         back to a tier
+            since: Only list files modified after this RFC 3339 time (filtered
+                   by Drive). Subfolders are still all listed, in a separate
+                   query, since a folder's modifiedTime doesn't change with
+                   its contents.
+        """
+        files = []
+        if since:
+            queries = [
+                f" and mimeType='{FOLDER_MIME_TYPE}'",
+                f" and mimeType!='{FOLDER_MIME_TYPE}' and modifiedTime > '{since}'"
+            ]
+        else:
+            queries = [""]
+        # (folder_id, query filter, page_token) still to list
+        pending = [(folder_id, query, None) for query in queries]
+        files_list = self.service.files().list
+        
+        while pending:
+            level, pending = pending, []
+            for start in range(0, len(level), BATCH_REQUEST_LIMIT):
+                batch_items = level[start:start + BATCH_REQUEST_LIMIT]
                 
-                for item in items:
-                    mime_type = item.get('mimeType', '')
-                    
-                    # If it's a folder, recurse
-                    if mime_type == 'application/vnd.google-apps.folder':
-                        subfolder_files = self._list_files_in_folder(item['id'])
-                        files.extend(subfolder_files)
-                    else:
-                        file_name = item.get('name', '')
-                        ext = Path(file_name).suffix.lower()
-                        
-                        # Check if it's a Google Docs file (needs export)
-                        if mime_type in GOOGLE_DOCS_EXPORT:
-                            # Add export format to metadata
-                            item['export_mime_type'] = GOOGLE_DOCS_EXPORT[mime_type]
-                            files.append(item)
-                        # Check if regular file type is supported
-                        elif ext in SUPPORTED_EXTENSIONS or mime_type.startswith('text/'):
+                def on_response(request_id, response, exception):
+                    listed_folder, query, _ = batch_items[int(request_id)]
+                    if exception is not None:
+                        logger.error(f"Error listing files in folder {listed_folder}: {exception}")
+                        if getattr(getattr(exception, 'resp', None), 'status', None) == 404:
+                            self._forget_folder(listed_folder)
+                        return
+                    for item in response.get('files', []):
+                        if item.get('mimeType') == FOLDER_MIME_TYPE:
+                            pending.extend((item['id'], q, None) for q in queries)
+                        elif self._classify_file(item):
                             files.append(item)
+                    if response.get('nextPageToken'):
+                        pending.append((listed_folder, query, response['nextPageToken']))
                 
-                page_token = results.get('nextPageToken')
-                if not page_token:
-                    break
-        
+                batch = self.service.new_batch_http_request(callback=on_response)
+                for i, (listed_folder, query, page_token) in enumerate(batch_items):
+                    if root_folder:
+                        self.sync_state['folder_roots'][listed_folder] = root_folder
+                    batch.add(
+                        files_list(
+                            q=LIST_QUERY_TEMPLATE % listed_folder + query,
+                            fields=LIST_FIELDS,
+                            pageToken=page_token,
+                            pageSize=1000
+                        ),
+                        request_id=str(i)
+                    )
+                try:
+                    batch.execute(http=self._thread_http())
+                except HttpError as e:
+                    logger.error(f"Error listing folders: {e}")
+                if files:
+                    yield files
+                    files = []
+    
+    def _forget_folder(self, folder_id: str) -> None:
+        """Drop a folder that no longer exists from the cached folder IDs."""
+        self.sync_state['folder_roots'].pop(folder_id, None)
+        folder_ids = self.sync_state['folder_ids']
+        for folder_name in [name for name, cached in folder_ids.items() if cached == folder_id]:
+            del folder_ids[folder_name]
+    
+    def _get_start_page_token(self) -> Optional[str]:
+        """Get the changes.list cursor for 'now' (None on error)."""
+        try:
+            return self.service.changes().getStartPageToken().execute(
+                http=self._thread_http()
+            ).get('startPageToken')
         except HttpError as e:
-            logger.error(f"Error listing files in folder {folder_id}: {e}")
+            logger.error(f"Error getting changes start page token: {e}")
+            return None
+    
+    def _list_changes(self, page_token: str) -> Tuple[List[Dict], str]:
+        """
+        List every change since page_token.
         
-        return files
+        Returns:
+            (changes, new start page token)
+            
+        Raises:
+            HttpError: e.g. 410 if the token has expired
+        """
+        changes = []
+        while True:
+            results = self.service.changes().list(
+                pageToken=page_token,
+                fields=CHANGES_FIELDS,
+                pageSize=1000,
+                includeRemoved=True
+            ).execute(http=self._thread_http())
+            changes.extend(results.get('changes', []))
+            if 'newStartPageToken' in results:
+                return changes, results['newStartPageToken']
+            page_token = results['nextPageToken']
     
-    def _download_file(self, file_id: str, file_name: str, export_mime_type: Optional[str] = None) -> Optional[bytes]:
+    def _download_file(
+        self,
+        file_id: str,
+        file_name: str,
+        output: Union[Path, BinaryIO],
+        export_mime_type: Optional[str] = None,
+        md5_checksum: Optional[str] = None
+    ) -> Optional[str]:
         """
-        Download a file from Google Drive.
+        Download a file from Google Drive straight to disk.
+        
+        The body is streamed in DOWNLOAD_CHUNK_SIZE pieces, so memory use
+        doesn't grow with the file size. Without a Drive checksum (Google
+        Docs exports) the content is hashed as it is written.
         
         Args:
             file_id: Google Drive file ID
             file_name: File name (for logging)
+            output: File to write the content to, or an open binary stream
             export_mime_type: MIME type for Google Docs export (e.g., 'text/plain')
+            md5_checksum: Drive's md5Checksum for the file, if it has one
         
         Returns:
-            File content as bytes, or None on error
+            md5_checksum if given, else SHA256 of the content (None on error)
         """
+        logger.info(f"   📥 Downloading: {file_name}")
         try:
             if export_mime_type:
                 # Google Docs files need to be exported
@@ -275,19 +611,105 @@ class GoogleDriveSync:
             else:
                 # Regular files can be downloaded directly
                 request = self.service.files().get_media(fileId=file_id)
+            request.http = self._thread_http()
             
-            file_content = request.execute()
-            return file_content
+            with open(output, 'wb') if isinstance(output, Path) else contextlib.nullcontext(output) as f:
+                writer = f if md5_checksum else HashingWriter(f)
+                downloader = MediaIoBaseDownload(writer, request, chunksize=DOWNLOAD_CHUNK_SIZE)
+                done = False
+                while not done:
+                    _, done = downloader.next_chunk(num_retries=DOWNLOAD_RETRIES)
+            return md5_checksum or writer.hexdigest()
         except HttpError as e:
             logger.error(f"Error downloading file {file_name} ({file_id}): {e}")
             return None
     
+    async def _in_drive_thread(self, func: Callable[..., Any], *args) -> Any:
+        """Run a blocking Drive call on the Drive thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._drive_pool, func, *args)
+    
+    def close(self) -> None:
+        """Shut down the Drive thread pool and close the sync state."""
+        self._drive_pool.shutdown(wait=False)
+        self.sync_state.close()
+    
+    def _thread_http(self):
+        """
+        Authorized HTTP connection for the calling thread.
+        
+        Every Drive call passes one of these to execute(), so its TLS
+        connection is kept alive across calls instead of each call using the
+        service's default connection.
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+            self._thread_local.http = http
+        return http
+    
+    @staticmethod
+    def _local_file_name(file_item: Dict) -> str:
+        """File name a Drive file is downloaded (and ingested) under."""
+        # For Google Docs, use .txt extension
+        if file_item.get('export_mime_type'):
+            ext = '.txt'
+        else:
+            ext = Path(file_item['name']).suffix or '.txt'
+        return f"{file_item['id']}{ext}"
+    
+    async def _download_files(
+        self,
+        files: List[Dict],
+        temp_path: Path
+    ) -> List[Tuple[Path, Optional[bytes], Optional[str]]]:
+        """
+        Download files concurrently (on the Drive thread pool, so at most
+        download_concurrency at a time across all folders).
+        
+        Files up to IN_MEMORY_MAX_BYTES are kept in memory; larger ones are
+        written into temp_path.
+        
+        Returns:
+            (path under temp_path, content if kept in memory, content hash or
+            None on error) per file, in order
+        """
+        async def download_one(file_item: Dict) -> Tuple[Path, Optional[bytes], Optional[str]]:
+            output_path = temp_path / self._local_file_name(file_item)
+            size = file_item.get('size')
+            in_memory = bool(file_item.get('export_mime_type')) or (
+                size is not None and int(size) <= IN_MEMORY_MAX_BYTES
+            )
+            output = io.BytesIO() if in_memory else output_path
+            file_hash = await self._in_drive_thread(
+                self._download_file,
+                file_item['id'],
+                file_item['name'],
+                output,
+                file_item.get('export_mime_type'),
+                file_item.get('md5Checksum')
+            )
+            return output_path, output.getvalue() if in_memory else None, file_hash
+        
+        return await asyncio.gather(*(download_one(file_item) for file_item in files))
+    
     def _should_sync_file(self, file_id: str, modified_time: str, file_hash: Optional[str] = None) -> bool:
-        """Check if file should be synced (new or modified)."""
+        """
+        Check if file should be synced (new or modified).
+        
+        Args:
+            file_id: Google Drive file ID
+            modified_time: Drive modifiedTime
+            file_hash: Drive md5Checksum (Google Docs have none)
+        """
         # Check if file is new
         if file_id not in self.sync_state['file_hashes']:
             return True
         
+        # Same content as last synced, whatever its modifiedTime says
+        if file_hash and self.sync_state['file_hashes'][file_id] == file_hash:
+            return False
+        
         # Check if file was modified
         stored_version = self.sync_state['file_versions'].get(file_id)
         if stored_version != modified_time:
@@ -299,6 +721,31 @@ class GoogleDriveSync:
         
         return False
     
+    def _modified_since(self) -> Optional[str]:
+        """Start of the last sync as an RFC 3339 time for files.list, or None."""
+        last_sync = self.sync_state['last_sync']
+        if not last_sync:
+            return None
+        try:
+            started = datetime.fromisoformat(last_sync)
+        except ValueError:
+            return None
+        if started.tzinfo is None:
+            # Written by an older version in local time: list everything once
+            return None
+        return started.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+    
+    @staticmethod
+    def _new_stats() -> Dict[str, int]:
+        return {
+            'files_found': 0,
+            'files_synced': 0,
+            'files_skipped': 0,
+            'files_removed': 0,
+            'chunks_ingested': 0,
+            'errors': 0
+        }
+    
     async def sync_folder(self, folder_name: str, tier: str) -> Dict[str, int]:
         """
         Sync a Google Drive folder to RAG memory tier.
@@ -310,114 +757,290 @@ class GoogleDriveSync:
         Returns:
             Dictionary with sync statistics
         """
-        stats = {
-            'files_found': 0,
-            'files_synced': 0,
-            'files_skipped': 0,
-            'chunks_ingested': 0,
-            'errors': 0
-        }
+        stats = self._new_stats()
         
         logger.info(f"📁 Syncing folder '{folder_name}' → tier '{tier}'...")
         
-        # Find folder
-        folder_id = self._find_folder_by_name(folder_name)
+        # Find folder (Drive calls run on the Drive thread pool so folders
+        # can sync concurrently)
+        folder_id = await self._in_drive_thread(self._find_folder_by_name, folder_name)
         if not folder_id:
             logger.warning(f"   ⚠️  Folder '{folder_name}' not found, skipping")
             return stats
         
-        # List files
-        files = self._list_files_in_folder(folder_id)
-        stats['files_found'] = len(files)
-        logger.info(f"   Found {len(files)} file(s)")
+        # List files (only those modified since the last sync, if any). Each
+        # batch of files is synced as soon as it is listed, while the rest of
+        # the folder tree is still being walked
+        since = self._modified_since()
+        
+        async def sync_listed(folder_id: str) -> None:
+            tasks = []
+            async for files in self._iter_files_in_folder(folder_id, folder_name, since):
+                stats['files_found'] += len(files)
+                tasks.append(asyncio.create_task(self._sync_files(files, folder_name, tier, stats)))
+            await asyncio.gather(*tasks)
+        
+        await sync_listed(folder_id)
+        if folder_name not in self.sync_state['folder_ids']:
+            # Cached ID was stale (404): look the folder up again
+            folder_id = await self._in_drive_thread(self._find_folder_by_name, folder_name)
+            if not folder_id:
+                logger.warning(f"   ⚠️  Folder '{folder_name}' not found, skipping")
+                return stats
+            await sync_listed(folder_id)
         
+        if since:
+            logger.info(f"   Found {stats['files_found']} file(s) modified since {since}")
+        else:
+            logger.info(f"   Found {stats['files_found']} file(s)")
+        return stats
+    
+    async def _sync_files(
+        self,
+        files: List[Dict],
+        folder_name: str,
+        tier: str,
+        stats: Dict[str, int]
+    ) -> None:
+        """
+        Download new/modified files and ingest them into a tier (updates stats).
+        
+        A file whose md5Checksum matches one already synced (the same
+        document in two folders) isn't downloaded: the synced copy's chunks
+        are copied into this tier, reusing their embeddings.
+        """
         if not files:
-            return stats
+            return
+        
+        # Determine TTL for ephemeral tier
+        ttl_seconds = None
+        if tier == 'ephemeral':
+            # Default: 30 days for ephemeral
+            ttl_seconds = 30 * 24 * 60 * 60
+        metadata = {'source': 'google_drive', 'folder': folder_name}
         
         # Create temp directory for downloads
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             files_to_ingest = []
             
+            # Check which files should be synced
+            changed = []
+            duplicates = []
+            synced_by_hash = {
+                file_hash: file_id for file_id, file_hash in self.sync_state['file_hashes'].items()
+            }
             for file_item in files:
-                file_id = file_item['id']
-                file_name = file_item['name']
-                modified_time = file_item.get('modifiedTime', '')
-                
-                # Check if file should be synced
-                if not self._should_sync_file(file_id, modified_time):
+                if not self._should_sync_file(
+                    file_item['id'],
+                    file_item.get('modifiedTime', ''),
+                    file_item.get('md5Checksum')
+                ):
                     stats['files_skipped'] += 1
-                    logger.debug(f"   ⏭️  Skipping unchanged: {file_name}")
+                    logger.debug(f"   ⏭️  Skipping unchanged: {file_item['name']}")
                     continue
-                
-                # Download file
-                logger.info(f"   📥 Downloading: {file_name}")
-                export_mime_type = file_item.get('export_mime_type')
-                file_content = self._download_file(file_id, file_name, export_mime_type)
-                
-                if not file_content:
+                source_id = synced_by_hash.get(file_item.get('md5Checksum'))
+                if source_id is not None and source_id != file_item['id']:
+                    duplicates.append((file_item, source_id))
+                else:
+                    changed.append(file_item)
+            
+            if duplicates:
+                async with self._ingest_lock:
+                    for file_item, source_id in duplicates:
+                        source_path = self.sync_state['file_paths'].get(source_id)
+                        file_path = str(temp_path / self._local_file_name(file_item))
+                        
+                        def copy_synced():
+                            self._remove_file(file_item['id'])
+                            return self.rag_server.copy_file(
+                                source_path,
+                                file_path,
+                                file_item['md5Checksum'],
+                                tier=tier,
+                                ttl_seconds=ttl_seconds,
+                                metadata=metadata
+                            )
+                        
+                        copied = await asyncio.to_thread(copy_synced) if source_path else 0
+                        if not copied:
+                            # Synced copy is gone: download it after all
+                            changed.append(file_item)
+                            continue
+                        
+                        logger.info(f"   📋 Reused {copied} chunks for duplicate: {file_item['name']}")
+                        stats['chunks_ingested'] += copied
+                        stats['files_synced'] += 1
+                        self._record_synced(
+                            file_item['id'], file_item['md5Checksum'],
+                            file_item.get('modifiedTime', ''), file_path, folder_name
+                        )
+            
+            # Download changed files concurrently
+            downloads = await self._download_files(changed, temp_path)
+            
+            for file_item, (temp_file, content, file_hash) in zip(changed, downloads):
+                if file_hash is None:
                     stats['errors'] += 1
                     continue
                 
-                # Calculate hash
-                file_hash = self._get_file_hash(file_content)
-                
-                # Save to temp file
-                # For Google Docs, use .txt extension
-                if export_mime_type:
-                    ext = '.txt'
-                else:
-                    ext = Path(file_name).suffix or '.txt'
-                temp_file = temp_path / f"{file_id}{ext}"
-                temp_file.write_bytes(file_content)
+                if (
+                    self.sync_state['file_hashes'].get(file_item['id']) == file_hash
+                    and self.sync_state['file_folders'].get(file_item['id']) == folder_name
+                ):
+                    # Touched but not edited (e.g. a Google Doc re-saved): the
+                    # export hashes the same, so keep the chunks already stored
+                    self.sync_state['file_versions'][file_item['id']] = file_item.get('modifiedTime', '')
+                    stats['files_skipped'] += 1
+                    logger.debug(f"   ⏭️  Content unchanged: {file_item['name']}")
+                    continue
                 
                 files_to_ingest.append({
                     'path': str(temp_file),
-                    'file_id': file_id,
-                    'file_name': file_name,
+                    'content': content,
+                    'file_id': file_item['id'],
+                    'file_name': file_item['name'],
                     'hash': file_hash,
-                    'modified_time': modified_time
+                    'modified_time': file_item.get('modifiedTime', '')
                 })
             
-            # Ingest files into RAG
+            # Ingest files into RAG (one folder at a time)
             if files_to_ingest:
-                logger.info(f"   📝 Ingesting {len(files_to_ingest)} file(s) into tier '{tier}'...")
+                async with self._ingest_lock:
+                    logger.info(f"   📝 Ingesting {len(files_to_ingest)} file(s) into tier '{tier}'...")
                 
-                file_paths = [f['path'] for f in files_to_ingest]
+                    # Modified files: drop the chunks of the previous version first
+                    # (in a worker thread, like the rest of ingestion, so other
+                    # folders' downloads keep going)
+                    def remove_previous_versions():
+                        for file_info in files_to_ingest:
+                            self._remove_file(file_info['file_id'])
+                    
+                    await asyncio.to_thread(remove_previous_versions)
                 
-                # Determine TTL for ephemeral tier
-                ttl_seconds = None
-                if tier == 'ephemeral':
-                    # Default: 30 days for ephemeral
-                    ttl_seconds = 30 * 24 * 60 * 60
+                    # In-memory downloads are ingested as (path, content)
+                    file_paths = [
+                        f['path'] if f['content'] is None else (f['path'], f['content'])
+                        for f in files_to_ingest
+                    ]
                 
-                result = await self.rag_server.ingest_documents(
-                    file_paths,
-                    tier=tier,
-                    ttl_seconds=ttl_seconds,
-                    metadata={'source': 'google_drive', 'folder': folder_name}
-                )
+                    result = await self.rag_server.ingest_documents(
+                        file_paths,
+                        tier=tier,
+                        ttl_seconds=ttl_seconds,
+                        metadata=metadata
+                    )
                 
-                if result['success']:
-                    stats['chunks_ingested'] = result['chunks_ingested']
-                    stats['files_synced'] = len(files_to_ingest)
+                    if result['success']:
+                        stats['chunks_ingested'] += result['chunks_ingested']
+                        stats['files_synced'] += len(files_to_ingest)
                     
-                    # Update sync state
-                    for file_info in files_to_ingest:
-                        self.sync_state['file_hashes'][file_info['file_id']] = file_info['hash']
-                        self.sync_state['file_versions'][file_info['file_id']] = file_info['modified_time']
+                        # Update sync state
+                        for file_info in files_to_ingest:
+                            self._record_synced(
+                                file_info['file_id'], file_info['hash'],
+                                file_info['modified_time'], file_info['path'], folder_name
+                            )
                     
-                    logger.info(f"   ✅ Ingested {result['chunks_ingested']} chunks from {len(files_to_ingest)} file(s)")
-                else:
-                    stats['errors'] += len(files_to_ingest)
-                    logger.error(f"   ❌ Ingestion failed: {result.get('message', 'Unknown error')}")
+                        logger.info(f"   ✅ Ingested {result['chunks_ingested']} chunks from {len(files_to_ingest)} file(s)")
+                    else:
+                        stats['errors'] += len(files_to_ingest)
+                        logger.error(f"   ❌ Ingestion failed: {result.get('message', 'Unknown error')}")
+    
+    def _record_synced(
+        self,
+        file_id: str,
+        file_hash: str,
+        modified_time: str,
+        file_path: str,
+        folder_name: str
+    ) -> None:
+        """Record a file as synced in the sync state."""
+        self.sync_state['file_hashes'][file_id] = file_hash
+        self.sync_state['file_versions'][file_id] = modified_time
+        self.sync_state['file_paths'][file_id] = file_path
+        self.sync_state['file_folders'][file_id] = folder_name
+    
+    def _remove_file(self, file_id: str) -> bool:
+        """Delete a synced file's chunks and forget it. Returns whether it was synced."""
+        self.sync_state['file_hashes'].pop(file_id, None)
+        self.sync_state['file_versions'].pop(file_id, None)
+        self.sync_state['file_folders'].pop(file_id, None)
+        file_path = self.sync_state['file_paths'].pop(file_id, None)
+        if file_path is None:
+            return False
+        self.rag_server.delete_file(file_path)
+        return True
+    
+    async def _sync_changes(self, page_token: str) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        Incremental sync: apply only what changed in Drive since page_token.
         
-        return stats
+        One changes.list pass covers all folders, instead of listing every
+        file in every folder on each run.
+        
+        Returns:
+            Per-folder statistics, or None if the token is no longer valid
+            (a full sync is needed)
+        """
+        try:
+            changes, new_token = self._list_changes(page_token)
+        except HttpError as e:
+            if e.resp.status in (400, 404, 410):
+                logger.warning(f"Changes token rejected ({e.resp.status}), falling back to full sync")
+                return None
+            raise
+        logger.info(f"🔄 {len(changes)} change(s) since last sync")
+        
+        folder_roots = self.sync_state['folder_roots']
+        folder_stats = {folder_name: self._new_stats() for folder_name in FOLDER_TIER_MAP}
+        to_sync: Dict[str, List[Dict]] = {folder_name: [] for folder_name in FOLDER_TIER_MAP}
+        
+        for change in changes:
+            file_id = change.get('fileId')
+            item = change.get('file') or {}
+            parents = item.get('parents') or []
+            root = next((folder_roots[p] for p in parents if p in folder_roots), None)
+            
+            if change.get('removed') or item.get('trashed') or root is None:
+                # Deleted, trashed or moved out of the synced folders
+                folder_roots.pop(file_id, None)
+                removed_from = self.sync_state['file_folders'].get(file_id)
+                if self._remove_file(file_id) and removed_from in folder_stats:
+                    folder_stats[removed_from]['files_removed'] += 1
+                continue
+            
+            if item.get('mimeType') == FOLDER_MIME_TYPE:
+                if file_id not in folder_roots:
+                    # Folder created or moved in: pick up everything already in it
+                    logger.info(f"   📁 New subfolder in '{root}': {item.get('name')}")
+                    to_sync[root].extend(self._list_files_in_folder(file_id, root_folder=root))
+                continue
+            
+            if self._classify_file(item):
+                previous_folder = self.sync_state['file_folders'].get(file_id)
+                if previous_folder not in (None, root):
+                    # Moved to another synced folder: re-ingest into its tier
+                    self._remove_file(file_id)
+                to_sync[root].append(item)
+        
+        for folder_name, files in to_sync.items():
+            folder_stats[folder_name]['files_found'] = len(files)
+        await asyncio.gather(*(
+            self._sync_files(files, folder_name, FOLDER_TIER_MAP[folder_name], folder_stats[folder_name])
+            for folder_name, files in to_sync.items()
+        ))
+        
+        self.sync_state['start_page_token'] = new_token
+        return folder_stats
     
     async def sync_all(self) -> Dict[str, any]:
         """
         Sync all configured Google Drive folders.
         
+        The first run lists every folder (all folders concurrently); later
+        runs only fetch changes since the previous one (Drive changes.list).
+        
         Returns:
             Dictionary with overall sync statistics
         """
@@ -428,31 +1051,56 @@ class GoogleDriveSync:
         logger.info("="*60)
         logger.info("Starting Google Drive Sync")
         logger.info("="*60)
+        # Files modified while this sync runs are listed again by the next one
+        sync_started = datetime.now(timezone.utc)
         
         overall_stats = {
             'folders_synced': 0,
             'total_files_found': 0,
             'total_files_synced': 0,
             'total_files_skipped': 0,
+            'total_files_removed': 0,
             'total_chunks_ingested': 0,
             'total_errors': 0,
             'folder_stats': {}
         }
         
-        # Sync each folder
-        for folder_name, tier in FOLDER_TIER_MAP.items():
-            stats = await self.sync_folder(folder_name, tier)
-            
+        folder_stats = None
+        if self.sync_state['start_page_token']:
+            folder_stats = await self._sync_changes(self.sync_state['start_page_token'])
+        if folder_stats is None:
+            # Full sync; take the cursor first so changes made while listing
+            # are picked up next time
+            start_page_token = self._get_start_page_token()
+            # Folders are independent: sync them concurrently, and don't let
+            # one folder's failure cancel the others
+            results = await asyncio.gather(
+                *(self.sync_folder(folder_name, tier) for folder_name, tier in FOLDER_TIER_MAP.items()),
+                return_exceptions=True
+            )
+            folder_stats = {}
+            for folder_name, result in zip(FOLDER_TIER_MAP, results):
+                if isinstance(result, Exception):
+                    logger.error(f"   ❌ Failed to sync folder '{folder_name}': {result}")
+                    result = self._new_stats()
+                    result['errors'] = 1
+                folder_stats[folder_name] = result
+            self.sync_state['start_page_token'] = start_page_token
+        
+        for folder_name, stats in folder_stats.items():
             overall_stats['folders_synced'] += 1
             overall_stats['total_files_found'] += stats['files_found']
             overall_stats['total_files_synced'] += stats['files_synced']
             overall_stats['total_files_skipped'] += stats['files_skipped']
+            overall_stats['total_files_removed'] += stats['files_removed']
             overall_stats['total_chunks_ingested'] += stats['chunks_ingested']
             overall_stats['total_errors'] += stats['errors']
             overall_stats['folder_stats'][folder_name] = stats
         
-        # Update last sync time
-        self.sync_state['last_sync'] = datetime.now().isoformat()
+        # Update last sync time (kept back after errors, so files that failed
+        # are listed again)
+        if overall_stats['total_errors'] == 0:
+            self.sync_state['last_sync'] = sync_started.isoformat()
         self._save_sync_state()
         
         # Print summary
@@ -463,6 +1111,7 @@ class GoogleDriveSync:
         logger.info(f"Files found: {overall_stats['total_files_found']}")
         logger.info(f"Files synced: {overall_stats['total_files_synced']}")
         logger.info(f"Files skipped (unchanged): {overall_stats['total_files_skipped']}")
+        logger.info(f"Files removed: {overall_stats['total_files_removed']}")
         logger.info(f"Chunks ingested: {overall_stats['total_chunks_ingested']}")
         logger.info(f"Errors: {overall_stats['total_errors']}")
         
@@ -496,8 +1145,8 @@ async def main():
     parser.add_argument(
         "--sync-state",
         type=str,
-        default=".drive_sync_state.json",
-        help="Path to sync state file (default: .drive_sync_state.json)"
+        default=".drive_sync_state.db",
+        help="Path to sync state database (default: .drive_sync_state.db)"
     )
     parser.add_argument(
         "--memory-dir",
@@ -511,6 +1160,12 @@ async def main():
         choices=list(FOLDER_TIER_MAP.keys()),
         help="Sync only a specific folder (default: sync all folders)"
     )
+    parser.add_argument(
+        "--download-concurrency",
+        type=int,
+        default=DEFAULT_DOWNLOAD_CONCURRENCY,
+        help=f"Files downloaded concurrently (default: {DEFAULT_DOWNLOAD_CONCURRENCY})"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -524,7 +1179,8 @@ async def main():
         credentials_file=args.credentials,
         token_file=args.token,
         sync_state_file=args.sync_state,
-        memory_dir=args.memory_dir
+        memory_dir=args.memory_dir,
+        download_concurrency=args.download_concurrency
     )
     
     # Authenticate
@@ -538,14 +1194,17 @@ async def main():
         return 0
     
     # Sync
-    if args.folder:
-        # Sync single folder
-        tier = FOLDER_TIER_MAP[args.folder]
-        stats = await sync.sync_folder(args.folder, tier)
-        sync._save_sync_state()
-    else:
-        # Sync all folders
-        stats = await sync.sync_all()
+    try:
+        if args.folder:
+            # Sync single folder
+            tier = FOLDER_TIER_MAP[args.folder]
+            stats = await sync.sync_folder(args.folder, tier)
+            sync._save_sync_state()
+        else:
+            # Sync all folders
+            stats = await sync.sync_all()
+    finally:
+        sync.close()
     
     return 0 if stats.get('total_errors', 0) == 0 else 1
 
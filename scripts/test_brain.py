@@ -10,9 +10,6 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.brain.local_brain import LocalBrain
-from src.brain.router import Router, InferenceTarget
-
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,6 +20,8 @@ logger = logging.getLogger(__name__)
 
 async def test_health_check():
     """Test Ollama health check."""
+    from src.brain.local_brain import LocalBrain
+    
     print("\n" + "="*60)
     print("TEST 1: Health Check")
     print("="*60)
@@ -44,6 +43,8 @@ async def test_health_check():
 
 async def test_simple_query():
     """Test simple query to local brain."""
+    from src.brain.local_brain import LocalBrain
+    
     print("\n" + "="*60)
     print("TEST 2: Simple Query")
     print("="*60)
@@ -63,6 +64,8 @@ async def test_simple_query():
 
 async def test_router():
     """Test routing logic."""
+    from src.brain.router import Router, InferenceTarget
+    
     print("\n" + "="*60)
     print("TEST 3: Router Logic")
     print("="*60)
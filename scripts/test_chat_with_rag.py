@@ -9,9 +9,6 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.brain.orchestrator import Orchestrator
-from src.memory.rag_server import RAGServer
-
 # Setup logging (less verbose)
 logging.basicConfig(
     level=logging.WARNING,
@@ -22,13 +19,17 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 async def test_chat_with_rag():
     """Test chat interface with RAG integration."""
+    # Deferred: pulls in chromadb and the embedding stack
+    from src.brain.orchestrator import Orchestrator
+    from src.memory.rag_server import get_default_rag_server
+    
     print("="*70)
     print("Testing Chat Interface with RAG Integration")
     print("="*70)
     
     # Initialize RAG server with tiering
     print("\n📚 Initializing RAG server...")
-    rag_server = RAGServer(enable_tiering=True)
+    rag_server = get_default_rag_server(enable_tiering=True)
     stats = rag_server.get_stats()
     
     if stats.get("tiering_enabled"):
@@ -68,32 +69,37 @@ async def test_chat_with_rag():
         print("Testing Queries with RAG Context")
         print("="*70)
         
-        for i, query in enumerate(test_queries, 1):
+        # Queries are independent: send them together, print in order
+        print(f"\n🤔 Thinking on {len(test_queries)} queries...", flush=True)
+        results = await asyncio.gather(
+            *(orchestrator.think(query, use_rag_context=True) for query in test_queries),
+            return_exceptions=True
+        )
+        
+        for i, (query, result) in enumerate(zip(test_queries, results), 1):
             print(f"\n{'='*70}")
             print(f"Query {i}/{len(test_queries)}: {query}")
             print("="*70)
             
-            try:
-                print("🤔 Thinking...", end="", flush=True)
-                response, target, tool_calls = await orchestrator.think(query, use_rag_context=True)
-                print("\r" + " "*20 + "\r", end="")  # Clear "Thinking..." line
-                
-                # Show which brain was used
-                brain_indicator = "☁️" if target.value == "cloud" else "🏠"
-                print(f"\n{brain_indicator} Response ({target.value.upper()}):")
-                print("-" * 70)
-                print(response)
-                print("-" * 70)
-                
-                if tool_calls:
-                    print(f"\n🔧 Tools used: {len(tool_calls)}")
-                    for tool_call in tool_calls:
-                        print(f"   - {tool_call.get('name', 'unknown')}")
-                
-            except Exception as e:
-                print(f"\n❌ Error: {e}")
+            if isinstance(result, Exception):
+                print(f"\n❌ Error: {result}")
                 import traceback
-                traceback.print_exc()
+                traceback.print_exception(result)
+                continue
+            
+            response, target, tool_calls = result
+            
+            # Show which brain was used
+            brain_indicator = "☁️" if target.value == "cloud" else "🏠"
+            print(f"\n{brain_indicator} Response ({target.value.upper()}):")
+            print("-" * 70)
+            print(response)
+            print("-" * 70)
+            
+            if tool_calls:
+                print(f"\n🔧 Tools used: {len(tool_calls)}")
+                for tool_call in tool_calls:
+                    print(f"   - {tool_call.get('name', 'unknown')}")
     
     print("\n" + "="*70)
     print("Chat Test Complete")
@@ -2,7 +2,6 @@
 """Test the hybrid Ollama pattern: local gateway with cloud models."""
 
 import asyncio
-import httpx
 import sys
 from pathlib import Path
 
@@ -12,6 +11,8 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.common.httpclient import get_shared_client, close_shared_client
+
 async def test_hybrid_setup():
     """Test local Ollama gateway with cloud model."""
     base_url = "http://localhost:11434"
@@ -24,16 +25,18 @@ async def test_hybrid_setup():
     print(f"Model: {model}")
     print()
     
+    # One pooled client: all three tests share a keep-alive connection
+    client = get_shared_client()
+    
     # Test 1: Check if Ollama is running
     print("Test 1: Check if local Ollama is running...")
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            r = await client.get(f"{base_url}/api/tags")
-            if r.status_code == 200:
-                print("✅ Local Ollama is running")
-            else:
-                print(f"❌ Ollama returned status {r.status_code}")
-                return False
+        r = await client.get(f"{base_url}/api/tags", timeout=5.0)
+        if r.status_code == 200:
+            print("✅ Local Ollama is running")
+        else:
+            print(f"❌ Ollama returned status {r.status_code}")
+            return False
     except Exception as e:
         print(f"❌ Cannot connect to Ollama: {e}")
         print("   Make sure Ollama is running: ollama serve")
@@ -42,18 +45,17 @@ async def test_hybrid_setup():
     # Test 2: Check if cloud model is available
     print("\nTest 2: Check if cloud model is available...")
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.get(f"{base_url}/api/tags")
-            models = r.json().get("models", [])
-            model_names = [m.get("name", "") for m in models]
-            
-            if model in model_names:
-                print(f"✅ Model '{model}' is available")
-            else:
-                print(f"⚠️  Model '{model}' not found in local models")
-                print(f"   Available models: {', '.join(model_names[:5])}")
-                print(f"   Run: ollama pull {model}")
-                return False
+        r = await client.get(f"{base_url}/api/tags", timeout=10.0)
+        models = r.json().get("models", [])
+        model_names = [m.get("name", "") for m in models]
+        
+        if model in model_names:
+            print(f"✅ Model '{model}' is available")
+        else:
+            print(f"⚠️  Model '{model}' not found in local models")
+            print(f"   Available models: {', '.join(model_names[:5])}")
+            print(f"   Run: ollama pull {model}")
+            return False
     except Exception as e:
         print(f"❌ Error checking models: {e}")
         return False
@@ -69,32 +71,37 @@ async def test_hybrid_setup():
     }
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            r = await client.post(url, json=payload, headers=headers)
-            
-            if r.status_code == 200:
-                result = r.json()
-                content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
-                print(f"✅ Chat completion successful!")
-                print(f"   Response: {content}")
-                return True
-            elif r.status_code == 401:
-                print("❌ 401 Unauthorized")
-                print("   Run: ollama signin")
-                return False
-            elif r.status_code == 404:
-                print(f"❌ 404 Model not found")
-                print(f"   Run: ollama pull {model}")
-                return False
-            else:
-                print(f"❌ Error {r.status_code}: {r.text[:200]}")
-                return False
+        r = await client.post(url, json=payload, headers=headers, timeout=30.0)
+        
+        if r.status_code == 200:
+            result = r.json()
+            content = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+            print(f"✅ Chat completion successful!")
+            print(f"   Response: {content}")
+            return True
+        elif r.status_code == 401:
+            print("❌ 401 Unauthorized")
+            print("   Run: ollama signin")
+            return False
+        elif r.status_code == 404:
+            print(f"❌ 404 Model not found")
+            print(f"   Run: ollama pull {model}")
+            return False
+        else:
+            print(f"❌ Error {r.status_code}: {r.text[:200]}")
+            return False
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
 
+async def main():
+    try:
+        return await test_hybrid_setup()
+    finally:
+        await close_shared_client()
+
 if __name__ == "__main__":
-    success = asyncio.run(test_hybrid_setup())
+    success = asyncio.run(main())
     if success:
         print("\n" + "=" * 60)
         print("✅ All tests passed! Hybrid setup is working.")
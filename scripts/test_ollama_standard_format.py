@@ -2,7 +2,6 @@
 """Test Ollama Cloud with standard Ollama API format."""
 
 import asyncio
-import httpx
 import os
 import sys
 from pathlib import Path
@@ -13,6 +12,8 @@ sys.path.insert(0, str(project_root))
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.common.httpclient import get_shared_client, close_shared_client
+
 async def test_standard_format():
     api_key = os.getenv("OLLAMA_CLOUD_API_KEY")
     
@@ -23,6 +24,9 @@ async def test_standard_format():
         ("https://api.ollama.cloud/v1", "/chat/completions"),
     ]
     
+    # One pooled client: every probe after the first reuses the TLS connection
+    client = get_shared_client()
+    
     for base_url, endpoint in configs:
         print(f"\n{'='*60}")
         print(f"Testing: {base_url}{endpoint}")
@@ -53,31 +57,36 @@ async def test_standard_format():
         for i, payload in enumerate(payloads):
             print(f"\n  Payload format {i+1}: {list(payload.keys())}")
             try:
-                async with httpx.AsyncClient(verify=False, timeout=10.0) as client:
-                    r = await client.post(url, json=payload, headers=headers)
-                    print(f"  Status: {r.status_code}")
-                    if r.status_code == 200:
-                        result = r.json()
-                        print(f"  ✅ SUCCESS!")
-                        if "message" in result:
-                            print(f"  Response: {result['message'].get('content', '')}")
-                        elif "choices" in result:
-                            print(f"  Response: {result['choices'][0]['message']['content']}")
-                        else:
-                            print(f"  Response: {result}")
-                        return True
-                    elif r.status_code == 401:
-                        print(f"  ❌ 401 Unauthorized")
-                    elif r.status_code == 404:
-                        print(f"  ❌ 404 Not Found")
+                r = await client.post(url, json=payload, headers=headers, timeout=10.0)
+                print(f"  Status: {r.status_code}")
+                if r.status_code == 200:
+                    result = r.json()
+                    print(f"  ✅ SUCCESS!")
+                    if "message" in result:
+                        print(f"  Response: {result['message'].get('content', '')}")
+                    elif "choices" in result:
+                        print(f"  Response: {result['choices'][0]['message']['content']}")
                     else:
-                        print(f"  Response: {r.text[:200]}")
+                        print(f"  Response: {result}")
+                    return True
+                elif r.status_code == 401:
+                    print(f"  ❌ 401 Unauthorized")
+                elif r.status_code == 404:
+                    print(f"  ❌ 404 Not Found")
+                else:
+                    print(f"  Response: {r.text[:200]}")
             except Exception as e:
                 print(f"  ❌ Error: {e}")
     
     return False
 
+async def main():
+    try:
+        return await test_standard_format()
+    finally:
+        await close_shared_client()
+
 if __name__ == "__main__":
-    success = asyncio.run(test_standard_format())
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
 
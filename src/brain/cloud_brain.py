@@ -7,6 +7,8 @@ import json
 from typing import Optional, List, Dict, Any
 from dotenv import load_dotenv
 
+from src.common.httpclient import get_shared_client
+
 # Load environment variables
 load_dotenv()
 
@@ -34,7 +36,8 @@ class CloudBrain:
         self,
         base_url: Optional[str] = None,
         model: str = DEFAULT_MODEL,
-        timeout: float = 60.0
+        timeout: float = 60.0,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize Cloud Brain with local Ollama gateway.
@@ -43,32 +46,30 @@ class CloudBrain:
             base_url: Ollama API base URL (defaults to OLLAMA_BASE_URL env var or http://localhost:11434)
             model: Cloud model name (defaults to OLLAMA_CLOUD_MODEL env var or gpt-oss:120b-cloud)
             timeout: Request timeout in seconds
+            client: HTTP client to use (default: the shared pooled client)
         """
         # Use same base URL as LocalBrain - local Ollama gateway
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", self.DEFAULT_BASE_URL)
         self.model = model or os.getenv("OLLAMA_CLOUD_MODEL", self.DEFAULT_MODEL)
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
-        
-    async def __aenter__(self):
-        """Async context manager entry."""
-        timeout_config = httpx.Timeout(
+        self._timeout = httpx.Timeout(
             connect=10.0,
-            read=self.timeout,
+            read=timeout,
             write=10.0,
             pool=10.0
         )
-        # Create client with SSL verification enabled
-        self._client = httpx.AsyncClient(
-            timeout=timeout_config,
-            verify=True  # Enable SSL verification
-        )
+        self._injected_client = client
+        self._client: Optional[httpx.AsyncClient] = None
+        
+    async def __aenter__(self):
+        """Async context manager entry."""
+        # Shared pooled client (SSL verification enabled)
+        self._client = self._injected_client or get_shared_client()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        """Async context manager exit (the shared client stays open)."""
+        self._client = None
     
     def _convert_gemini_history_to_openai(
         self,
@@ -299,7 +300,8 @@ class CloudBrain:
             response = await self._client.post(
                 url,
                 json=payload,
-                headers=headers
+                headers=headers,
+                timeout=self._timeout
             )
             response.raise_for_status()
             result = response.json()
@@ -462,7 +464,8 @@ class CloudBrain:
             response = await self._client.post(
                 url,
                 json=payload,
-                headers=headers
+                headers=headers,
+                timeout=self._timeout
             )
             response.raise_for_status()
             result = response.json()
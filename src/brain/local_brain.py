@@ -1,12 +1,15 @@
 """Local Brain: Ollama-based local LLM client for fast, private inference."""
 
+import json
 import logging
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 from pathlib import Path
 import os
 from dotenv import load_dotenv
 
+from src.common.httpclient import get_shared_client
+
 # Load environment variables
 load_dotenv()
 
@@ -26,7 +29,8 @@ class LocalBrain:
         self,
         base_url: Optional[str] = None,
         default_model: str = "llama3.2:3b",
-        timeout: float = 600.0
+        timeout: float = 600.0,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize Local Brain with Ollama connection.
@@ -35,27 +39,29 @@ class LocalBrain:
             base_url: Ollama API base URL (defaults to http://localhost:11434)
             default_model: Default model to use for inference
             timeout: Request timeout in seconds (default 10 min for Pi 5)
+            client: HTTP client to use (default: the shared pooled client)
         """
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.default_model = default_model
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
-        
-    async def __aenter__(self):
-        """Async context manager entry."""
-        timeout_config = httpx.Timeout(
+        self._timeout = httpx.Timeout(
             connect=10.0,
-            read=self.timeout,
+            read=timeout,
             write=10.0,
             pool=10.0
         )
-        self._client = httpx.AsyncClient(timeout=timeout_config)
+        self._injected_client = client
+        self._client: Optional[httpx.AsyncClient] = None
+        
+    async def __aenter__(self):
+        """Async context manager entry."""
+        # Reuse pooled keep-alive connections instead of a client per session
+        self._client = self._injected_client or get_shared_client()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        """Async context manager exit (the shared client stays open)."""
+        self._client = None
             
     async def think(
         self,
@@ -87,25 +93,13 @@ class LocalBrain:
             
         model = model or self.default_model
         url = f"{self.base_url}/api/generate"
-        
-        # Build full prompt with system message if provided
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\nUser: {prompt}\nAssistant:"
-        
-        payload = {
-            "model": model,
-            "prompt": full_prompt,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens
-            }
-        }
+        payload = self._build_payload(
+            prompt, model, temperature, max_tokens, system_prompt, stream=False
+        )
         
         try:
             logger.info(f"LocalBrain: Thinking with {model}...")
-            response = await self._client.post(url, json=payload)
+            response = await self._client.post(url, json=payload, timeout=self._timeout)
             response.raise_for_status()
             result = response.json()
             
@@ -123,6 +117,88 @@ class LocalBrain:
             logger.error(f"LocalBrain: Unexpected error - {e}")
             raise
             
+    async def think_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 1000,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the local Ollama model, token by token.
+        
+        Same arguments as think(), but yields text deltas as Ollama produces
+        them instead of waiting for the full response.
+        
+        Yields:
+            Response text fragments
+            
+        Raises:
+            httpx.HTTPError: If Ollama request fails
+        """
+        if not self._client:
+            raise RuntimeError("LocalBrain must be used as async context manager")
+            
+        model = model or self.default_model
+        url = f"{self.base_url}/api/generate"
+        payload = self._build_payload(
+            prompt, model, temperature, max_tokens, system_prompt, stream=True
+        )
+        
+        logger.info(f"LocalBrain: Streaming with {model}...")
+        started = False
+        total_chars = 0
+        try:
+            async with self._client.stream(
+                "POST", url, json=payload, timeout=self._timeout
+            ) as response:
+                response.raise_for_status()
+                # Ollama streams one JSON object per line
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    text = chunk.get("response", "")
+                    if not started:
+                        # Match think(), which strips leading whitespace
+                        text = text.lstrip()
+                        started = bool(text)
+                    if text:
+                        total_chars += len(text)
+                        yield text
+                    if chunk.get("done"):
+                        break
+        except httpx.HTTPError as e:
+            logger.error(f"LocalBrain: HTTP error - {e}")
+            raise
+        logger.info(f"LocalBrain: Streamed {total_chars} chars")
+    
+    def _build_payload(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        system_prompt: Optional[str],
+        stream: bool
+    ) -> Dict[str, Any]:
+        """Build an /api/generate request payload."""
+        # Build full prompt with system message if provided
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\nUser: {prompt}\nAssistant:"
+        
+        return {
+            "model": model,
+            "prompt": full_prompt,
+            "stream": stream,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens
+            }
+        }
+            
     async def check_health(self) -> bool:
         """
         Check if Ollama service is running and accessible.
@@ -154,7 +230,7 @@ class LocalBrain:
             
         try:
             url = f"{self.base_url}/api/tags"
-            response = await self._client.get(url)
+            response = await self._client.get(url, timeout=self._timeout)
             response.raise_for_status()
             data = response.json()
             return [model["name"] for model in data.get("models", [])]
@@ -2,7 +2,8 @@
 
 import logging
 import json
-from typing import Optional, Tuple, List, Dict, Any
+import httpx
+from typing import Optional, Tuple, List, Dict, Any, AsyncIterator
 
 from src.brain.local_brain import LocalBrain
 from src.brain.cloud_brain import CloudBrain
@@ -35,7 +36,8 @@ class Orchestrator:
         cloud_model: Optional[str] = None,
         tool_registry: Optional[ToolRegistry] = None,
         rag_server: Optional["RAGServer"] = None,
-        use_rag: bool = True
+        use_rag: bool = True,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize orchestrator.
@@ -46,10 +48,12 @@ class Orchestrator:
             tool_registry: ToolRegistry instance (creates default if None)
             rag_server: RAGServer instance for long-term memory (optional)
             use_rag: Whether to use RAG context when available (default: True)
+            client: HTTP client for both brains (default: the shared pooled client)
         """
         self.router = Router(prefer_local=prefer_local)
         import os
         self.cloud_model = cloud_model or os.getenv("OLLAMA_CLOUD_MODEL", "gpt-oss:20b-cloud")
+        self.client = client
         self.local_brain: Optional[LocalBrain] = None
         self.cloud_brain: Optional[CloudBrain] = None
         
@@ -68,12 +72,12 @@ class Orchestrator:
         
     async def __aenter__(self):
         """Async context manager entry."""
-        self.local_brain = LocalBrain()
+        self.local_brain = LocalBrain(client=self.client)
         await self.local_brain.__aenter__()
         
         # Only initialize cloud brain if API key is available
         try:
-            self.cloud_brain = CloudBrain(model=self.cloud_model)
+            self.cloud_brain = CloudBrain(model=self.cloud_model, client=self.client)
             await self.cloud_brain.__aenter__()
         except ValueError as e:
             logger.warning(f"Cloud Brain not available: {e}")
@@ -114,21 +118,7 @@ class Orchestrator:
         Raises:
             RuntimeError: If neither brain is available
         """
-        # Retrieve RAG context if enabled
-        rag_context = None
-        rag_system_prompt = None
-        if (use_rag_context if use_rag_context is not None else self.use_rag):
-            rag_context = await self._get_rag_context(query)
-            if rag_context:
-                # Format RAG context as a system prompt that instructs the model to use it
-                num_chunks = len(rag_context.split('[Context')) - 1
-                rag_system_prompt = (
-                    f"You have access to the following context documents retrieved from the user's knowledge base. "
-                    f"Please use this information to answer the user's question. If the context contains relevant information, "
-                    f"cite it in your response. If the context doesn't contain enough information, you can say so.\n\n"
-                    f"Context Documents:\n{rag_context}\n"
-                )
-                logger.info(f"RAG: Retrieved {num_chunks} context chunks, formatted as system prompt")
+        rag_system_prompt = await self._build_rag_system_prompt(query, use_rag_context)
         
         # Use original query (RAG context is in system prompt)
         enhanced_query = query
@@ -166,6 +156,89 @@ class Orchestrator:
         )
         return response, InferenceTarget.LOCAL, tool_calls_made
     
+    async def think_stream(
+        self,
+        query: str,
+        context_size: int = 0,
+        task_hint: Optional[str] = None,
+        force_target: Optional[InferenceTarget] = None,
+        max_tool_iterations: int = 3,
+        use_rag_context: Optional[bool] = None
+    ) -> Tuple[AsyncIterator[str], InferenceTarget, List[Dict[str, Any]]]:
+        """
+        Like think(), but returns the response as a stream of text fragments.
+        
+        Local Brain responses are streamed token by token as Ollama generates
+        them. Cloud Burst responses go through the tool-calling loop, so the
+        final answer is only known once the loop completes and is yielded as
+        a single fragment.
+        
+        Args:
+            Same as think()
+            
+        Returns:
+            Tuple of (response_stream, target_used, tool_calls_made)
+            
+        Raises:
+            RuntimeError: If neither brain is available
+        """
+        rag_system_prompt = await self._build_rag_system_prompt(query, use_rag_context)
+        target = self.router.route(query, context_size, task_hint, force_target)
+        
+        if target == InferenceTarget.CLOUD:
+            if not self.cloud_brain:
+                logger.warning("Cloud Brain not available, falling back to Local Brain")
+            else:
+                logger.info(f"Orchestrator: Using Cloud Burst ({self.cloud_model})")
+                response, tool_calls = await self._think_with_tools(
+                    query,
+                    max_tool_iterations,
+                    system_prompt=rag_system_prompt
+                )
+                return self._single_chunk(response), InferenceTarget.CLOUD, tool_calls
+                
+        if not self.local_brain:
+            raise RuntimeError("Local Brain is not available")
+            
+        logger.info("Orchestrator: Streaming from Local Brain (Llama 3.2 3B)")
+        stream = self.local_brain.think_stream(query, system_prompt=rag_system_prompt)
+        return stream, InferenceTarget.LOCAL, []
+    
+    @staticmethod
+    async def _single_chunk(text: str) -> AsyncIterator[str]:
+        """Wrap a complete response as a one-fragment stream."""
+        yield text
+    
+    async def _build_rag_system_prompt(
+        self,
+        query: str,
+        use_rag_context: Optional[bool] = None
+    ) -> Optional[str]:
+        """
+        Retrieve RAG context and format it as a system prompt.
+        
+        Args:
+            query: User query
+            use_rag_context: Override RAG usage for this query (None = use default)
+            
+        Returns:
+            System prompt with context documents, or None if no context
+        """
+        if not (use_rag_context if use_rag_context is not None else self.use_rag):
+            return None
+        rag_context = await self._get_rag_context(query)
+        if not rag_context:
+            return None
+        # Format RAG context as a system prompt that instructs the model to use it
+        num_chunks = len(rag_context.split('[Context')) - 1
+        logger.info(f"RAG: Retrieved {num_chunks} context chunks, formatted as system prompt")
+        return (
+            f"You have access to the following context documents retrieved from the user's knowledge base. "
+            f"Please use this information to answer the user's question. If the context contains relevant information, "
+            f"cite it in your response. If the context doesn't contain enough information, you can say so.\n\n"
+            f"Context Documents:\n{rag_context}\n"
+        )
+    
     async def _get_rag_context(self, query: str) -> Optional[str]:
         """
         Retrieve RAG context for a query.
@@ -1,9 +1,16 @@
 """Router: Decides between local and cloud inference based on complexity."""
 
 import logging
-from typing import Literal, Optional
+import re
+from typing import Literal, Optional, Iterable
 from enum import Enum
 
+# Optional Aho-Corasick automaton for keyword matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,6 +20,50 @@ class InferenceTarget(str, Enum):
     CLOUD = "cloud"
 
 
+class KeywordMatcher:
+    """
+    Counts how many distinct keywords occur in a (lower-cased) text.
+    
+    With pyahocorasick installed, all keywords are matched in a single pass
+    over the text, independent of how many keywords there are. Otherwise it
+    falls back to one substring scan per keyword.
+    
+    For plain "does any keyword occur" checks, search() runs a single
+    precompiled case-insensitive regex, so the query needn't be lower-cased.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the matcher.
+        
+        Args:
+            keywords: Lower-case keywords to look for
+        """
+        self.keywords = list(dict.fromkeys(keywords))
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        # Longest first, so overlapping keywords report the most specific match
+        alternation = "|".join(
+            re.escape(keyword) for keyword in sorted(self.keywords, key=len, reverse=True)
+        )
+        self._pattern = re.compile(alternation, re.IGNORECASE)
+    
+    def count(self, text: str) -> int:
+        """Number of distinct keywords that occur in text."""
+        if self._automaton is not None:
+            return len({keyword for _, keyword in self._automaton.iter(text)})
+        return sum(1 for keyword in self.keywords if keyword in text)
+    
+    def search(self, text: str) -> Optional[str]:
+        """First keyword found in text (any case), or None."""
+        match = self._pattern.search(text)
+        return match.group(0).lower() if match else None
+
+
 class Router:
     """
     Router decides whether to use local (Ollama) or cloud (Ollama Cloud) inference.
@@ -82,6 +133,11 @@ class Router:
         self.max_local_context = max_local_context
         self.route_tools_to_cloud = route_tools_to_cloud
         
+        # Keyword matchers are built once and reused for every query
+        self._complex_matcher = KeywordMatcher(self.COMPLEX_KEYWORDS)
+        self._tool_matcher = KeywordMatcher(self.TOOL_KEYWORDS)
+        self._simple_matcher = KeywordMatcher(self.SIMPLE_KEYWORDS)
+        
     def route(
         self,
         query: str,
@@ -124,11 +180,11 @@ class Router:
         query_lower = query.lower()
         
         # Check for complex keywords
-        complex_score = sum(1 for keyword in self.COMPLEX_KEYWORDS if keyword in query_lower)
-        simple_score = sum(1 for keyword in self.SIMPLE_KEYWORDS if keyword in query_lower)
+        complex_score = self._complex_matcher.count(query_lower)
+        simple_score = self._simple_matcher.count(query_lower)
         
-        # Check for tool-requiring keywords
-        tool_score = sum(1 for keyword in self.TOOL_KEYWORDS if keyword in query_lower)
+        # Check for tool-requiring keywords (only presence matters)
+        tool_keyword = self._tool_matcher.search(query)
         
         # Routing logic (prioritized):
         # 1. High complexity → cloud
@@ -145,9 +201,9 @@ class Router:
             # Tool keywords → cloud (only if route_tools_to_cloud is enabled)
             # TODO: Once local brain supports function calling, we can route simple
             # tool queries (like "what's the weather?") to local first
-            if tool_score > 0 and self.route_tools_to_cloud:
+            if tool_keyword and self.route_tools_to_cloud:
                 logger.info(
-                    f"Router: Tool-requiring query (keywords={tool_score}) -> CLOUD "
+                    f"Router: Tool-requiring query (keyword='{tool_keyword}') -> CLOUD "
                     f"(local brain doesn't support function calling yet)"
                 )
                 return InferenceTarget.CLOUD
@@ -159,7 +215,7 @@ class Router:
             # If not preferring local, use cloud for anything non-trivial
             if complex_score > 0 or context_size > self.MEDIUM_CONTEXT_THRESHOLD:
                 return InferenceTarget.CLOUD
-            elif tool_score > 0:
+            elif tool_keyword:
                 return InferenceTarget.CLOUD
             else:
                 return InferenceTarget.LOCAL
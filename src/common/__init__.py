@@ -0,0 +1,5 @@
+"""Common: Shared infrastructure used across Mini-JARVIS components."""
+
+from src.common.httpclient import get_shared_client, close_shared_client
+
+__all__ = ["get_shared_client", "close_shared_client"]
@@ -0,0 +1,51 @@
+"""HTTP Client: Shared connection-pooled httpx client for outbound requests."""
+
+import asyncio
+import logging
+import weakref
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool shared by brains, tools and embedding calls
+DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# Callers pass their own per-request timeouts; this is only the fallback
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# One client per event loop: httpx connections are bound to the loop that
+# opened them, and scripts/tests may run several loops in one process
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient for the running event loop.
+    
+    The client is created on first use and keeps connections alive between
+    requests, so repeated calls to Ollama and external APIs skip the TCP/TLS
+    handshake. Don't close it directly; use close_shared_client().
+    
+    Returns:
+        Shared httpx.AsyncClient
+        
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=DEFAULT_LIMITS, timeout=DEFAULT_TIMEOUT)
+        _clients[loop] = client
+        logger.debug("Created shared HTTP client")
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client for the running event loop (if any)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
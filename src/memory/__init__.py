@@ -1,8 +1,8 @@
 """RAG Pipeline: Long-term memory for Mini-JARVIS."""
 
-from src.memory.rag_server import RAGServer
+from src.memory.rag_server import RAGServer, get_default_rag_server
 from src.memory.document_ingester import DocumentIngester
 from src.memory.retriever import Retriever
 
-__all__ = ["RAGServer", "DocumentIngester", "Retriever"]
+__all__ = ["RAGServer", "DocumentIngester", "Retriever", "get_default_rag_server"]
 
@@ -0,0 +1,114 @@
+"""Batched Embedder: Coalesce concurrent single-text embeddings into one encode()."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BATCH_SIZE = 32
+DEFAULT_MAX_WAIT = 0.05  # seconds
+
+
+class BatchedEmbedder:
+    """
+    Dynamic batching in front of a batch embedding function.
+
+    Each embed() call queues its text; one background task takes the first
+    queued text, waits up to `max_wait` for more (or until `max_batch_size`),
+    and embeds them all in a single call. Concurrent retrievals then share
+    one model forward pass instead of running one each, at the cost of up
+    to `max_wait` extra latency for a lone query.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], Awaitable[List[List[float]]]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT
+    ):
+        """
+        Initialize batched embedder.
+
+        Args:
+            embed_batch: Coroutine function embedding a list of texts
+            max_batch_size: Most texts per embed_batch() call
+            max_wait: Seconds to wait for more texts after the first arrives
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"Invalid max_batch_size: {max_batch_size}. Must be >= 1")
+        if max_wait < 0:
+            raise ValueError(f"Invalid max_wait: {max_wait}. Must be >= 0")
+
+        self.embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed one text, batched with any other concurrent calls.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        loop = asyncio.get_running_loop()
+        # One worker per event loop (scripts may call asyncio.run() repeatedly)
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+
+        future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for one queued text, then gather more until full or max_wait passes."""
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Background task: embed queued texts batch by batch."""
+        while True:
+            batch = await self._collect(queue)
+            texts = [text for text, _ in batch]
+            logger.debug(f"Embedding batch of {len(texts)} queued texts")
+            try:
+                embeddings = await self.embed_batch(texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():  # Caller may have been cancelled
+                    future.set_result(embedding)
+
+    async def close(self) -> None:
+        """Stop the background task."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
@@ -2,12 +2,250 @@
 
 import logging
 import asyncio
+import bisect
+import io
+import mmap
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 import re
 
+import numpy as np
+
+from src.memory.onnx_embedder import EMBEDDER_BACKENDS, OnnxEmbedder
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
+# Sentence endings chunks prefer to break at (lookahead finds overlapping
+# matches, e.g. both positions in "\n\n\n", like str.rfind would)
+_SENTENCE_END_RE = re.compile(r"(?=\. |! |\? |\n\n)")
+_SENTENCE_END_LEN = 2
+_SENTENCE_END_LITERALS = [rb"\. ", rb"! ", rb"\? ", rb"\n\n"]
+_sentence_end_db = None
+
+
+def _hyperscan_sentence_ends(data: bytes) -> List[int]:
+    """Offsets of every sentence ending, found in one Hyperscan DFA pass."""
+    global _sentence_end_db
+    if _sentence_end_db is None:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=_SENTENCE_END_LITERALS,
+            ids=list(range(len(_SENTENCE_END_LITERALS))),
+            elements=len(_SENTENCE_END_LITERALS)
+        )
+        _sentence_end_db = db
+    
+    ends: List[int] = []
+    def on_match(pattern_id, start, end, flags, context):
+        ends.append(end - _SENTENCE_END_LEN)  # Hyperscan reports match ends
+    _sentence_end_db.scan(data, match_event_handler=on_match)
+    ends.sort()
+    return ends
+
+
+def sentence_ends(text: str) -> List[int]:
+    """
+    Find the start offset of every sentence ending in text, in order.
+    
+    Uses Hyperscan when installed (pip install hyperscan) for ASCII text,
+    where its byte offsets are character offsets; otherwise re.
+    """
+    if hyperscan is not None and text.isascii():
+        return _hyperscan_sentence_ends(text.encode("ascii"))
+    return [m.start() for m in _SENTENCE_END_RE.finditer(text)]
+
+
+# Use lightweight model for Raspberry Pi
+# all-MiniLM-L6-v2 is ~80MB and works well on CPU
+SENTENCE_TRANSFORMER_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Text prefixes for asymmetric retrieval models (e.g. E5 expects "query: " and
+# "passage: "). all-MiniLM-L6-v2 was trained on symmetric pairs, and the
+# chunks already stored were embedded without one, so both are empty here.
+QUERY_PREFIX = ""
+PASSAGE_PREFIX = ""
+
+
+def format_query(text: str) -> str:
+    """Prepare a query for embedding."""
+    return QUERY_PREFIX + text
+
+
+def format_passage(text: str) -> str:
+    """Prepare a document chunk for embedding."""
+    return PASSAGE_PREFIX + text
+
+
+# Loaded models keyed by (backend, model, device), shared by every
+# DocumentIngester and Retriever in the process
+_MODEL_CACHE: Dict[Tuple[str, str, str], Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def get_embedding_model(
+    embedder_backend: str = "sentence-transformers",
+    device: str = "cpu",
+    onnx_model_dir: Optional[str] = None
+):
+    """
+    Load an embedding model once per process.
+    
+    Blocking (reads the weights from disk), so call it from an executor.
+    
+    Args:
+        embedder_backend: 'sentence-transformers' or 'onnx-int8'
+        device: Resolved torch device (sentence-transformers only)
+        onnx_model_dir: Quantized model directory (onnx-int8 only)
+        
+    Returns:
+        SentenceTransformer or OnnxEmbedder
+    """
+    if embedder_backend == "onnx-int8":
+        key = (embedder_backend, str(onnx_model_dir), "cpu")
+        factory = lambda: OnnxEmbedder(onnx_model_dir)
+    else:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "Local embeddings require sentence-transformers. "
+                "Install with: pip install sentence-transformers"
+            )
+        key = (embedder_backend, SENTENCE_TRANSFORMER_MODEL, device)
+        factory = lambda: SentenceTransformer(SENTENCE_TRANSFORMER_MODEL, device=device)
+    
+    # Held while loading so concurrent first calls don't load twice
+    with _MODEL_CACHE_LOCK:
+        if key not in _MODEL_CACHE:
+            _MODEL_CACHE[key] = factory()
+        return _MODEL_CACHE[key]
+
+
+# Model loaded by _init_embed_worker() in each embedding worker process
+_worker_model = None
+
+
+def _init_embed_worker(
+    embedder_backend: str,
+    device: str,
+    onnx_model_dir: Optional[str]
+) -> None:
+    """Process pool initializer: load one single-threaded model per worker."""
+    global _worker_model
+    # N workers x 1 thread each, instead of N workers all using every core
+    try:
+        import torch
+        torch.set_num_threads(1)
+    except ImportError:
+        pass
+    if embedder_backend == "onnx-int8":
+        _worker_model = OnnxEmbedder(onnx_model_dir, num_threads=1)
+    else:
+        _worker_model = get_embedding_model(embedder_backend, device)
+
+
+def _embed_in_worker(texts: List[str], batch_size: int) -> np.ndarray:
+    """Embed a slice of chunks in a worker process."""
+    return _worker_model.encode(
+        texts,
+        batch_size=batch_size,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
+
+
+def _split_evenly(items: List[str], n: int) -> List[List[str]]:
+    """Split items into at most n contiguous, near-equal, non-empty slices."""
+    size, extra = divmod(len(items), n)
+    slices = []
+    start = 0
+    for i in range(n):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            slices.append(items[start:end])
+        start = end
+    return slices
+
+
+@dataclass
+class ChunkBatch:
+    """
+    Chunks for one ingestion run, stored column-wise.
+
+    ChromaDB's add() takes parallel ids/documents/embeddings/metadatas
+    lists, so chunks are appended straight into those columns instead of
+    building a dict per chunk and transposing at the ChromaDB boundary.
+    Embeddings are one float32 (N, dim) array, filled after chunking.
+    """
+
+    ids: List[str] = field(default_factory=list)
+    texts: List[str] = field(default_factory=list)
+    metadatas: List[Dict[str, Any]] = field(default_factory=list)
+    embeddings: Optional[np.ndarray] = None
+
+    def append(self, chunk_id: str, text: str, metadata: Dict[str, Any]) -> None:
+        """Append one chunk to every column."""
+        self.ids.append(chunk_id)
+        self.texts.append(text)
+        self.metadatas.append(metadata)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def chunk_starts(text_length: int, chunk_size: int, chunk_overlap: int) -> range:
+    """
+    Start offsets of the chunks _chunk_text() produces for a text.
+    
+    Args:
+        text_length: Length of the text (characters)
+        chunk_size: Size of each chunk (characters)
+        chunk_overlap: Overlap between chunks (characters)
+        
+    Returns:
+        Range of start offsets (stride = chunk_size - chunk_overlap)
+    """
+    stride = chunk_size - chunk_overlap
+    if stride <= 0:
+        raise ValueError(
+            f"Invalid chunk_overlap: {chunk_overlap}. Must be smaller than chunk_size ({chunk_size})"
+        )
+    if text_length <= chunk_size:
+        return range(0, 1)
+    return range(0, text_length, stride)
+
+
+def resolve_embedding_device(device: str = "auto") -> str:
+    """
+    Resolve the torch device for sentence-transformers.
+    
+    Args:
+        device: 'cpu', 'cuda', 'mps', or 'auto' (MPS, then CUDA, then CPU)
+        
+    Returns:
+        Concrete device name
+    """
+    if device != "auto":
+        return device
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    if torch.backends.mps.is_available():
+        return "mps"
+    if torch.cuda.is_available():
+        return "cuda"
+    return "cpu"
+
 
 class DocumentIngester:
     """
@@ -19,15 +257,43 @@ class DocumentIngester:
     - PDF files (.pdf) - requires PyPDF2 or pdfplumber
     """
     
-    def __init__(self):
-        """Initialize document ingester."""
+    # Texts per forward pass when embedding (sentence-transformers defaults to 32)
+    EMBED_BATCH_SIZE = 64
+    # Text files at least this large are decoded straight from a memory map
+    MMAP_MIN_BYTES = 1 << 20
+    
+    def __init__(
+        self,
+        embedder_backend: str = "sentence-transformers",
+        onnx_model_dir: Optional[str] = None,
+        device: str = "cpu"
+    ):
+        """
+        Initialize document ingester.
+        
+        Args:
+            embedder_backend: 'sentence-transformers' (PyTorch) or 'onnx-int8'
+                              (INT8-quantized ONNX Runtime, faster on CPU)
+            onnx_model_dir: Quantized model directory (onnx-int8 only)
+            device: Torch device for sentence-transformers: 'cpu', 'cuda',
+                    'mps' or 'auto' (ignored by onnx-int8, which runs on CPU)
+        """
+        if embedder_backend not in EMBEDDER_BACKENDS:
+            raise ValueError(
+                f"Invalid embedder_backend: {embedder_backend}. "
+                f"Must be one of {EMBEDDER_BACKENDS}"
+            )
+        self.embedder_backend = embedder_backend
+        self.onnx_model_dir = onnx_model_dir
+        self.device = device
         self._embedding_model = None
     
     async def ingest_file(
         self,
         file_path: str,
         chunk_size: int = 1000,
-        chunk_overlap: int = 200
+        chunk_overlap: int = 200,
+        pdf_executor: Optional[Executor] = None
     ) -> Tuple[List[str], List[Dict[str, Any]]]:
         """
         Load and chunk a document file.
@@ -36,6 +302,7 @@ class DocumentIngester:
             file_path: Path to document file
             chunk_size: Size of chunks (characters)
             chunk_overlap: Overlap between chunks (characters)
+            pdf_executor: Executor for PDF text extraction (default: thread pool)
             
         Returns:
             Tuple of (chunks, metadatas)
@@ -57,10 +324,55 @@ class DocumentIngester:
         elif ext == ".md":
             text = await self._load_text(path)
         elif ext == ".pdf":
-            text = await self._load_pdf(path)
+            text = await self._load_pdf(path, pdf_executor)
         else:
             raise ValueError(f"Unsupported file type: {ext}")
         
+        return self._chunk_document(path.name, ext, text, chunk_size, chunk_overlap)
+    
+    async def ingest_content(
+        self,
+        name: str,
+        content: bytes,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        pdf_executor: Optional[Executor] = None
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Load and chunk a document already in memory (e.g. just downloaded),
+        without writing it to disk first.
+        
+        Args:
+            name: File name or path (its extension selects the loader)
+            content: Raw file content
+            chunk_size: Size of chunks (characters)
+            chunk_overlap: Overlap between chunks (characters)
+            pdf_executor: Executor for PDF text extraction (default: thread pool)
+            
+        Returns:
+            Tuple of (chunks, metadatas)
+        """
+        logger.info(f"Ingesting in-memory file: {name} ({len(content)} bytes)")
+        ext = Path(name).suffix.lower()
+        
+        if ext in (".txt", ".md"):
+            text = self._decode_text(content)
+        elif ext == ".pdf":
+            text = await self._load_pdf(content, pdf_executor)
+        else:
+            raise ValueError(f"Unsupported file type: {ext}")
+        
+        return self._chunk_document(Path(name).name, ext, text, chunk_size, chunk_overlap)
+    
+    def _chunk_document(
+        self,
+        name: str,
+        ext: str,
+        text: str,
+        chunk_size: int,
+        chunk_overlap: int
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Chunk a loaded document and build each chunk's metadata."""
         logger.info(f"Loaded {len(text)} characters from file")
         print(f"   [INFO] Loaded {len(text)} characters, chunking...")
         import sys
@@ -77,7 +389,7 @@ class DocumentIngester:
         metadatas = []
         for i, chunk in enumerate(chunks):
             metadatas.append({
-                "source": path.name,
+                "source": name,
                 "file_type": ext[1:],  # Remove leading dot
                 "total_chunks": len(chunks)
             })
@@ -87,12 +399,32 @@ class DocumentIngester:
     async def _load_text(self, path: Path) -> str:
         """Load text or markdown file."""
         loop = asyncio.get_event_loop()
-        with open(path, "r", encoding="utf-8") as f:
-            text = await loop.run_in_executor(None, f.read)
+        # Open and read in the executor so concurrent loads never block the loop
+        return await loop.run_in_executor(None, self._read_text, path)
+    
+    @classmethod
+    def _read_text(cls, path: Path) -> str:
+        """
+        Read a UTF-8 file with universal newlines.
+        
+        Large files are decoded from a memory map, skipping the intermediate
+        bytes copy read_text() makes (the page cache is decoded directly).
+        """
+        if path.stat().st_size < cls.MMAP_MIN_BYTES:
+            return path.read_text(encoding="utf-8")
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return cls._decode_text(mapped)
+    
+    @staticmethod
+    def _decode_text(data) -> str:
+        """Decode UTF-8 bytes (or any buffer) with universal newlines, like read_text()."""
+        text = str(data, "utf-8")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
         return text
     
-    async def _load_pdf(self, path: Path) -> str:
-        """Load PDF file."""
+    async def _load_pdf(self, path: Union[Path, bytes], executor: Optional[Executor] = None) -> str:
+        """Load PDF file or content (text extraction runs in executor, or the default thread pool)."""
         try:
             import PyPDF2
         except ImportError:
@@ -104,29 +436,30 @@ class DocumentIngester:
                     "Install with: pip install PyPDF2"
                 )
         
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, self._extract_pdf_text, path)
+    
+    @staticmethod
+    def _extract_pdf_text(path: Union[Path, bytes]) -> str:
+        """Extract text from all PDF pages (blocking, run in an executor or worker process)."""
+        if isinstance(path, bytes):
+            path = io.BytesIO(path)
         # Try pdfplumber first (better text extraction)
         try:
             import pdfplumber
-            loop = asyncio.get_event_loop()
-            text_parts = []
             with pdfplumber.open(path) as pdf:
-                for page in pdf.pages:
-                    page_text = await loop.run_in_executor(None, page.extract_text)
-                    if page_text:
-                        text_parts.append(page_text)
-            return "\n\n".join(text_parts)
+                text_parts = [page.extract_text() for page in pdf.pages]
         except ImportError:
             # Fallback to PyPDF2
             import PyPDF2
-            loop = asyncio.get_event_loop()
-            text_parts = []
-            with open(path, "rb") as f:
-                pdf_reader = PyPDF2.PdfReader(f)
-                for page in pdf_reader.pages:
-                    page_text = await loop.run_in_executor(None, page.extract_text)
-                    if page_text:
-                        text_parts.append(page_text)
-            return "\n\n".join(text_parts)
+            if isinstance(path, io.BytesIO):
+                pdf_reader = PyPDF2.PdfReader(path)
+                text_parts = [page.extract_text() for page in pdf_reader.pages]
+            else:
+                with open(path, "rb") as f:
+                    pdf_reader = PyPDF2.PdfReader(f)
+                    text_parts = [page.extract_text() for page in pdf_reader.pages]
+        return "\n\n".join(part for part in text_parts if part)
     
     def _chunk_text(
         self,
@@ -151,40 +484,34 @@ class DocumentIngester:
             logger.debug("Text fits in single chunk, returning as-is")
             return [text]
         
-        chunks = []
-        start = 0
-        stride = chunk_size - chunk_overlap  # Amount to advance each iteration
+        # Find every sentence ending once, then look up the last one in each
+        # window instead of rescanning each window for each separator
+        ends = sentence_ends(text)
         
-        while start < len(text):
+        chunks = []
+        for start in chunk_starts(len(text), chunk_size, chunk_overlap):
             end = min(start + chunk_size, len(text))
             
             # Try to break at sentence boundary (optional optimization)
             if end < len(text):
-                # Look for sentence endings near the end
-                sentence_end = max(
-                    text.rfind(". ", start, end),
-                    text.rfind("! ", start, end),
-                    text.rfind("? ", start, end),
-                    text.rfind("\n\n", start, end)
-                )
-                
-                if sentence_end > start:
-                    end = sentence_end + 1
+                # Last sentence ending that fits entirely inside [start, end)
+                i = bisect.bisect_right(ends, end - _SENTENCE_END_LEN) - 1
+                if i >= 0 and ends[i] > start:
+                    end = ends[i] + 1
             
             chunk = text[start:end].strip()
             if chunk:
                 chunks.append(chunk)
-            
-            # Advance by stride (chunk_size - overlap) for proper overlapping chunks
-            start += stride
-            
-            # Safety check: ensure we always advance
-            if start >= len(text):
-                break
         
         return chunks
     
-    async def embed_chunks(self, chunks: List[str]) -> List[List[float]]:
+    async def embed_chunks(
+        self,
+        chunks: List[str],
+        jobs: int = 1,
+        as_array: bool = False,
+        batch_size: Optional[int] = None
+    ) -> List[List[float]]:
         """
         Generate embeddings for text chunks.
         
@@ -197,13 +524,22 @@ class DocumentIngester:
         
         Args:
             chunks: List of text chunks
+            jobs: Worker processes to embed with (1 = in this process)
+            as_array: Return one float32 (N, dim) array instead of lists
+            batch_size: Texts per forward pass (default: EMBED_BATCH_SIZE)
             
         Returns:
-            List of embedding vectors
+            List of embedding vectors (or an array, with as_array)
         """
+        if PASSAGE_PREFIX:
+            chunks = [format_passage(chunk) for chunk in chunks]
         # Try local embedding model first (384 dimensions)
         try:
-            return await self._embed_local(chunks)
+            batch_size = batch_size or self.EMBED_BATCH_SIZE
+            if jobs > 1 and len(chunks) > 1:
+                embeddings = await self._embed_parallel(chunks, jobs, batch_size)
+            else:
+                embeddings = await self._embed_local_array(chunks, batch_size)
         except Exception as e:
             logger.warning(f"Local embedding failed: {e}")
             # Don't use API fallback if local fails - dimension mismatch will break ChromaDB
@@ -213,22 +549,63 @@ class DocumentIngester:
                 "Local embeddings are required for consistent dimension (384). "
                 "Install sentence-transformers: pip install sentence-transformers"
             ) from e
+        return embeddings if as_array else embeddings.tolist()
     
-    async def _embed_local(self, chunks: List[str]) -> List[List[float]]:
-        """Generate embeddings using local model."""
-        try:
-            from sentence_transformers import SentenceTransformer
-        except ImportError:
-            raise ImportError(
-                "Local embeddings require sentence-transformers. "
-                "Install with: pip install sentence-transformers"
-            )
+    async def _embed_parallel(
+        self,
+        chunks: List[str],
+        jobs: int,
+        batch_size: int = EMBED_BATCH_SIZE
+    ) -> np.ndarray:
+        """
+        Embed chunks across worker processes, one model replica per worker.
         
-        # Use lightweight model for Raspberry Pi
-        # all-MiniLM-L6-v2 is ~80MB and works well on CPU
-        model_name = "sentence-transformers/all-MiniLM-L6-v2"
+        Encoding is CPU-bound and a single model doesn't scale across all
+        cores, so contiguous slices are embedded in parallel and
+        concatenated back in order.
+        """
+        if self.embedder_backend != "onnx-int8":
+            self.device = resolve_embedding_device(self.device)
+        slices = _split_evenly(chunks, jobs)
+        logger.info(f"Embedding {len(chunks)} chunks in {len(slices)} worker processes")
+        print(f"   [INFO] Embedding {len(chunks)} chunks in {len(slices)} worker processes...")
         
+        loop = asyncio.get_event_loop()
+        # spawn, not fork: forking a process with torch/BLAS threads can deadlock
+        with ProcessPoolExecutor(
+            max_workers=len(slices),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_embed_worker,
+            initargs=(self.embedder_backend, self.device, self.onnx_model_dir)
+        ) as pool:
+            parts = await asyncio.gather(
+                *(loop.run_in_executor(pool, _embed_in_worker, part, batch_size) for part in slices)
+            )
+        return np.concatenate(parts).astype(np.float32, copy=False)
+    
+    def _model_loader(self):
+        """Return (model_name, loader) for the configured embedding backend."""
+        if self.embedder_backend == "onnx-int8":
+            model_name = "all-MiniLM-L6-v2 (ONNX INT8)"
+        else:
+            self.device = resolve_embedding_device(self.device)
+            model_name = f"{SENTENCE_TRANSFORMER_MODEL} ({self.device})"
+        return model_name, lambda: get_embedding_model(
+            self.embedder_backend, self.device, self.onnx_model_dir
+        )
+    
+    async def _embed_local(self, chunks: List[str]) -> List[List[float]]:
+        """Generate embeddings using local model."""
+        return (await self._embed_local_array(chunks)).tolist()
+    
+    async def _embed_local_array(
+        self,
+        chunks: List[str],
+        batch_size: int = EMBED_BATCH_SIZE
+    ) -> np.ndarray:
+        """Generate embeddings using local model, as a float32 (N, dim) array."""
         if self._embedding_model is None:
+            model_name, load_model = self._model_loader()
             logger.info(f"Loading embedding model: {model_name}")
             print(f"   [INFO] Loading embedding model: {model_name}")
             print(f"   [INFO] Model loading can take 1-3 minutes on Pi5...")
@@ -240,11 +617,7 @@ class DocumentIngester:
             try:
                 # Use wait_for to add timeout protection
                 self._embedding_model = await asyncio.wait_for(
-                    loop.run_in_executor(
-                        None,
-                        SentenceTransformer,
-                        model_name
-                    ),
+                    loop.run_in_executor(None, load_model),
                     timeout=300  # 5 minute timeout for model loading
                 )
                 print(f"   [INFO] Model loaded successfully!")
@@ -263,20 +636,42 @@ class DocumentIngester:
         print(f"   [INFO] Generating embeddings for {len(chunks)} chunks...")
         loop = asyncio.get_event_loop()
         # sentence-transformers encode() takes normalize_embeddings as a keyword arg
+        # On GPU, keep the batch as a tensor and copy it to the host once
+        # instead of once per encode batch
+        on_gpu = self.embedder_backend != "onnx-int8" and self.device not in ("cpu", "auto")
         def encode_chunks():
-            return self._embedding_model.encode(
+            embeddings = self._embedding_model.encode(
                 chunks,
+                batch_size=batch_size,
                 normalize_embeddings=True,  # Normalize for cosine similarity
-                show_progress_bar=False  # Disable progress bar in executor
+                show_progress_bar=False,  # Disable progress bar in executor
+                **({"convert_to_tensor": True} if on_gpu else {})
             )
+            return embeddings.cpu().numpy() if on_gpu else embeddings
         embeddings = await loop.run_in_executor(None, encode_chunks)
         logger.info(f"Generated {len(embeddings)} embeddings")
         print(f"   [INFO] Generated {len(embeddings)} embeddings")
         
-        return embeddings.tolist()
+        return np.asarray(embeddings, dtype=np.float32)
     
-    async def _embed_api(self, chunks: List[str]) -> List[List[float]]:
-        """Generate embeddings using API (fallback)."""
+    async def _embed_api(
+        self,
+        chunks: List[str],
+        concurrency: int = 8
+    ) -> List[List[float]]:
+        """
+        Generate embeddings using API (fallback).
+        
+        The API embeds one chunk per request, so requests are fanned out
+        concurrently (bounded by a semaphore) instead of awaited one by one.
+        
+        Args:
+            chunks: List of text chunks
+            concurrency: Maximum number of in-flight embedding requests
+            
+        Returns:
+            List of embedding vectors (same order as chunks)
+        """
         import os
         from dotenv import load_dotenv
         
@@ -291,14 +686,16 @@ class DocumentIngester:
             )
         
         # Use Gemini's embedding API
-        import httpx
-        
-        async with httpx.AsyncClient() as client:
-            embeddings = []
-            for chunk in chunks:
-                # Gemini embedding API endpoint
-                url = f"https://generativelanguage.googleapis.com/v1beta/models/embedding-001:embedContent?key={api_key}"
-                
+        from src.common.httpclient import get_shared_client
+        
+        # Gemini embedding API endpoint
+        url = f"https://generativelanguage.googleapis.com/v1beta/models/embedding-001:embedContent?key={api_key}"
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        client = get_shared_client()
+        
+        async def embed_one(chunk: str) -> List[float]:
+            async with semaphore:
                 response = await client.post(
                     url,
                     json={
@@ -306,9 +703,9 @@ class DocumentIngester:
                         "content": {"parts": [{"text": chunk}]}
                     }
                 )
-                response.raise_for_status()
-                data = response.json()
-                embeddings.append(data["embedding"]["values"])
-            
-            return embeddings
-
+            response.raise_for_status()
+            data = response.json()
+            return data["embedding"]["values"]
+        
+        # gather() preserves input order, so embeddings line up with chunks
+        return await asyncio.gather(*(embed_one(chunk) for chunk in chunks))
@@ -0,0 +1,433 @@
+"""FAISS Backend: Approximate nearest-neighbour search for RAG retrieval."""
+
+import hashlib
+import logging
+import math
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+try:
+    import faiss
+    import numpy as np
+except ImportError:
+    faiss = None
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# HNSW graph parameters for index_type='hnsw'
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 200
+HNSW_EF_SEARCH = 64
+
+
+def _faiss_id(chunk_id: str) -> int:
+    """Map a ChromaDB string ID to a stable signed 64-bit FAISS ID."""
+    digest = hashlib.blake2b(chunk_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def _pq_subquantizers(dimension: int, max_m: int = 64) -> int:
+    """Largest PQ sub-quantizer count <= max_m that divides the dimension."""
+    for m in range(min(max_m, dimension), 0, -1):
+        if dimension % m == 0:
+            return m
+    return 1
+
+
+class FaissCollection:
+    """
+    ChromaDB-compatible collection that serves similarity search from FAISS.
+
+    ChromaDB remains the source of truth for documents, metadata and
+    embeddings; FAISS holds a search index over the same vectors. Exposes the
+    subset of the collection API used by RAGServer and Retriever
+    (add, query, get, delete, count), so it can be swapped in transparently.
+
+    Index lifecycle (quantization='auto'):
+    - Below `train_threshold` vectors: exact inner-product search (IndexFlatIP)
+    - At `train_threshold`: trained once into IVF+PQ, which only scans
+      `nprobe/nlist` of the dataset and stores compressed codes per vector
+
+    index_type='hnsw' replaces the exact flat scan of the uncompressed stage
+    with an HNSW graph (M=16, efConstruction=200): sub-linear search for
+    small and mid-sized stores without training. HNSW can't remove vectors,
+    so deletes rebuild the graph from ChromaDB.
+
+    Other quantization modes trade recall for memory per vector:
+    - 'flat': always exact FP32 (4 bytes/dim)
+    - 'sq8': 8-bit scalar quantization (1 byte/dim) over the fixed [-1, 1]
+      range of normalized embeddings, so it needs no data-dependent training
+    - 'pq': exact until `train_threshold`, then product quantization
+      (one byte per sub-quantizer, 64 bytes for 384 dims)
+
+    With device='cuda' (GPU build of FAISS required), the CPU index stays the
+    persisted source of truth and queries run on a GPU replica, rebuilt lazily
+    after writes. index_type='cagra' builds a CAGRA graph index for the
+    replica instead of cloning the CPU index.
+    """
+
+    def __init__(
+        self,
+        collection,
+        index_path: str,
+        dimension: int = 384,
+        train_threshold: int = 10000,
+        nprobe: int = 16,
+        index_factory: Optional[str] = None,
+        device: str = "cpu",
+        index_type: str = "auto",
+        quantization: str = "auto"
+    ):
+        """
+        Initialize FAISS-backed collection.
+
+        Args:
+            collection: Underlying ChromaDB collection (documents + metadata)
+            index_path: File to persist the FAISS index to
+            dimension: Embedding dimension (384 for all-MiniLM-L6-v2)
+            train_threshold: Vector count at which the IVF index is trained
+            nprobe: Number of IVF lists scanned per query
+            index_factory: FAISS factory string for the trained index
+                          (default: IVF<nlist>,PQ<m> sized from the data)
+            device: 'cpu' or 'cuda' (falls back to CPU if no GPU is available)
+            index_type: 'auto' (flat, then IVF+PQ), 'hnsw' (HNSW graph, then IVF+PQ)
+                        or 'cagra' (GPU graph index)
+            quantization: 'auto', 'flat', 'sq8' or 'pq' (see class docstring)
+        """
+        if faiss is None:
+            raise ImportError(
+                "FAISS backend requires faiss. "
+                "Install with: pip install faiss-cpu"
+            )
+        if device not in ['cpu', 'cuda']:
+            raise ValueError(f"Invalid device: {device}. Must be 'cpu' or 'cuda'")
+        if index_type not in ['auto', 'hnsw', 'cagra']:
+            raise ValueError(
+                f"Invalid index_type: {index_type}. Must be 'auto', 'hnsw' or 'cagra'"
+            )
+        if quantization not in ['auto', 'flat', 'sq8', 'pq']:
+            raise ValueError(
+                f"Invalid quantization: {quantization}. Must be 'auto', 'flat', 'sq8' or 'pq'"
+            )
+
+        self.collection = collection
+        self.name = collection.name
+        self.index_path = Path(index_path)
+        self.dimension = dimension
+        self.train_threshold = train_threshold
+        self.nprobe = nprobe
+        self.index_factory = index_factory
+        self.quantization = quantization
+        self.device = self._resolve_device(device)
+        self.index_type = index_type if self.device == "cuda" or index_type != "cagra" else "auto"
+
+        self._gpu_resources = None
+        self._gpu_index = None  # Search replica, rebuilt lazily after writes
+        self._id_map: Dict[int, str] = {}
+        self.index = self._load_or_rebuild()
+
+    @staticmethod
+    def _resolve_device(device: str) -> str:
+        """Use CUDA only if this FAISS build has GPU support and a GPU is present."""
+        if device == "cuda":
+            if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() == 0:
+                logger.warning("FAISS GPU support not available, falling back to CPU")
+                return "cpu"
+        return device
+
+    def _new_base_index(self):
+        """Create the index used before (or instead of) training."""
+        if self.quantization == "sq8":
+            sq = faiss.IndexScalarQuantizer(
+                self.dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+            # Normalized embeddings lie in [-1, 1]; fix the range rather than
+            # fitting it to the first batch, so later vectors are never clipped
+            bounds = np.stack([-np.ones(self.dimension), np.ones(self.dimension)])
+            sq.train(bounds.astype("float32"))
+            return faiss.IndexIDMap2(sq)
+        return faiss.IndexIDMap2(self._new_uncompressed_index())
+
+    def _new_uncompressed_index(self):
+        """FP32 index: an HNSW graph with index_type='hnsw', else exact flat."""
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(self.dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            index.hnsw.efSearch = HNSW_EF_SEARCH
+            return index
+        # Exact inner-product index (embeddings are normalized)
+        return faiss.IndexFlatIP(self.dimension)
+
+    def _should_train(self, n: int) -> bool:
+        """Whether n vectors warrant a trained (IVF or PQ) index."""
+        return self.quantization in ['auto', 'pq'] and n >= self.train_threshold
+
+    def _trained_factory(self, n: int) -> str:
+        """Factory string for the trained index, sized for n vectors."""
+        if self.index_factory:
+            return self.index_factory
+        if self.quantization == "pq":
+            return f"IDMap2,PQ{_pq_subquantizers(self.dimension)}"
+        nlist = max(1, min(1024, int(4 * math.sqrt(n))))
+        return f"IVF{nlist},PQ{_pq_subquantizers(self.dimension)}"
+
+    def _build_index(self, ids: List[str], embeddings) -> Any:
+        """Build a fresh index over the given vectors."""
+        vectors = np.asarray(embeddings, dtype="float32").reshape(-1, self.dimension)
+
+        if self._should_train(len(ids)):
+            factory = self._trained_factory(len(ids))
+            logger.info(f"Training FAISS index '{factory}' on {len(ids)} vectors ({self.name})")
+            index = faiss.index_factory(self.dimension, factory, faiss.METRIC_INNER_PRODUCT)
+            index.train(vectors)
+        else:
+            index = self._new_base_index()
+
+        self._set_nprobe(index)
+        if len(ids):
+            index.add_with_ids(vectors, np.array([_faiss_id(i) for i in ids], dtype="int64"))
+        return index
+
+    def _set_nprobe(self, index) -> None:
+        """Apply nprobe to IVF indexes (no-op for flat indexes)."""
+        try:
+            faiss.extract_index_ivf(index).nprobe = self.nprobe
+        except RuntimeError:
+            pass
+
+    def _load_or_rebuild(self):
+        """Load the persisted index, rebuilding from ChromaDB if it is stale."""
+        ids = self.collection.get(include=[])["ids"]
+        self._id_map = {_faiss_id(i): i for i in ids}
+
+        if self.index_path.exists():
+            try:
+                index = faiss.read_index(str(self.index_path))
+                if not self._matches_quantization(index):
+                    logger.info(
+                        f"FAISS index for '{self.name}' doesn't match quantization "
+                        f"'{self.quantization}', rebuilding"
+                    )
+                elif index.ntotal == len(ids):
+                    self._set_nprobe(index)
+                    logger.info(f"Loaded FAISS index for '{self.name}' ({index.ntotal} vectors)")
+                    return index
+                logger.warning(
+                    f"FAISS index for '{self.name}' out of sync "
+                    f"({index.ntotal} vs {len(ids)} chunks), rebuilding"
+                )
+            except Exception as e:
+                logger.warning(f"Failed to load FAISS index {self.index_path}: {e}")
+
+        ids, embeddings = self._all_embeddings()
+        index = self._build_index(ids, embeddings)
+        self.index = index
+        self._save()
+        return index
+
+    def _all_embeddings(self):
+        """Fetch all IDs with their embeddings from ChromaDB (aligned)."""
+        data = self.collection.get(include=["embeddings"])
+        embeddings = data["embeddings"] if data["embeddings"] is not None else []
+        return data["ids"], embeddings
+
+    def _save(self) -> None:
+        """Persist the index next to the ChromaDB data."""
+        faiss.write_index(self.index, str(self.index_path))
+
+    @staticmethod
+    def _base_index(index):
+        """Unwrap an ID map to the index that stores the vectors."""
+        if isinstance(index, faiss.IndexIDMap):
+            return faiss.downcast_index(index.index)
+        return faiss.downcast_index(index)
+
+    def _matches_quantization(self, index) -> bool:
+        """Whether a loaded index has the structure this quantization builds."""
+        if self.index_factory:
+            return True
+        base = self._base_index(index)
+        uncompressed = faiss.IndexHNSW if self.index_type == "hnsw" else faiss.IndexFlat
+        if self.quantization == "sq8":
+            return isinstance(base, faiss.IndexScalarQuantizer)
+        if self.quantization == "pq":
+            return isinstance(base, (uncompressed, faiss.IndexPQ))
+        if self.quantization == "flat":
+            return isinstance(base, uncompressed)
+        return isinstance(base, (uncompressed, faiss.IndexIVF))
+
+    @property
+    def is_trained_ivf(self) -> bool:
+        """Whether the index has been trained into an IVF index."""
+        return isinstance(self._base_index(self.index), faiss.IndexIVF)
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the index has been trained (IVF or PQ)."""
+        return isinstance(self._base_index(self.index), (faiss.IndexIVF, faiss.IndexPQ))
+
+    def _search_index(self):
+        """Index used for queries (GPU replica when running on CUDA)."""
+        if self.device == "cpu" or self.index.ntotal == 0:
+            return self.index
+        if self._gpu_index is None:
+            self._gpu_index = self._build_gpu_index()
+        return self._gpu_index
+
+    def _build_gpu_index(self):
+        """Build the GPU search replica from the current vectors."""
+        if self._gpu_resources is None:
+            self._gpu_resources = faiss.StandardGpuResources()
+
+        if self.index_type == "cagra":
+            config = faiss.GpuIndexCagraConfig()
+            # CAGRA needs more vectors than its graph degree to build a graph
+            if self.index.ntotal > config.intermediate_graph_degree:
+                ids, embeddings = self._all_embeddings()
+                logger.info(f"Building CAGRA index on GPU ({len(ids)} vectors, {self.name})")
+                cagra = faiss.GpuIndexCagra(
+                    self._gpu_resources, self.dimension, faiss.METRIC_INNER_PRODUCT, config
+                )
+                index = faiss.IndexIDMap(cagra)
+                index.add_with_ids(
+                    np.asarray(embeddings, dtype="float32"),
+                    np.array([_faiss_id(i) for i in ids], dtype="int64")
+                )
+                return index
+
+        options = faiss.GpuClonerOptions()
+        if hasattr(options, "use_cuvs"):
+            options.use_cuvs = True
+        try:
+            index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, self.index, options)
+        except RuntimeError as e:
+            # Not every index type has a GPU implementation (e.g. plain SQ/PQ)
+            logger.warning(f"Can't clone '{self.name}' index to GPU, searching on CPU: {e}")
+            return self.index
+        self._set_nprobe(index)
+        return index
+
+    def count(self) -> int:
+        """Number of chunks in the collection."""
+        return self.collection.count()
+
+    def get(self, *args, **kwargs) -> Dict[str, Any]:
+        """Fetch chunks from the underlying ChromaDB collection."""
+        return self.collection.get(*args, **kwargs)
+
+    def add(
+        self,
+        ids: List[str],
+        documents: List[str],
+        embeddings: List[List[float]],
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Add chunks to ChromaDB and index their vectors in FAISS."""
+        self.collection.add(
+            ids=ids,
+            documents=documents,
+            embeddings=embeddings,
+            metadatas=metadatas
+        )
+
+        # ChromaDB ignores IDs that already exist; mirror that in the index
+        new_rows = [i for i, chunk_id in enumerate(ids) if _faiss_id(chunk_id) not in self._id_map]
+        if not new_rows:
+            return
+        new_ids = [ids[i] for i in new_rows]
+        for chunk_id in new_ids:
+            self._id_map[_faiss_id(chunk_id)] = chunk_id
+
+        if not self.is_trained and self._should_train(len(self._id_map)):
+            # Crossed the threshold: train once over everything in ChromaDB
+            self.index = self._build_index(*self._all_embeddings())
+        else:
+            # A float32 array (what ingestion passes) is used without copying rows
+            vectors = np.asarray(embeddings, dtype="float32")
+            if len(new_rows) < len(ids):
+                vectors = vectors[new_rows]
+            self.index.add_with_ids(
+                vectors,
+                np.array([_faiss_id(i) for i in new_ids], dtype="int64")
+            )
+        self._gpu_index = None
+        self._save()
+
+    def delete(self, ids: List[str]) -> None:
+        """Delete chunks from ChromaDB and the FAISS index."""
+        self.collection.delete(ids=ids)
+        faiss_ids = [_faiss_id(i) for i in ids]
+        for faiss_id in faiss_ids:
+            self._id_map.pop(faiss_id, None)
+        if isinstance(self._base_index(self.index), faiss.IndexHNSW):
+            # HNSW graphs don't support removal; rebuild from what's left
+            self.index = self._build_index(*self._all_embeddings())
+        else:
+            self.index.remove_ids(np.array(faiss_ids, dtype="int64"))
+        self._gpu_index = None
+        self._save()
+
+    def query(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        **kwargs
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Search the FAISS index and return results in ChromaDB's format.
+
+        Distances are cosine distances (1 - inner product), matching
+        collections created with hnsw:space=cosine.
+        """
+        results = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        k = min(n_results, self.index.ntotal)
+        search_index = self._search_index()
+
+        for query_embedding in query_embeddings:
+            if k == 0:
+                for key in results:
+                    results[key].append([])
+                continue
+
+            query_vector = np.asarray([query_embedding], dtype="float32")
+            scores, faiss_ids = search_index.search(query_vector, k)
+
+            hits = [
+                (self._id_map[fid], float(score))
+                for fid, score in zip(faiss_ids[0], scores[0])
+                if fid != -1 and fid in self._id_map
+            ]
+            chunk_ids = [chunk_id for chunk_id, _ in hits]
+            fetched = self.collection.get(ids=chunk_ids, include=["documents", "metadatas"])
+            by_id = {
+                chunk_id: (doc, meta)
+                for chunk_id, doc, meta in zip(fetched["ids"], fetched["documents"], fetched["metadatas"])
+            }
+
+            results["ids"].append(chunk_ids)
+            results["documents"].append([by_id[c][0] for c in chunk_ids])
+            results["metadatas"].append([by_id[c][1] for c in chunk_ids])
+            results["distances"].append([1.0 - score for _, score in hits])
+
+        return results
+
+    def index_stats(self) -> Dict[str, Any]:
+        """Get statistics about the FAISS index."""
+        base = self._base_index(self.index)
+        if isinstance(base, faiss.IndexHNSW):
+            base = faiss.downcast_index(base.storage)
+        stats = {
+            "index_type": type(self.index).__name__,
+            "ntotal": self.index.ntotal,
+            "trained_ivf": self.is_trained_ivf,
+            "quantization": self.quantization,
+            "bytes_per_vector": base.code_size,
+            "device": self.device,
+            "num_gpus": faiss.get_num_gpus()
+        }
+        if self.device == "cuda":
+            stats["gpu_index_type"] = self.index_type
+        if self.is_trained_ivf:
+            stats["nprobe"] = faiss.extract_index_ivf(self.index).nprobe
+        return stats
@@ -0,0 +1,393 @@
+"""Flat Backend: In-memory brute-force search for small RAG collections."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+FLAT_DTYPES = ["float32", "float16", "int8"]
+
+# Rows scored per step; each block is widened to float32 (float16 storage),
+# scored and merged into the running top-k while it is still in cache
+QUERY_BLOCK_ROWS = 8192
+
+
+class FlatCollection:
+    """
+    ChromaDB-compatible collection that serves similarity search from an
+    in-memory NumPy matrix.
+
+    For the small collections Mini-JARVIS usually holds (tens to a few
+    thousand chunks), one matrix-vector product over all normalized
+    embeddings beats walking ChromaDB's HNSW graph, and caching documents
+    and metadata alongside the matrix means queries never touch ChromaDB.
+    ChromaDB remains the persisted source of truth; the cache is kept in
+    sync on add/delete.
+
+    With `cache_path`, the cache is also persisted as `<cache_path>.npy`
+    (the matrix, memory-mapped read-only on startup so pages fault in from
+    the page cache on first query) and `<cache_path>.jsonl` (one
+    id/document/metadata line per row, appended per add). Startup then
+    skips reading every embedding back out of ChromaDB's SQLite; if the
+    files are missing or out of sync they are rebuilt from ChromaDB.
+
+    With `dtype="float16"` the matrix is stored at half precision, halving
+    its memory, cache file and the bytes streamed per query (scoring is
+    memory-bound). Blocks are widened to float32 for the product, since
+    NumPy has no float16 BLAS; unit vectors lose well under 1e-3 in
+    cosine score. `dtype="int8"` goes further: each row is scaled so its
+    largest component is +/-127 and rounded, a quarter of the float32
+    bytes. The per-row scale isn't stored since cosine similarity doesn't
+    depend on a row's length, which the cached inverse norms already
+    divide out.
+
+    Scoring streams the matrix once in row blocks: each block's scores are
+    scaled by cached inverse row norms (so stored vectors needn't be
+    normalized) and merged into a running top-k, so no (N, Q) score matrix
+    or normalized copy of the embeddings is ever materialized.
+    """
+
+    def __init__(
+        self,
+        collection,
+        dimension: int = 384,
+        cache_path: Optional[str] = None,
+        dtype: str = "float32"
+    ):
+        """
+        Initialize flat collection.
+
+        Args:
+            collection: Underlying ChromaDB collection (persistence)
+            dimension: Embedding dimension (384 for all-MiniLM-L6-v2)
+            cache_path: Base path for the .npy/.jsonl cache (None = memory only)
+            dtype: Matrix storage precision, 'float32' or 'float16'
+        """
+        if dtype not in FLAT_DTYPES:
+            raise ValueError(f"Invalid dtype: {dtype}. Must be one of {FLAT_DTYPES}")
+
+        self.collection = collection
+        self.name = collection.name
+        self.dimension = dimension
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.dtype = np.dtype(dtype)
+
+        if not self._load_cache():
+            self._load_from_chroma()
+        logger.info(f"Loaded {len(self._ids)} vectors into flat index ({self.name})")
+
+    @property
+    def _matrix_path(self) -> Path:
+        return Path(f"{self.cache_path}.npy")
+
+    @property
+    def _rows_path(self) -> Path:
+        return Path(f"{self.cache_path}.jsonl")
+
+    def _set_rows(self, ids, documents, metadatas, matrix) -> None:
+        self._ids: List[str] = list(ids)
+        self._documents: List[str] = list(documents)
+        self._metadatas: List[Dict[str, Any]] = list(metadatas)
+        self._row: Dict[str, int] = {chunk_id: i for i, chunk_id in enumerate(self._ids)}
+        self._matrix = matrix
+        # 1/||row||, computed on first query so a memory-mapped matrix
+        # isn't read in full at startup
+        self._inv_norms: Optional[np.ndarray] = None
+
+    def _load_from_chroma(self) -> None:
+        """Load the cache from ChromaDB (and persist it, if enabled)."""
+        data = self.collection.get(include=["embeddings", "documents", "metadatas"])
+        embeddings = data["embeddings"] if data["embeddings"] is not None else []
+        self._set_rows(
+            data["ids"],
+            data["documents"] or [],
+            data["metadatas"] or [],
+            self._as_matrix(embeddings)
+        )
+        self._save_cache()
+
+    def _load_cache(self) -> bool:
+        """Load the persisted cache; False if missing or out of sync with ChromaDB."""
+        if self.cache_path is None:
+            return False
+        try:
+            matrix = np.load(self._matrix_path, mmap_mode="r")
+            loads = orjson.loads if orjson is not None else json.loads
+            with open(self._rows_path, "rb") as f:
+                rows = [loads(line) for line in f]
+        except (OSError, ValueError) as e:
+            logger.info(f"No usable flat index cache for '{self.name}', loading from ChromaDB: {e}")
+            return False
+
+        if (
+            matrix.shape != (len(rows), self.dimension)
+            or matrix.dtype != self.dtype
+            or len(rows) != self.collection.count()
+        ):
+            logger.warning(f"Flat index cache for '{self.name}' out of sync, rebuilding")
+            return False
+
+        self._set_rows(
+            [row["id"] for row in rows],
+            [row["document"] for row in rows],
+            [row["metadata"] for row in rows],
+            matrix
+        )
+        return True
+
+    def _save_cache(self) -> None:
+        """Rewrite the persisted matrix and rows."""
+        if self.cache_path is None:
+            return
+        self._save_matrix()
+        tmp_rows = Path(f"{self._rows_path}.tmp")
+        tmp_rows.write_bytes(self._jsonl(range(len(self._ids))))
+        os.replace(tmp_rows, self._rows_path)
+
+    def _save_matrix(self) -> None:
+        """Persist the matrix via a temp file + rename."""
+        # Never truncate the file in place: a memory map of it may still be
+        # open, and a crash mid-write would leave a torn cache
+        tmp_matrix = Path(f"{self._matrix_path}.tmp")
+        with open(tmp_matrix, "wb") as f:
+            np.save(f, self._matrix)
+        os.replace(tmp_matrix, self._matrix_path)
+
+    def _jsonl(self, rows) -> bytes:
+        """Serialize cached rows as UTF-8 JSON lines (with orjson when installed)."""
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            dumps = lambda obj: json.dumps(obj).encode("utf-8")
+        return b"".join(
+            dumps({
+                "id": self._ids[i],
+                "document": self._documents[i],
+                "metadata": self._metadatas[i]
+            }) + b"\n"
+            for i in rows
+        )
+
+    def _as_matrix(self, embeddings, dtype=None) -> np.ndarray:
+        """Convert embeddings to a C-contiguous (N, dim) matrix (storage dtype by default)."""
+        dtype = np.dtype(dtype or self.dtype)
+        matrix = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dimension)
+        if dtype == np.int8:
+            matrix = quantize_int8(matrix)
+        return np.ascontiguousarray(matrix, dtype=dtype)
+
+    @staticmethod
+    def _row_inv_norms(matrix: np.ndarray) -> np.ndarray:
+        """1 / L2 norm of each row, computed block by block."""
+        inv_norms = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), QUERY_BLOCK_ROWS):
+            block = matrix[start:start + QUERY_BLOCK_ROWS].astype(np.float32, copy=False)
+            inv_norms[start:start + len(block)] = 1.0 / np.maximum(
+                np.linalg.norm(block, axis=1), 1e-12
+            )
+        return inv_norms
+
+    def _top_k(self, queries: np.ndarray, k: int):
+        """
+        Cosine top-k rows for each query in one pass over the matrix.
+
+        Args:
+            queries: Unit-norm float32 queries, shape (Q, dim)
+            k: Rows to return per query (<= number of rows)
+
+        Returns:
+            (rows, scores), each shape (Q, k), best first
+        """
+        if self._inv_norms is None:
+            self._inv_norms = self._row_inv_norms(self._matrix)
+
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, len(self._matrix), QUERY_BLOCK_ROWS):
+            block = self._matrix[start:start + QUERY_BLOCK_ROWS].astype(np.float32, copy=False)
+            end = start + len(block)
+            scores = (queries @ block.T) * self._inv_norms[start:end]
+            rows = np.broadcast_to(np.arange(start, end), scores.shape)
+
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            best_rows = np.concatenate([best_rows, rows], axis=1)
+            if best_scores.shape[1] > k:
+                # argpartition keeps the top k in O(block); only those k survive
+                keep = np.argpartition(best_scores, -k, axis=1)[:, -k:]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_rows = np.take_along_axis(best_rows, keep, axis=1)
+
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        return (
+            np.take_along_axis(best_rows, order, axis=1),
+            np.take_along_axis(best_scores, order, axis=1)
+        )
+
+    def _top_k_single(self, query: np.ndarray, k: int):
+        """
+        _top_k() specialized for one query vector, the retrieve_context() case.
+
+        A (block, dim) x (dim,) product runs as a BLAS matrix-vector call
+        instead of a matrix-matrix one, and each block is cut to its own
+        top k before merging, so 2-D broadcasting and gathers are skipped.
+
+        Args:
+            query: Unit-norm float32 query, shape (dim,)
+            k: Rows to return (<= number of rows)
+
+        Returns:
+            (rows, scores), each shape (k,), best first
+        """
+        if self._inv_norms is None:
+            self._inv_norms = self._row_inv_norms(self._matrix)
+
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+        for start in range(0, len(self._matrix), QUERY_BLOCK_ROWS):
+            block = self._matrix[start:start + QUERY_BLOCK_ROWS].astype(np.float32, copy=False)
+            scores = block @ query
+            scores *= self._inv_norms[start:start + len(block)]
+            top = np.argpartition(scores, -k)[-k:] if len(scores) > k else np.arange(len(scores))
+
+            best_scores = np.concatenate([best_scores, scores[top]])
+            best_rows = np.concatenate([best_rows, top + start])
+            if len(best_scores) > k:
+                keep = np.argpartition(best_scores, -k)[-k:]
+                best_scores = best_scores[keep]
+                best_rows = best_rows[keep]
+
+        order = np.argsort(-best_scores, kind="stable")
+        return best_rows[order], best_scores[order]
+
+    def count(self) -> int:
+        """Number of chunks in the collection."""
+        return len(self._ids)
+
+    def get(self, *args, **kwargs) -> Dict[str, Any]:
+        """Fetch chunks from the underlying ChromaDB collection."""
+        return self.collection.get(*args, **kwargs)
+
+    def add(
+        self,
+        ids: List[str],
+        documents: List[str],
+        embeddings: List[List[float]],
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Add chunks to ChromaDB and the in-memory index."""
+        self.collection.add(
+            ids=ids,
+            documents=documents,
+            embeddings=embeddings,
+            metadatas=metadatas
+        )
+
+        # ChromaDB ignores IDs that already exist; mirror that here
+        new_rows = [i for i, chunk_id in enumerate(ids) if chunk_id not in self._row]
+        if not new_rows:
+            return
+        for i in new_rows:
+            self._row[ids[i]] = len(self._ids)
+            self._ids.append(ids[i])
+            self._documents.append(documents[i])
+            self._metadatas.append(metadatas[i] if metadatas else {})
+        first_new = len(self._matrix)
+        # A float32 array (what ingestion passes) is used without copying rows
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if len(new_rows) < len(ids):
+            vectors = vectors[new_rows]
+        new_matrix = self._as_matrix(vectors)
+        self._matrix = np.concatenate([self._matrix, new_matrix])
+        if self._inv_norms is not None:
+            self._inv_norms = np.concatenate([self._inv_norms, self._row_inv_norms(new_matrix)])
+
+        if self.cache_path is not None:
+            self._save_matrix()
+            # New rows go to the end, so the JSONL is appended in one write
+            with open(self._rows_path, "ab") as f:
+                f.write(self._jsonl(range(first_new, len(self._ids))))
+
+    def delete(self, ids: List[str]) -> None:
+        """Delete chunks from ChromaDB and the in-memory index."""
+        self.collection.delete(ids=ids)
+        removed = {self._row[chunk_id] for chunk_id in ids if chunk_id in self._row}
+        if not removed:
+            return
+        keep = [i for i in range(len(self._ids)) if i not in removed]
+        self._ids = [self._ids[i] for i in keep]
+        self._documents = [self._documents[i] for i in keep]
+        self._metadatas = [self._metadatas[i] for i in keep]
+        self._row = {chunk_id: i for i, chunk_id in enumerate(self._ids)}
+        self._matrix = np.ascontiguousarray(self._matrix[keep])
+        if self._inv_norms is not None:
+            self._inv_norms = self._inv_norms[keep]
+        self._save_cache()
+
+    def query(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        **kwargs
+    ) -> Dict[str, List[List[Any]]]:
+        """
+        Brute-force search and return results in ChromaDB's format.
+
+        Distances are cosine distances (1 - cosine similarity), matching
+        collections created with hnsw:space=cosine.
+        """
+        results = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        k = min(n_results, len(self._ids))
+        if k == 0:
+            for key in results:
+                results[key] = [[] for _ in query_embeddings]
+            return results
+
+        queries = self._as_matrix(query_embeddings, np.float32)
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        if len(queries) == 1:
+            rows, scores = self._top_k_single(queries[0], k)
+            top_rows, top_scores = [rows], [scores]
+        else:
+            top_rows, top_scores = self._top_k(queries, k)
+
+        for rows, scores in zip(top_rows, top_scores):
+            results["ids"].append([self._ids[i] for i in rows])
+            results["documents"].append([self._documents[i] for i in rows])
+            results["metadatas"].append([self._metadatas[i] for i in rows])
+            results["distances"].append([1.0 - float(score) for score in scores])
+
+        return results
+
+    def index_stats(self) -> Dict[str, Any]:
+        """Get statistics about the in-memory index."""
+        return {
+            "index_type": "flat",
+            "dtype": self.dtype.name,
+            "ntotal": len(self._ids),
+            "bytes_per_vector": self.dimension * self.dtype.itemsize,
+            "memory_bytes": self._matrix.nbytes
+        }
+
+
+def quantize_int8(matrix: np.ndarray) -> np.ndarray:
+    """
+    Symmetric per-row int8 scalar quantization.
+
+    Args:
+        matrix: float32 vectors, shape (N, dim)
+
+    Returns:
+        int8 matrix with each row's largest absolute component at 127
+    """
+    scale = np.maximum(np.abs(matrix).max(axis=1, keepdims=True, initial=0.0), 1e-12) / 127.0
+    return np.round(matrix / scale).astype(np.int8)
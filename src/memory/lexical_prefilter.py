@@ -0,0 +1,101 @@
+"""Lexical Prefilter: Skip embedding queries that share no term with stored chunks."""
+
+import logging
+import re
+import threading
+from typing import Callable, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CHUNKS = 10_000
+STEM_LENGTH = 5  # Terms are compared by prefix, so "recipe" matches "recipes"
+
+_TOKEN_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset("""
+    a an and are as at be but by can do does for from had has have how i if in
+    into is it its me my no not of on or so that the their them then there
+    these they this to was we were what when where which who why will with you
+    your about any tell
+""".split())
+
+
+def terms(text: str) -> Set[str]:
+    """Content terms of a text: lowercased, stopwords dropped, cut to STEM_LENGTH."""
+    return {
+        token[:STEM_LENGTH]
+        for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    }
+
+
+class LexicalPrefilter:
+    """
+    Vocabulary of every stored chunk, checked before a query is embedded.
+
+    A query with no content term in common with the corpus returns no
+    results without running the embedding model or the vector search. The
+    vocabulary is read lazily from `load_documents` and rebuilt after
+    invalidate(). Semantic search can match synonyms with no shared term,
+    so this trades some recall for latency and is off by default.
+    """
+
+    def __init__(
+        self,
+        load_documents: Callable[[], Iterable[str]],
+        max_chunks: int = DEFAULT_MAX_CHUNKS
+    ):
+        """
+        Initialize lexical prefilter.
+
+        Args:
+            load_documents: Returns the text of every stored chunk
+            max_chunks: Larger corpora aren't indexed (every query is let through)
+        """
+        if max_chunks < 1:
+            raise ValueError(f"Invalid max_chunks: {max_chunks}. Must be >= 1")
+
+        self.load_documents = load_documents
+        self.max_chunks = max_chunks
+        self._vocabulary: Optional[Set[str]] = None
+        self._enabled = True
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Rebuild the vocabulary on next use (call after the corpus changes)."""
+        with self._lock:
+            self._vocabulary = None
+            self._enabled = True
+
+    def _build(self) -> None:
+        vocabulary: Set[str] = set()
+        count = 0
+        for text in self.load_documents():
+            count += 1
+            if count > self.max_chunks:
+                logger.info(f"Lexical prefilter disabled: more than {self.max_chunks} chunks")
+                self._enabled = False
+                vocabulary = set()
+                break
+            vocabulary |= terms(text or "")
+        self._vocabulary = vocabulary
+        logger.debug(f"Lexical prefilter vocabulary: {len(vocabulary)} terms")
+
+    def may_match(self, query: str) -> bool:
+        """
+        Whether a query could have results worth embedding it for.
+
+        Args:
+            query: User query
+
+        Returns:
+            False only if the query has content terms and none occur in the corpus
+        """
+        query_terms = terms(query)
+        if not query_terms:
+            return True
+        with self._lock:
+            if self._vocabulary is None:
+                self._build()
+            if not self._enabled:
+                return True
+            return not query_terms.isdisjoint(self._vocabulary)
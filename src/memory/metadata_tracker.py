@@ -10,6 +10,11 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Expiry time of a document as a Julian day (NULL for permanent documents).
+# Backed by an expression index, so expiry checks are an index range scan
+# over expiring documents instead of a full table scan.
+_EXPIRES_AT_SQL = "julianday(created_at) + ttl_seconds / 86400.0"
+
 
 class MetadataTracker:
     """
@@ -87,6 +92,10 @@ class MetadataTracker:
             CREATE INDEX IF NOT EXISTS idx_documents_ttl 
             ON documents(ttl_seconds)
         """)
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_documents_expires_at 
+            ON documents({_EXPIRES_AT_SQL})
+        """)
         
         conn.commit()
         conn.close()
@@ -118,7 +127,8 @@ class MetadataTracker:
         file_path: str,
         tier: str = "reference",
         ttl_seconds: Optional[int] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        file_hash: Optional[str] = None
     ) -> int:
         """
         Register or update a document in the tracker.
@@ -128,6 +138,7 @@ class MetadataTracker:
             tier: Memory tier ('core', 'reference', or 'ephemeral')
             ttl_seconds: Time to live in seconds (None = permanent)
             metadata: Additional metadata dictionary
+            file_hash: Content hash, if already known (the file isn't read)
             
         Returns:
             Document ID
@@ -135,7 +146,8 @@ class MetadataTracker:
         if tier not in ['core', 'reference', 'ephemeral']:
             raise ValueError(f"Invalid tier: {tier}. Must be 'core', 'reference', or 'ephemeral'")
         
-        file_hash = self.compute_file_hash(file_path)
+        if file_hash is None:
+            file_hash = self.compute_file_hash(file_path)
         metadata_json = json.dumps(metadata or {})
         
         conn = sqlite3.connect(str(self.db_path))
@@ -200,11 +212,11 @@ class MetadataTracker:
         conn = sqlite3.connect(str(self.db_path))
         cursor = conn.cursor()
         
-        for i, chunk_id in enumerate(chunk_ids):
-            cursor.execute("""
-                INSERT OR IGNORE INTO chunks (chunk_id, document_id, chunk_index)
-                VALUES (?, ?, ?)
-            """, (chunk_id, document_id, i))
+        # One prepared statement for every row, in a single transaction
+        cursor.executemany("""
+            INSERT OR IGNORE INTO chunks (chunk_id, document_id, chunk_index)
+            VALUES (?, ?, ?)
+        """, ((chunk_id, document_id, i) for i, chunk_id in enumerate(chunk_ids)))
         
         conn.commit()
         conn.close()
@@ -253,6 +265,29 @@ class MetadataTracker:
         
         return result[0] if result else None
     
+    def get_document_id(self, file_path: str) -> Optional[int]:
+        """
+        Get ID of a registered document.
+        
+        Args:
+            file_path: Path to document
+            
+        Returns:
+            Document ID or None if not registered
+        """
+        conn = sqlite3.connect(str(self.db_path))
+        cursor = conn.cursor()
+        
+        cursor.execute(
+            "SELECT id FROM documents WHERE file_path = ?",
+            (file_path,)
+        )
+        result = cursor.fetchone()
+        
+        conn.close()
+        
+        return result[0] if result else None
+    
     def get_chunk_tier(self, chunk_id: str) -> Optional[str]:
         """
         Get tier for a chunk (via its document).
@@ -288,14 +323,16 @@ class MetadataTracker:
         conn = sqlite3.connect(str(self.db_path))
         cursor = conn.cursor()
         
-        # Find documents where TTL has expired
-        cursor.execute("""
+        # Find documents where TTL has expired (subquery uses the expiry index)
+        cursor.execute(f"""
             SELECT d.id, d.file_path, d.created_at, d.ttl_seconds,
                    GROUP_CONCAT(c.chunk_id) as chunk_ids
             FROM documents d
             LEFT JOIN chunks c ON c.document_id = d.id
-            WHERE d.ttl_seconds IS NOT NULL
-              AND (julianday('now') - julianday(d.created_at)) * 86400 > d.ttl_seconds
+            WHERE d.id IN (
+                SELECT id FROM documents
+                WHERE {_EXPIRES_AT_SQL} < julianday('now')
+            )
             GROUP BY d.id
         """)
         
@@ -354,11 +391,10 @@ class MetadataTracker:
         total_chunks = cursor.fetchone()[0]
         
         # Expired documents count
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT COUNT(*) 
             FROM documents 
-            WHERE ttl_seconds IS NOT NULL
-              AND (julianday('now') - julianday(created_at)) * 86400 > ttl_seconds
+            WHERE {_EXPIRES_AT_SQL} < julianday('now')
         """)
         expired_count = cursor.fetchone()[0]
         
@@ -0,0 +1,140 @@
+"""ONNX Embedder: INT8-quantized all-MiniLM-L6-v2 on ONNX Runtime."""
+
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+try:
+    from tokenizers import Tokenizer
+except ImportError:
+    Tokenizer = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_DIR = Path.home() / ".jarvis" / "models" / "all-MiniLM-L6-v2-onnx"
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+MAX_SEQ_LENGTH = 256  # all-MiniLM-L6-v2 was trained with 256-token inputs
+
+EMBEDDER_BACKENDS = ["sentence-transformers", "onnx-int8"]
+
+
+class OnnxEmbedder:
+    """
+    Drop-in replacement for SentenceTransformer.encode() backed by an
+    INT8 dynamically-quantized ONNX export of all-MiniLM-L6-v2.
+
+    Produces the same 384-dim mean-pooled embeddings as sentence-transformers,
+    so both backends can share a ChromaDB collection. Create the model
+    directory with scripts/export_onnx_embedder.py.
+    """
+
+    def __init__(
+        self,
+        model_dir: Optional[str] = None,
+        num_threads: Optional[int] = None
+    ):
+        """
+        Load the quantized model and tokenizer.
+
+        Args:
+            model_dir: Directory with model_quantized.onnx and tokenizer.json
+                       (default: ~/.jarvis/models/all-MiniLM-L6-v2-onnx)
+            num_threads: Intra-op threads (default: os.cpu_count())
+        """
+        if ort is None or Tokenizer is None:
+            raise ImportError(
+                "ONNX embeddings require onnxruntime and tokenizers. "
+                "Install with: pip install onnxruntime tokenizers"
+            )
+
+        model_dir = Path(model_dir) if model_dir else DEFAULT_MODEL_DIR
+        model_path = model_dir / QUANTIZED_MODEL_FILE
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"Quantized ONNX model not found: {model_path}. "
+                "Run: python scripts/export_onnx_embedder.py"
+            )
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = num_threads or os.cpu_count()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=MAX_SEQ_LENGTH)
+        # No length: pad to the longest sequence in each batch, not to 256
+        self.tokenizer.enable_padding()
+
+        logger.info(f"Loaded ONNX embedder: {model_path}")
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 64,
+        normalize_embeddings: bool = True,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Embed sentences (same signature subset as SentenceTransformer.encode).
+
+        Args:
+            sentences: Texts to embed
+            batch_size: Texts per ONNX Runtime call
+            normalize_embeddings: L2-normalize the output (for cosine distance)
+            show_progress_bar: Ignored, accepted for compatibility
+
+        Returns:
+            float32 array of shape (len(sentences), 384)
+        """
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            encodings = self.tokenizer.encode_batch(sentences[start:start + batch_size])
+            input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+            attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+            feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+            if "token_type_ids" in self.input_names:
+                feeds["token_type_ids"] = np.array([e.type_ids for e in encodings], dtype=np.int64)
+
+            hidden = self.session.run(None, feeds)[0]
+            batches.append(mean_pool(hidden, attention_mask, normalize_embeddings))
+
+        if not batches:
+            return np.zeros((0, 384), dtype=np.float32)
+        return np.concatenate(batches)
+
+
+def mean_pool(
+    hidden: np.ndarray,
+    attention_mask: np.ndarray,
+    normalize: bool = True
+) -> np.ndarray:
+    """
+    Mean-pool token embeddings over non-padding tokens.
+
+    Args:
+        hidden: Token embeddings, shape (batch, seq_len, dim)
+        attention_mask: 1 for real tokens, 0 for padding, shape (batch, seq_len)
+        normalize: L2-normalize each pooled vector
+
+    Returns:
+        float32 array of shape (batch, dim)
+    """
+    mask = attention_mask[..., None].astype(np.float32)
+    pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+    if normalize:
+        pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+    return pooled.astype(np.float32)
@@ -0,0 +1,182 @@
+"""RAG Daemon: Long-running RAGServer exposed over local HTTP for CLI scripts."""
+
+import asyncio
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, Any, Optional
+
+import httpx
+
+from src.common.httpclient import get_shared_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5102
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routes HTTP requests to the daemon's RAGServer."""
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._send_json(200, self.server.daemon.rag_server.get_stats())
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        daemon = self.server.daemon
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length)) if length else {}
+            if self.path == "/cleanup_expired":
+                result = daemon.run(daemon.rag_server.cleanup_expired())
+            elif self.path == "/ingest":
+                result = daemon.run(daemon.rag_server.ingest_documents(**body))
+            else:
+                self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+                return
+            self._send_json(200, result)
+        except Exception as e:
+            logger.error(f"RAG daemon request {self.path} failed: {e}", exc_info=True)
+            self._send_json(500, {"error": str(e)})
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.info(f"RAG daemon: {format % args}")
+
+
+class RAGDaemon:
+    """
+    Keeps one RAGServer (ChromaDB client + embedding model) loaded and
+    serves it on localhost, so CLI scripts don't pay the cold start per run.
+
+    Endpoints:
+    - GET /health, GET /stats
+    - POST /cleanup_expired
+    - POST /ingest (JSON body: RAGServer.ingest_documents() arguments)
+
+    Requests are handled one at a time on a single event loop, so the
+    RAGServer is never used concurrently.
+    """
+
+    def __init__(
+        self,
+        rag_server=None,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT
+    ):
+        """
+        Initialize RAG daemon.
+
+        Args:
+            rag_server: RAGServer to serve (creates a tiered one if None)
+            host: Interface to bind (localhost only by default)
+            port: Port to listen on
+        """
+        if rag_server is None:
+            from src.memory.rag_server import RAGServer
+            rag_server = RAGServer(enable_tiering=True)
+        self.rag_server = rag_server
+        self.loop = asyncio.new_event_loop()
+        self.httpd = HTTPServer((host, port), _RequestHandler)
+        self.httpd.daemon = self
+        self.host, self.port = self.httpd.server_address[:2]
+
+    def run(self, coro):
+        """Run a RAGServer coroutine on the daemon's event loop."""
+        return self.loop.run_until_complete(coro)
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown() is called."""
+        logger.info(f"RAG daemon listening on http://{self.host}:{self.port}")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+            self.loop.close()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever() (call from another thread)."""
+        self.httpd.shutdown()
+
+
+class RAGDaemonClient:
+    """Async client for a running RAGDaemon."""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        timeout: float = 300.0
+    ):
+        """
+        Initialize client.
+
+        Args:
+            host: Daemon host
+            port: Daemon port
+            timeout: Request timeout in seconds (ingestion can be slow)
+        """
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    async def is_running(self) -> bool:
+        """Check whether the daemon is up (fast, no retries)."""
+        try:
+            response = await get_shared_client().get(f"{self.base_url}/health", timeout=1.0)
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get RAGServer statistics from the daemon."""
+        return await self._request("GET", "/stats")
+
+    async def cleanup_expired(self) -> Dict[str, Any]:
+        """Clean up expired ephemeral documents via the daemon."""
+        return await self._request("POST", "/cleanup_expired")
+
+    async def ingest_documents(self, file_paths, **kwargs) -> Dict[str, Any]:
+        """Ingest documents via the daemon (same arguments as RAGServer)."""
+        return await self._request("POST", "/ingest", {"file_paths": file_paths, **kwargs})
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        response = await get_shared_client().request(
+            method, f"{self.base_url}{path}", json=payload, timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the Mini-JARVIS RAG daemon")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    try:
+        RAGDaemon(host=args.host, port=args.port).serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -1,20 +1,30 @@
 """RAG Server: Main interface for RAG pipeline operations."""
 
 import asyncio
+import contextlib
+import inspect
 import logging
+import multiprocessing
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 
 import chromadb
 from chromadb.config import Settings
 
-from src.memory.document_ingester import DocumentIngester
+from src.memory.document_ingester import ChunkBatch, DocumentIngester
+from src.memory.lexical_prefilter import LexicalPrefilter
 from src.memory.retriever import Retriever
+from src.memory.semantic_cache import SemanticCache
 from src.memory.metadata_tracker import MetadataTracker
 
 logger = logging.getLogger(__name__)
 
+_default_servers: Dict[Tuple, "RAGServer"] = {}
+_default_servers_lock = threading.Lock()
+
 
 class RAGServer:
     """
@@ -25,11 +35,33 @@ class RAGServer:
     - Context retrieval for queries
     """
     
+    # FAISS quantization per tier (faiss backend only): core chunks are the
+    # most valuable and stay exact, lower tiers trade recall for memory
+    TIER_QUANTIZATION = {
+        "core": "flat",
+        "reference": "sq8",
+        "ephemeral": "pq"
+    }
+    
     def __init__(
         self,
         persist_directory: Optional[str] = None,
         collection_name: str = "jarvis_memory",
-        enable_tiering: bool = True
+        enable_tiering: bool = True,
+        backend: str = "chroma",
+        device: str = "cpu",
+        index_type: str = "auto",
+        embedder_backend: Optional[str] = None,
+        onnx_model_dir: Optional[str] = None,
+        embedding_device: str = "cpu",
+        ephemeral: bool = False,
+        flat_dtype: str = "float32",
+        enable_dynamic_batching: bool = False,
+        enable_semantic_cache: bool = False,
+        enable_lexical_prefilter: bool = False,
+        hnsw_m: int = 8,
+        hnsw_ef_construction: int = 64,
+        hnsw_ef_search: int = 16
     ):
         """
         Initialize RAG Server.
@@ -38,7 +70,49 @@ class RAGServer:
             persist_directory: Directory to persist ChromaDB data (default: ~/.jarvis/memory)
             collection_name: Name of the ChromaDB collection (base name for tiered mode)
             enable_tiering: Enable tiered memory (core/reference/ephemeral collections)
+            backend: Vector search backend: 'chroma' (ChromaDB HNSW), 'faiss'
+                     (FAISS index for search, ChromaDB for documents/metadata) or
+                     'flat' (in-memory brute force, fastest for small collections)
+            device: FAISS device, 'cpu' or 'cuda' (faiss backend only, falls back to CPU)
+            index_type: FAISS index type (faiss backend only): 'auto' (exact, then IVF+PQ),
+                        'hnsw' (HNSW graph, then IVF+PQ) or 'cagra' (GPU only)
+            embedder_backend: 'sentence-transformers' or 'onnx-int8' (INT8 ONNX Runtime)
+                              (default: $MINI_JARVIS_EMBEDDER or sentence-transformers)
+            onnx_model_dir: Quantized ONNX model directory (onnx-int8 only)
+            embedding_device: Torch device for sentence-transformers embeddings:
+                              'cpu', 'cuda', 'mps' or 'auto' (MPS > CUDA > CPU)
+            ephemeral: Keep ChromaDB in memory instead of persist_directory, for
+                       throwaway runs like the manual test scripts (in-memory
+                       collections are shared by all ephemeral RAGServers in a process)
+            flat_dtype: Flat backend matrix precision, 'float32', 'float16' (half
+                        the memory and bandwidth per query) or 'int8' (a quarter)
+            enable_dynamic_batching: Batch query embeddings of concurrent
+                                     retrieve_context() calls into one encode()
+            enable_semantic_cache: Return cached results for queries nearly identical
+                                   (cosine >= 0.92) to a recent one; cleared on any
+                                   ingest/delete through this server
+            enable_lexical_prefilter: Return no results, without embedding, for
+                                      queries sharing no term with any stored
+                                      chunk (misses pure-synonym matches)
+            hnsw_m: ChromaDB HNSW graph degree (lower = less memory; fixed at
+                    collection creation)
+            hnsw_ef_construction: HNSW candidate list size while building
+                                  (fixed at collection creation)
+            hnsw_ef_search: HNSW candidate list size per query (lower = faster,
+                            enough for small Pi5 corpora; applied to existing
+                            collections too)
         """
+        embedder_backend = embedder_backend or os.getenv("MINI_JARVIS_EMBEDDER", "sentence-transformers")
+        if backend not in ['chroma', 'faiss', 'flat']:
+            raise ValueError(f"Invalid backend: {backend}. Must be 'chroma', 'faiss' or 'flat'")
+        for param, value in [
+            ("hnsw_m", hnsw_m),
+            ("hnsw_ef_construction", hnsw_ef_construction),
+            ("hnsw_ef_search", hnsw_ef_search)
+        ]:
+            if value < 1:
+                raise ValueError(f"Invalid {param}: {value}. Must be >= 1")
+        
         # Default to ~/.jarvis/memory on NVMe
         if persist_directory is None:
             home = Path.home()
@@ -49,24 +123,38 @@ class RAGServer:
         
         self.collection_name = collection_name
         self.enable_tiering = enable_tiering
+        self.backend = backend
+        self.device = device
+        self.index_type = index_type
+        self.ephemeral = ephemeral
+        self.flat_dtype = flat_dtype
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
         
         # Initialize ChromaDB client
         # Disable telemetry to avoid hangs on Pi5
-        try:
-            # Try new API first (ChromaDB 0.4+) with telemetry disabled
-            self.client = chromadb.PersistentClient(
-                path=str(self.persist_directory),
-                settings=Settings(
-                    anonymized_telemetry=False,  # Disable telemetry to prevent hangs
-                    allow_reset=True
-                )
-            )
-        except Exception as e:
-            # If Settings causes issues, try without it
-            logger.warning(f"ChromaDB Settings failed, trying without: {e}")
-            self.client = chromadb.PersistentClient(
-                path=str(self.persist_directory)
+        if ephemeral:
+            # In-memory: skips creating SQLite + HNSW files for throwaway runs
+            self.client = chromadb.EphemeralClient(
+                settings=Settings(anonymized_telemetry=False, allow_reset=True)
             )
+        else:
+            try:
+                # Try new API first (ChromaDB 0.4+) with telemetry disabled
+                self.client = chromadb.PersistentClient(
+                    path=str(self.persist_directory),
+                    settings=Settings(
+                        anonymized_telemetry=False,  # Disable telemetry to prevent hangs
+                        allow_reset=True
+                    )
+                )
+            except Exception as e:
+                # If Settings causes issues, try without it
+                logger.warning(f"ChromaDB Settings failed, trying without: {e}")
+                self.client = chromadb.PersistentClient(
+                    path=str(self.persist_directory)
+                )
         
         # Initialize metadata tracker
         self.metadata_tracker = MetadataTracker()
@@ -84,96 +172,203 @@ class RAGServer:
         logger.info(f"RAG Server initialized: {self.persist_directory}")
         
         # Initialize components
-        self.ingester = DocumentIngester()
+        self.semantic_cache = SemanticCache() if enable_semantic_cache else None
+        self.lexical_prefilter = (
+            LexicalPrefilter(self._stored_documents) if enable_lexical_prefilter else None
+        )
+        self.ingester = DocumentIngester(embedder_backend, onnx_model_dir, embedding_device)
         if enable_tiering:
             # Retriever will use tiered collections
-            self.retriever = Retriever(None, collections=self.collections, metadata_tracker=self.metadata_tracker)
+            self.retriever = Retriever(
+                None,
+                collections=self.collections,
+                metadata_tracker=self.metadata_tracker,
+                embedder_backend=embedder_backend,
+                onnx_model_dir=onnx_model_dir,
+                device=embedding_device,
+                enable_dynamic_batching=enable_dynamic_batching,
+                semantic_cache=self.semantic_cache,
+                lexical_prefilter=self.lexical_prefilter
+            )
         else:
-            self.retriever = Retriever(self.collection)
+            self.retriever = Retriever(
+                self.collection,
+                embedder_backend=embedder_backend,
+                onnx_model_dir=onnx_model_dir,
+                device=embedding_device,
+                enable_dynamic_batching=enable_dynamic_batching,
+                semantic_cache=self.semantic_cache,
+                lexical_prefilter=self.lexical_prefilter
+            )
     
-    def _get_or_create_collection(self, name: str):
-        """Get or create a ChromaDB collection."""
+    def _get_or_create_collection(self, name: str, quantization: str = "auto"):
+        """
+        Get or create a ChromaDB collection.
+        
+        Args:
+            name: Collection name
+            quantization: FAISS quantization mode (faiss backend only)
+        """
         try:
             collection = self.client.get_collection(name=name)
+            self._apply_hnsw_ef_search(collection)
         except Exception:
             # Collection doesn't exist, create with expected dimension
             collection = self.client.create_collection(
                 name=name,
-                metadata={"hnsw:space": "cosine", "embedding_dimension": 384}
+                metadata={
+                    "hnsw:space": "cosine",
+                    "hnsw:M": self.hnsw_m,
+                    "hnsw:construction_ef": self.hnsw_ef_construction,
+                    "hnsw:search_ef": self.hnsw_ef_search,
+                    "embedding_dimension": 384
+                }
+            )
+        if self.backend == "faiss":
+            from src.memory.faiss_backend import FaissCollection
+            collection = FaissCollection(
+                collection,
+                index_path=str(self.persist_directory / f"{name}.faiss"),
+                device=self.device,
+                index_type=self.index_type,
+                quantization=quantization
+            )
+        elif self.backend == "flat":
+            from src.memory.flat_backend import FlatCollection
+            collection = FlatCollection(
+                collection,
+                cache_path=None if self.ephemeral else str(self.persist_directory / f"{name}.flat"),
+                dtype=self.flat_dtype
             )
         return collection
     
+    def _apply_hnsw_ef_search(self, collection) -> None:
+        """Update ef_search on an existing collection (M/ef_construction can't change)."""
+        if (collection.metadata or {}).get("hnsw:search_ef") == self.hnsw_ef_search:
+            return
+        try:
+            collection.modify(configuration={"hnsw": {"ef_search": self.hnsw_ef_search}})
+        except Exception as e:
+            # Older ChromaDB only reads HNSW params at creation
+            logger.debug(f"Could not update ef_search on '{collection.name}': {e}")
+    
     def _init_tiered_collections(self) -> Dict[str, Any]:
         """Initialize tiered collections (core, reference, ephemeral)."""
         collections = {}
         for tier in ['core', 'reference', 'ephemeral']:
             collection_name = f"{self.collection_name}_{tier}"
-            collections[tier] = self._get_or_create_collection(collection_name)
+            collections[tier] = self._get_or_create_collection(
+                collection_name, quantization=self.TIER_QUANTIZATION[tier]
+            )
             count = collections[tier].count()
             logger.info(f"Collection '{collection_name}' ({tier}) has {count} documents")
         return collections
     
     async def ingest_documents(
         self,
-        file_paths: List[str],
+        file_paths: List[Union[str, Tuple[str, bytes]]],
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
         tier: str = "reference",
         ttl_seconds: Optional[int] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        batch_size: int = 512,
+        jobs: int = 1,
+        embed_batch_size: int = DocumentIngester.EMBED_BATCH_SIZE
     ) -> Dict[str, Any]:
         """
         Ingest documents into the vector database.
         
         Args:
-            file_paths: List of file paths to ingest
+            file_paths: List of file paths to ingest; an item can also be a
+                        (path, content) tuple for content already in memory,
+                        stored under that path without writing it to disk
             chunk_size: Size of text chunks (characters)
             chunk_overlap: Overlap between chunks (characters)
             tier: Memory tier ('core', 'reference', or 'ephemeral')
             ttl_seconds: Time to live in seconds (None = permanent, only for ephemeral)
             metadata: Additional metadata dictionary
+            batch_size: Chunks per ChromaDB add() call
+            embed_batch_size: Chunks per embedding model forward pass
+            jobs: Worker processes for embedding and, with several PDFs, PDF
+                  text extraction (1 = all in this process)
             
         Returns:
             Dictionary with ingestion statistics
         """
         if tier not in ['core', 'reference', 'ephemeral']:
             raise ValueError(f"Invalid tier: {tier}. Must be 'core', 'reference', or 'ephemeral'")
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch_size: {batch_size}. Must be >= 1")
+        if embed_batch_size < 1:
+            raise ValueError(f"Invalid embed_batch_size: {embed_batch_size}. Must be >= 1")
+        if jobs < 1:
+            raise ValueError(f"Invalid jobs: {jobs}. Must be >= 1")
         
         logger.info(f"Ingesting {len(file_paths)} document(s) into tier '{tier}'")
         
-        all_chunks = []
-        all_metadatas = []
-        all_ids = []
+        batch = ChunkBatch()
         document_registrations = []
+        contents = [item[1] if isinstance(item, tuple) else None for item in file_paths]
+        file_paths = [item[0] if isinstance(item, tuple) else item for item in file_paths]
+        
+        # Load and chunk all files concurrently (reads run in threads). PDF
+        # parsing is pure Python and holds the GIL, so with jobs > 1 several
+        # PDFs are parsed in worker processes instead of contending for it
+        pdf_count = sum(1 for file_path in file_paths if str(file_path).lower().endswith(".pdf"))
+        with contextlib.ExitStack() as stack:
+            pdf_executor = None
+            if jobs > 1 and pdf_count > 1:
+                pdf_executor = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=min(jobs, pdf_count),
+                    mp_context=multiprocessing.get_context("spawn")
+                ))
+            loaded = await asyncio.gather(
+                *(
+                    self.ingester.ingest_file(
+                        file_path,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
+                        pdf_executor=pdf_executor
+                    )
+                    if content is None else
+                    self.ingester.ingest_content(
+                        file_path,
+                        content,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
+                        pdf_executor=pdf_executor
+                    )
+                    for file_path, content in zip(file_paths, contents)
+                ),
+                return_exceptions=True
+            )
         
-        for file_path in file_paths:
+        import hashlib
+        for file_path, content, result in zip(file_paths, contents, loaded):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to ingest {file_path}: {result}")
+                continue
+            chunks, metadatas = result
             try:
-                chunks, metadatas = await self.ingester.ingest_file(
-                    file_path,
-                    chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap
-                )
-                
                 # Register document in metadata tracker
                 doc_id = self.metadata_tracker.register_document(
                     file_path=file_path,
                     tier=tier,
                     ttl_seconds=ttl_seconds,
-                    metadata=metadata
+                    metadata=metadata,
+                    file_hash=hashlib.sha256(content).hexdigest() if content is not None else None
                 )
                 document_registrations.append((doc_id, file_path, len(chunks)))
                 
                 # Generate IDs for chunks (use full path hash to avoid duplicates)
-                import hashlib
                 file_hash = hashlib.md5(str(file_path).encode()).hexdigest()[:8]
                 base_id = Path(file_path).stem
                 chunk_ids_for_file = []
                 for i, chunk in enumerate(chunks):
                     chunk_id = f"{base_id}_{file_hash}_chunk_{i}"
                     chunk_ids_for_file.append(chunk_id)
-                    all_ids.append(chunk_id)
-                    all_chunks.append(chunk)
-                    all_metadatas.append({
+                    batch.append(chunk_id, chunk, {
                         **metadatas[i],
                         "chunk_index": i,
                         "file_path": file_path,
@@ -189,7 +384,7 @@ class RAGServer:
                 logger.error(f"Failed to ingest {file_path}: {e}")
                 continue
         
-        if not all_chunks:
+        if not batch:
             return {
                 "success": False,
                 "message": "No chunks were ingested",
@@ -197,27 +392,29 @@ class RAGServer:
             }
         
         # Generate embeddings and add to collection
-        logger.info(f"Generating embeddings for {len(all_chunks)} chunks...")
-        print(f"   [INFO] Generating embeddings for {len(all_chunks)} chunks...")
+        logger.info(f"Generating embeddings for {len(batch)} chunks...")
+        print(f"   [INFO] Generating embeddings for {len(batch)} chunks...")
         import sys
         sys.stdout.flush()
         
         try:
-            embeddings = await asyncio.wait_for(
-                self.ingester.embed_chunks(all_chunks),
+            batch.embeddings = await asyncio.wait_for(
+                self.ingester.embed_chunks(
+                    batch.texts, jobs=jobs, as_array=True, batch_size=embed_batch_size
+                ),
                 timeout=300  # 5 minute timeout for embedding
             )
-            logger.info(f"Generated {len(embeddings)} embeddings")
-            print(f"   [INFO] Generated {len(embeddings)} embeddings")
+            logger.info(f"Generated {len(batch.embeddings)} embeddings")
+            print(f"   [INFO] Generated {len(batch.embeddings)} embeddings")
         except asyncio.TimeoutError:
-            error_msg = f"Embedding generation timed out after 5 minutes for {len(all_chunks)} chunks"
+            error_msg = f"Embedding generation timed out after 5 minutes for {len(batch)} chunks"
             logger.error(error_msg)
             print(f"   [ERROR] {error_msg}")
             raise RuntimeError(error_msg)
         
         # Add to ChromaDB (tiered or single collection)
-        logger.info(f"Adding {len(all_chunks)} chunks to ChromaDB (tier={tier})...")
-        print(f"   [INFO] Adding {len(all_chunks)} chunks to ChromaDB (tier={tier})...")
+        logger.info(f"Adding {len(batch)} chunks to ChromaDB (tier={tier})...")
+        print(f"   [INFO] Adding {len(batch)} chunks to ChromaDB (tier={tier})...")
         sys.stdout.flush()
         
         # Select target collection
@@ -231,29 +428,52 @@ class RAGServer:
             await asyncio.wait_for(
                 loop.run_in_executor(
                     None,
-                    lambda: target_collection.add(
-                        ids=all_ids,
-                        documents=all_chunks,
-                        embeddings=embeddings,
-                        metadatas=all_metadatas
-                    )
+                    lambda: self._add_in_batches(target_collection, batch, batch_size)
                 ),
                 timeout=300  # 5 minute timeout for ChromaDB add
             )
-            logger.info(f"Added {len(all_chunks)} chunks to {tier} tier")
-            print(f"   [INFO] Added {len(all_chunks)} chunks to {tier} tier")
+            logger.info(f"Added {len(batch)} chunks to {tier} tier")
+            print(f"   [INFO] Added {len(batch)} chunks to {tier} tier")
         except asyncio.TimeoutError:
-            error_msg = f"ChromaDB add operation timed out after 5 minutes for {len(all_chunks)} chunks"
+            error_msg = f"ChromaDB add operation timed out after 5 minutes for {len(batch)} chunks"
             logger.error(error_msg)
             print(f"   [ERROR] {error_msg}")
             raise RuntimeError(error_msg)
+        finally:
+            self._invalidate_caches()
         
         return {
             "success": True,
-            "chunks_ingested": len(all_chunks),
+            "chunks_ingested": len(batch),
             "files_processed": len(file_paths)
         }
     
+    def _add_in_batches(
+        self,
+        collection,
+        batch: ChunkBatch,
+        batch_size: int
+    ) -> None:
+        """
+        Add chunks to a collection in fixed-size slices.
+        
+        Each add() is one SQLite transaction plus an HNSW update, so slices
+        amortize that overhead while staying under ChromaDB's max batch size.
+        """
+        max_batch_size = getattr(self.client, "get_max_batch_size", None)
+        if max_batch_size is not None:
+            batch_size = min(batch_size, max_batch_size())
+        
+        for start in range(0, len(batch), batch_size):
+            end = start + batch_size
+            collection.add(
+                ids=batch.ids[start:end],
+                documents=batch.texts[start:end],
+                embeddings=batch.embeddings[start:end],
+                metadatas=batch.metadatas[start:end]
+            )
+            logger.debug(f"Added chunks {start}-{min(end, len(batch))} of {len(batch)}")
+    
     async def retrieve_context(
         self,
         query: str,
@@ -283,21 +503,132 @@ class RAGServer:
                 tier_counts[tier] = count
                 total_chunks += count
             metadata_stats = self.metadata_tracker.get_stats()
-            return {
+            stats = {
                 "total_chunks": total_chunks,
                 "tier_counts": tier_counts,
                 "persist_directory": str(self.persist_directory),
                 "tiering_enabled": True,
+                "backend": self.backend,
                 "metadata_stats": metadata_stats
             }
+            if self.backend in ["faiss", "flat"]:
+                stats["index_stats"] = {
+                    tier: collection.index_stats()
+                    for tier, collection in self.collections.items()
+                }
+            return stats
         else:
             count = self.collection.count()
-            return {
+            stats = {
                 "total_chunks": count,
                 "collection_name": self.collection_name,
                 "persist_directory": str(self.persist_directory),
-                "tiering_enabled": False
+                "tiering_enabled": False,
+                "backend": self.backend
             }
+            if self.backend in ["faiss", "flat"]:
+                stats["index_stats"] = self.collection.index_stats()
+            return stats
+    
+    def delete_file(self, file_path: str) -> int:
+        """
+        Delete every chunk ingested from a file (e.g. removed from its source).
+        
+        Args:
+            file_path: Path the file was ingested from
+            
+        Returns:
+            Number of chunks deleted
+        """
+        collections = self.collections.values() if self.enable_tiering else [self.collection]
+        deleted = 0
+        for collection in collections:
+            chunk_ids = collection.get(where={"file_path": file_path}, include=[])["ids"]
+            if chunk_ids:
+                collection.delete(ids=chunk_ids)
+                deleted += len(chunk_ids)
+        
+        doc_id = self.metadata_tracker.get_document_id(file_path)
+        if doc_id is not None:
+            self.metadata_tracker.delete_document(doc_id)
+        
+        self._invalidate_caches()
+        logger.info(f"Deleted {deleted} chunks from {file_path}")
+        return deleted
+    
+    def copy_file(
+        self,
+        source_path: str,
+        file_path: str,
+        file_hash: str,
+        tier: str = "reference",
+        ttl_seconds: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Store an already ingested file's chunks again under another path and tier.
+        
+        For identical content synced from two places: the stored chunks and
+        embeddings are reused, so nothing is re-read or re-embedded.
+        
+        Args:
+            source_path: Path the content was ingested from
+            file_path: Path to register the copy under
+            file_hash: Content hash of the copy
+            tier: Memory tier ('core', 'reference', or 'ephemeral')
+            ttl_seconds: Time to live in seconds (None = permanent, only for ephemeral)
+            metadata: Additional metadata dictionary
+            
+        Returns:
+            Number of chunks copied (0 if source_path has none)
+        """
+        if tier not in ['core', 'reference', 'ephemeral']:
+            raise ValueError(f"Invalid tier: {tier}. Must be 'core', 'reference', or 'ephemeral'")
+        
+        collections = self.collections.values() if self.enable_tiering else [self.collection]
+        source = None
+        for collection in collections:
+            result = collection.get(
+                where={"file_path": source_path},
+                include=["documents", "embeddings", "metadatas"]
+            )
+            if result["ids"]:
+                source = result
+                break
+        if source is None:
+            return 0
+        
+        doc_id = self.metadata_tracker.register_document(
+            file_path=file_path,
+            tier=tier,
+            ttl_seconds=ttl_seconds,
+            metadata=metadata,
+            file_hash=file_hash
+        )
+        
+        import hashlib
+        path_hash = hashlib.md5(str(file_path).encode()).hexdigest()[:8]
+        base_id = Path(file_path).stem
+        batch = ChunkBatch()
+        for text, chunk_metadata in zip(source["documents"], source["metadatas"]):
+            i = chunk_metadata.get("chunk_index", len(batch))
+            batch.append(f"{base_id}_{path_hash}_chunk_{i}", text, {
+                **chunk_metadata,
+                "source": Path(file_path).name,
+                "file_path": file_path,
+                "tier": tier
+            })
+        batch.embeddings = source["embeddings"]
+        
+        target_collection = self.collections[tier] if self.enable_tiering else self.collection
+        try:
+            self._add_in_batches(target_collection, batch, 512)
+        finally:
+            self._invalidate_caches()
+        self.metadata_tracker.register_chunks(doc_id, batch.ids)
+        
+        logger.info(f"Copied {len(batch)} chunks from {source_path} to {file_path} (tier={tier})")
+        return len(batch)
     
     def clear_memory(self, tier: Optional[str] = None) -> None:
         """
@@ -322,6 +653,20 @@ class RAGServer:
             self.client.delete_collection(self.collection_name)
             self.collection = self._get_or_create_collection(self.collection_name)
             logger.warning("Memory cleared!")
+        self._invalidate_caches()
+    
+    def _invalidate_caches(self) -> None:
+        """Drop cached retrieval results and vocabulary after the collections change."""
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+        if self.lexical_prefilter is not None:
+            self.lexical_prefilter.invalidate()
+    
+    def _stored_documents(self) -> Iterator[str]:
+        """Yield the text of every stored chunk (for the lexical prefilter)."""
+        collections = self.collections.values() if self.enable_tiering else [self.collection]
+        for collection in collections:
+            yield from collection.get(include=["documents"])["documents"]
     
     async def cleanup_expired(self) -> Dict[str, Any]:
         """
@@ -358,9 +703,66 @@ class RAGServer:
             # Delete from metadata tracker
             self.metadata_tracker.delete_document(doc_id)
         
+        self._invalidate_caches()
         return {
             "expired_count": len(expired),
             "chunks_deleted": total_chunks_deleted,
             "message": f"Cleaned up {len(expired)} expired documents"
         }
 
+    
+    async def close(self) -> None:
+        """
+        Release the ChromaDB client and stop background tasks.
+        
+        The underlying ChromaDB system is shared by every client on the same
+        path and only stopped when the last one closes, so a new RAGServer
+        on persist_directory can be opened right after this returns.
+        """
+        if self.retriever._batcher is not None:
+            await self.retriever._batcher.close()
+        
+        with _default_servers_lock:
+            for key, server in list(_default_servers.items()):
+                if server is self:
+                    del _default_servers[key]
+        
+        self.collections = None
+        self.collection = None
+        close_client = getattr(self.client, "close", None)  # Older ChromaDB has no close()
+        if close_client is not None:
+            close_client()
+        logger.info(f"RAG Server closed: {self.persist_directory}")
+    
+    async def __aenter__(self) -> "RAGServer":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+def get_default_rag_server(**kwargs) -> RAGServer:
+    """
+    Shared RAGServer for the given arguments, created on first use.
+    
+    Scripts that run in the same process (e.g. Drive sync and chat) get one
+    server, so the ChromaDB client and embedding model are loaded once.
+    Arguments are compared after filling in RAGServer's defaults, so
+    RAGServer(enable_tiering=True) and RAGServer(persist_directory=None,
+    enable_tiering=True) share an instance. A closed server is replaced.
+    
+    Args:
+        **kwargs: RAGServer arguments (must be hashable)
+        
+    Returns:
+        RAGServer instance
+    """
+    bound = inspect.signature(RAGServer).bind(**kwargs)
+    bound.apply_defaults()
+    key = tuple(sorted(bound.arguments.items()))
+    with _default_servers_lock:
+        server = _default_servers.get(key)
+        if server is None:
+            server = RAGServer(**kwargs)
+            _default_servers[key] = server
+        return server
@@ -4,6 +4,14 @@ import logging
 from typing import List, Dict, Any, Optional
 import asyncio
 
+from src.memory.batched_embedder import BatchedEmbedder
+from src.memory.onnx_embedder import EMBEDDER_BACKENDS
+from src.memory.document_ingester import (
+    format_query,
+    get_embedding_model,
+    resolve_embedding_device
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,7 +21,18 @@ class Retriever:
     Supports tiered memory with weighted retrieval.
     """
     
-    def __init__(self, collection=None, collections=None, metadata_tracker=None):
+    def __init__(
+        self,
+        collection=None,
+        collections=None,
+        metadata_tracker=None,
+        embedder_backend: str = "sentence-transformers",
+        onnx_model_dir: Optional[str] = None,
+        device: str = "cpu",
+        enable_dynamic_batching: bool = False,
+        semantic_cache=None,
+        lexical_prefilter=None
+    ):
         """
         Initialize retriever.
         
@@ -21,11 +40,29 @@ class Retriever:
             collection: Single ChromaDB collection (backward compatible)
             collections: Dict of tiered collections {'core': coll, 'reference': coll, 'ephemeral': coll}
             metadata_tracker: MetadataTracker instance for tier lookup
+            embedder_backend: 'sentence-transformers' or 'onnx-int8' (must match ingestion)
+            onnx_model_dir: Quantized model directory (onnx-int8 only)
+            device: Torch device for sentence-transformers ('cpu', 'cuda', 'mps', 'auto')
+            enable_dynamic_batching: Coalesce concurrent query embeddings into one
+                                     encode() call (adds up to 50ms per query)
+            semantic_cache: SemanticCache to reuse results of near-duplicate queries
+            lexical_prefilter: LexicalPrefilter to skip queries with no term in the corpus
         """
+        if embedder_backend not in EMBEDDER_BACKENDS:
+            raise ValueError(
+                f"Invalid embedder_backend: {embedder_backend}. "
+                f"Must be one of {EMBEDDER_BACKENDS}"
+            )
+        self.embedder_backend = embedder_backend
+        self.onnx_model_dir = onnx_model_dir
+        self.device = device
         self.collection = collection
         self.collections = collections
         self.metadata_tracker = metadata_tracker
         self._embedding_model = None
+        self._batcher = BatchedEmbedder(self._embed_local) if enable_dynamic_batching else None
+        self.semantic_cache = semantic_cache
+        self.lexical_prefilter = lexical_prefilter
         
         # Tier weights for weighted retrieval
         self.tier_weights = {
@@ -52,15 +89,38 @@ class Retriever:
         Returns:
             List of relevant chunks with metadata and scores (weighted)
         """
+        # Empty collections can't match anything: skip querying them, and
+        # skip embedding the query entirely if there is nothing to search
+        if self.collections:
+            searchable = {
+                tier: collection for tier, collection in self.collections.items()
+                if not self._is_empty(collection)
+            }
+            nothing_to_search = not searchable
+        else:
+            nothing_to_search = self._is_empty(self.collection)
+        if nothing_to_search:
+            logger.info("No chunks stored, skipping query embedding")
+            return []
+        if self.lexical_prefilter is not None and not self.lexical_prefilter.may_match(query):
+            logger.info("No query term occurs in stored chunks, skipping query embedding")
+            return []
+        
         # Generate query embedding
         query_embedding = await self._embed_query(query)
         
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.get(query_embedding, (top_k, min_score))
+            if cached is not None:
+                logger.info(f"Semantic cache hit: {len(cached)} chunks for query")
+                return cached
+        
         # Retrieve from tiered collections or single collection
         if self.collections:
-            # Tiered retrieval: query all tiers and merge with weights
+            # Tiered retrieval: query all non-empty tiers and merge with weights
             all_chunks = []
             
-            for tier, collection in self.collections.items():
+            for tier, collection in searchable.items():
                 weight = self.tier_weights.get(tier, 1.0)
                 
                 # Query more results per tier to account for weighting
@@ -131,13 +191,24 @@ class Retriever:
         
         logger.info(f"Retrieved {len(chunks)} chunks for query (min_score={min_score})")
         
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(query_embedding, (top_k, min_score), chunks)
         return chunks
     
+    @staticmethod
+    def _is_empty(collection) -> bool:
+        """Whether a collection is known to hold no chunks (needs count())."""
+        count = getattr(collection, "count", None)
+        return count is not None and count() == 0
+    
     async def _embed_query(self, query: str) -> List[float]:
         """Generate embedding for query text."""
         # Use the same embedding logic as DocumentIngester
         # Must use local model to match document embeddings (384 dimensions)
+        query = format_query(query)
         try:
+            if self._batcher is not None:
+                return await self._batcher.embed(query)
             embeddings = await self._embed_local([query])
             return embeddings[0]
         except Exception as e:
@@ -149,23 +220,17 @@ class Retriever:
     
     async def _embed_local(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings using local model."""
-        try:
-            from sentence_transformers import SentenceTransformer
-        except ImportError:
-            raise ImportError("Local embeddings require sentence-transformers")
-        
-        model_name = "sentence-transformers/all-MiniLM-L6-v2"
-        
         if self._embedding_model is None:
-            import asyncio
+            # Shared with DocumentIngester: one model per process
             loop = asyncio.get_event_loop()
             self._embedding_model = await loop.run_in_executor(
                 None,
-                SentenceTransformer,
-                model_name
+                get_embedding_model,
+                self.embedder_backend,
+                resolve_embedding_device(self.device),
+                self.onnx_model_dir
             )
         
-        import asyncio
         loop = asyncio.get_event_loop()
         def encode_texts():
             return self._embedding_model.encode(
@@ -180,29 +245,29 @@ class Retriever:
         """Generate embeddings using API (fallback)."""
         import os
         from dotenv import load_dotenv
-        import httpx
+        from src.common.httpclient import get_shared_client
         
         load_dotenv()
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise ValueError("No embedding method available")
         
-        async with httpx.AsyncClient() as client:
-            embeddings = []
-            for text in texts:
-                url = f"https://generativelanguage.googleapis.com/v1beta/models/embedding-001:embedContent?key={api_key}"
-                response = await client.post(
-                    url,
-                    json={
-                        "model": "models/embedding-001",
-                        "content": {"parts": [{"text": text}]}
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                embeddings.append(data["embedding"]["values"])
-            
-            return embeddings
+        client = get_shared_client()
+        embeddings = []
+        for text in texts:
+            url = f"https://generativelanguage.googleapis.com/v1beta/models/embedding-001:embedContent?key={api_key}"
+            response = await client.post(
+                url,
+                json={
+                    "model": "models/embedding-001",
+                    "content": {"parts": [{"text": text}]}
+                }
+            )
+            response.raise_for_status()
+            data = response.json()
+            embeddings.append(data["embedding"]["values"])
+        
+        return embeddings
     
     def format_context(self, chunks: List[Dict[str, Any]]) -> str:
         """
@@ -0,0 +1,126 @@
+"""Semantic Cache: Reuse retrieval results for near-duplicate queries."""
+
+import logging
+import threading
+from typing import Any, Dict, Hashable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_THRESHOLD = 0.92  # Cosine similarity for a hit
+
+
+class SemanticCache:
+    """
+    LRU cache of retrieval results keyed by query embedding similarity.
+
+    Cached query embeddings live in one (max_entries, dim) matrix, so a
+    lookup is a single matrix-vector product: if the most similar cached
+    query (with the same retrieval parameters) is above `threshold`, its
+    chunks are returned and the vector search is skipped. Embeddings are
+    expected to be normalized, so the inner product is cosine similarity.
+
+    Results go stale when the collections change; call clear() after
+    ingesting or deleting documents.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        threshold: float = DEFAULT_THRESHOLD
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            max_entries: Cached queries kept (least recently used evicted first)
+            threshold: Minimum cosine similarity to reuse a cached result
+        """
+        if max_entries < 1:
+            raise ValueError(f"Invalid max_entries: {max_entries}. Must be >= 1")
+        if not -1.0 <= threshold <= 1.0:
+            raise ValueError(f"Invalid threshold: {threshold}. Must be between -1 and 1")
+
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._embeddings: Optional[np.ndarray] = None  # Allocated on first put()
+            self._params: List[Hashable] = [None] * self.max_entries
+            self._results: List[Optional[List[Dict[str, Any]]]] = [None] * self.max_entries
+            self._last_used = np.zeros(self.max_entries, dtype=np.int64)
+            self._size = 0
+            self._clock = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, embedding: List[float], params: Hashable) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up results for a query embedding.
+
+        Args:
+            embedding: Normalized query embedding
+            params: Retrieval parameters that must match exactly (e.g. top_k, min_score)
+
+        Returns:
+            Cached chunks, or None on a miss
+        """
+        with self._lock:
+            if self._size == 0:
+                self.misses += 1
+                return None
+            query = np.asarray(embedding, dtype=np.float32)
+            sims = self._embeddings[:self._size] @ query
+            # Entries cached with other parameters can't be hits
+            for slot, slot_params in enumerate(self._params[:self._size]):
+                if slot_params != params:
+                    sims[slot] = -np.inf
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self._clock += 1
+            self._last_used[best] = self._clock
+            self.hits += 1
+            return list(self._results[best])
+
+    def put(
+        self,
+        embedding: List[float],
+        params: Hashable,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Cache results for a query embedding, evicting the least recently used.
+
+        Args:
+            embedding: Normalized query embedding
+            params: Retrieval parameters the results were produced with
+            results: Retrieved chunks
+        """
+        with self._lock:
+            query = np.asarray(embedding, dtype=np.float32)
+            if self._embeddings is None:
+                self._embeddings = np.zeros((self.max_entries, len(query)), dtype=np.float32)
+
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used))
+
+            self._clock += 1
+            self._embeddings[slot] = query
+            self._params[slot] = params
+            self._results[slot] = list(results)
+            self._last_used[slot] = self._clock
+
+    def __len__(self) -> int:
+        return self._size
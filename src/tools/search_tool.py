@@ -6,6 +6,7 @@ import asyncio
 import warnings
 from typing import Dict, Any, List
 from src.tools.base_tool import Tool
+from src.common.httpclient import get_shared_client
 
 logger = logging.getLogger(__name__)
 
@@ -235,30 +236,31 @@ class NewsTool(Tool):
             
             base_url = "https://hacker-news.firebaseio.com/v0"
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Get story IDs
-                response = await client.get(f"{base_url}/{endpoint}.json")
-                response.raise_for_status()
-                story_ids = response.json()[:max_results]
+            client = get_shared_client()
+            # Get story IDs
+            response = await client.get(f"{base_url}/{endpoint}.json", timeout=10.0)
+            response.raise_for_status()
+            story_ids = response.json()[:max_results]
                 
-                # Get story details
-                stories = []
-                for story_id in story_ids:
-                    story_response = await client.get(
-                        f"{base_url}/item/{story_id}.json"
-                    )
-                    story_response.raise_for_status()
-                    story = story_response.json()
+            # Get story details
+            stories = []
+            for story_id in story_ids:
+                story_response = await client.get(
+                    f"{base_url}/item/{story_id}.json",
+                    timeout=10.0
+                )
+                story_response.raise_for_status()
+                story = story_response.json()
                     
-                    if story and story.get("type") == "story":
-                        stories.append({
-                            "title": story.get("title", ""),
-                            "url": story.get("url", ""),
-                            "score": story.get("score", 0),
-                            "comments": story.get("descendants", 0),
-                            "author": story.get("by", ""),
-                            "time": story.get("time", 0)  # Unix timestamp
-                        })
+                if story and story.get("type") == "story":
+                    stories.append({
+                        "title": story.get("title", ""),
+                        "url": story.get("url", ""),
+                        "score": story.get("score", 0),
+                        "comments": story.get("descendants", 0),
+                        "author": story.get("by", ""),
+                        "time": story.get("time", 0)  # Unix timestamp
+                    })
             
             if not stories:
                 return {
@@ -6,6 +6,7 @@ import os
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 from src.tools.base_tool import Tool
+from src.common.httpclient import get_shared_client
 
 load_dotenv()
 
@@ -80,22 +81,22 @@ class WeatherTool(Tool):
         }
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                data = response.json()
+            client = get_shared_client()
+            response = await client.get(self.base_url, params=params, timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
                 
-                # Format response
-                result = {
-                    "location": f"{data['name']}, {data['sys']['country']}",
-                    "temperature": f"{data['main']['temp']:.1f}°{'C' if units == 'metric' else 'F' if units == 'imperial' else 'K'}",
-                    "conditions": data['weather'][0]['description'].title(),
-                    "humidity": f"{data['main']['humidity']}%",
-                    "wind_speed": f"{data['wind']['speed']} m/s" if units == 'metric' else f"{data['wind']['speed']} mph",
-                    "feels_like": f"{data['main']['feels_like']:.1f}°{'C' if units == 'metric' else 'F' if units == 'imperial' else 'K'}"
-                }
+            # Format response
+            result = {
+                "location": f"{data['name']}, {data['sys']['country']}",
+                "temperature": f"{data['main']['temp']:.1f}°{'C' if units == 'metric' else 'F' if units == 'imperial' else 'K'}",
+                "conditions": data['weather'][0]['description'].title(),
+                "humidity": f"{data['main']['humidity']}%",
+                "wind_speed": f"{data['wind']['speed']} m/s" if units == 'metric' else f"{data['wind']['speed']} mph",
+                "feels_like": f"{data['main']['feels_like']:.1f}°{'C' if units == 'metric' else 'F' if units == 'imperial' else 'K'}"
+            }
                 
-                return {"result": result}
+            return {"result": result}
                 
         except httpx.HTTPError as e:
             logger.error(f"Weather API error: {e}")
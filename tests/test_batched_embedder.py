@@ -0,0 +1,71 @@
+"""Unit tests for BatchedEmbedder."""
+
+import pytest
+import asyncio
+
+from src.memory.batched_embedder import BatchedEmbedder
+
+
+class TestBatchedEmbedder:
+    """Test suite for BatchedEmbedder."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self):
+        """Concurrent embed() calls are embedded together, each gets its own vector."""
+        batches = []
+
+        async def embed_batch(texts):
+            batches.append(list(texts))
+            return [[float(len(text))] for text in texts]
+
+        embedder = BatchedEmbedder(embed_batch, max_wait=0.05)
+        texts = ["a", "bb", "ccc", "dddd"]
+        results = await asyncio.gather(*(embedder.embed(text) for text in texts))
+        await embedder.close()
+
+        assert results == [[1.0], [2.0], [3.0], [4.0]]
+        assert batches == [texts]
+
+    @pytest.mark.asyncio
+    async def test_batches_capped_at_max_batch_size(self):
+        """More concurrent calls than max_batch_size are split across batches."""
+        batches = []
+
+        async def embed_batch(texts):
+            batches.append(len(texts))
+            return [[0.0] for _ in texts]
+
+        embedder = BatchedEmbedder(embed_batch, max_batch_size=3, max_wait=0.01)
+        await asyncio.gather(*(embedder.embed(str(i)) for i in range(7)))
+        await embedder.close()
+
+        assert batches == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller_and_worker_survives(self):
+        """A failed batch fails its callers; later calls still work."""
+        fail = True
+
+        async def embed_batch(texts):
+            if fail:
+                raise RuntimeError("model not loaded")
+            return [[1.0] for _ in texts]
+
+        embedder = BatchedEmbedder(embed_batch, max_wait=0.01)
+        results = await asyncio.gather(
+            embedder.embed("a"), embedder.embed("b"), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        fail = False
+        assert await embedder.embed("c") == [1.0]
+        await embedder.close()
+
+    def test_invalid_arguments(self):
+        async def embed_batch(texts):
+            return []
+
+        with pytest.raises(ValueError, match="Invalid max_batch_size"):
+            BatchedEmbedder(embed_batch, max_batch_size=0)
+        with pytest.raises(ValueError, match="Invalid max_wait"):
+            BatchedEmbedder(embed_batch, max_wait=-1)
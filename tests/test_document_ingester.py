@@ -3,7 +3,9 @@
 import pytest
 import asyncio
 from pathlib import Path
-from src.memory.document_ingester import DocumentIngester
+from src.memory.document_ingester import (
+    DocumentIngester, chunk_starts, resolve_embedding_device, sentence_ends, _split_evenly
+)
 
 
 class TestDocumentIngester:
@@ -230,3 +232,227 @@ class TestDocumentIngester:
                 f"may indicate stride bug"
             )
 
+    
+    def test_chunk_starts_matches_chunk_count(self):
+        """chunk_starts() predicts how many chunks _chunk_text() produces."""
+        ingester = DocumentIngester()
+        text = "A sentence here. " * 50
+        
+        for chunk_size, overlap in [(150, 30), (1000, 200), (100, 0)]:
+            starts = chunk_starts(len(text), chunk_size, overlap)
+            assert len(ingester._chunk_text(text, chunk_size, overlap)) == len(starts)
+        
+        with pytest.raises(ValueError, match="Invalid chunk_overlap"):
+            chunk_starts(len(text), 100, 100)
+    
+    def test_sentence_ends_overlapping_and_non_ascii(self, monkeypatch):
+        """Sentence endings are found in order, overlapping, as character offsets."""
+        from src.memory import document_ingester
+        monkeypatch.setattr(document_ingester, "hyperscan", None)
+        
+        assert sentence_ends("One. Two! Three?\n\n\nFour") == [3, 8, 16, 17]
+        assert sentence_ends("Café. Déjà vu? Oui") == [4, 13]
+    
+    def test_sentence_ends_hyperscan_matches_re(self, monkeypatch):
+        """The Hyperscan scan finds the same offsets as the re fallback."""
+        pytest.importorskip("hyperscan")
+        from src.memory import document_ingester
+        text = "A sentence here. Another! Really?\n\n\nEnd. " * 20
+        
+        with_hyperscan = sentence_ends(text)
+        monkeypatch.setattr(document_ingester, "hyperscan", None)
+        
+        assert with_hyperscan == sentence_ends(text)
+    
+    @pytest.mark.asyncio
+    async def test_embed_api_concurrent_preserves_order(self, monkeypatch):
+        """API fallback fans requests out concurrently but keeps chunk order."""
+        from src.common import httpclient
+        
+        in_flight = 0
+        max_in_flight = 0
+        
+        class FakeResponse:
+            def __init__(self, value):
+                self._value = value
+            
+            def raise_for_status(self):
+                pass
+            
+            def json(self):
+                return {"embedding": {"values": [self._value]}}
+        
+        class FakeClient:
+            async def post(self, url, json):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                text = json["content"]["parts"][0]["text"]
+                # Later chunks finish first to prove ordering is preserved
+                await asyncio.sleep(0.01 * (10 - int(text)))
+                in_flight -= 1
+                return FakeResponse(float(text))
+        
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        monkeypatch.setattr(httpclient, "get_shared_client", FakeClient)
+        
+        ingester = DocumentIngester()
+        chunks = [str(i) for i in range(10)]
+        embeddings = await ingester._embed_api(chunks, concurrency=3)
+        
+        assert embeddings == [[float(i)] for i in range(10)]
+        assert 1 < max_in_flight <= 3
+    
+    @pytest.mark.asyncio
+    async def test_embed_local_single_batched_encode(self):
+        """All chunks go through one encode() call with the ingestion batch size."""
+        import numpy as np
+        
+        calls = []
+        
+        class FakeModel:
+            def encode(self, texts, **kwargs):
+                calls.append((list(texts), kwargs))
+                return np.ones((len(texts), 3))
+        
+        ingester = DocumentIngester()
+        ingester._embedding_model = FakeModel()
+        chunks = [f"chunk {i}" for i in range(100)]
+        embeddings = await ingester._embed_local(chunks)
+        
+        assert len(embeddings) == 100
+        assert len(calls) == 1
+        assert calls[0][1]["batch_size"] == DocumentIngester.EMBED_BATCH_SIZE
+        assert calls[0][1]["normalize_embeddings"] is True
+        
+        await ingester.embed_chunks(chunks, batch_size=16)
+        assert calls[1][1]["batch_size"] == 16
+    
+    @pytest.mark.asyncio
+    async def test_asymmetric_prefixes(self, monkeypatch):
+        """Chunks get the passage prefix and queries the query prefix."""
+        import numpy as np
+        from src.memory import document_ingester
+        from src.memory.retriever import Retriever
+        
+        monkeypatch.setattr(document_ingester, "QUERY_PREFIX", "query: ")
+        monkeypatch.setattr(document_ingester, "PASSAGE_PREFIX", "passage: ")
+        encoded = []
+        
+        class FakeModel:
+            def encode(self, texts, **kwargs):
+                encoded.extend(texts)
+                return np.ones((len(texts), 3))
+        
+        ingester = DocumentIngester()
+        ingester._embedding_model = FakeModel()
+        await ingester.embed_chunks(["Pironman5 MAX case"])
+        retriever = Retriever(None)
+        retriever._embedding_model = FakeModel()
+        await retriever._embed_query("What is the Pironman5?")
+        
+        assert encoded == ["passage: Pironman5 MAX case", "query: What is the Pironman5?"]
+    
+    @pytest.mark.asyncio
+    async def test_load_large_text_file_via_mmap(self, temp_dir, monkeypatch):
+        """Memory-mapped reads match read_text(), including newline handling."""
+        monkeypatch.setattr(DocumentIngester, "MMAP_MIN_BYTES", 16)
+        path = Path(temp_dir) / "large.txt"
+        path.write_bytes("café line one\r\nline two\rline three\n".encode("utf-8") * 10)
+        
+        text = await DocumentIngester()._load_text(path)
+        
+        assert text == path.read_text(encoding="utf-8")
+    
+    @pytest.mark.asyncio
+    async def test_ingest_content_matches_file(self, temp_dir):
+        """In-memory content is chunked exactly like the same file on disk."""
+        content = "Line one.\r\nLine two.\n\nSecond paragraph. ".encode("utf-8") * 50
+        path = Path(temp_dir) / "notes.md"
+        path.write_bytes(content)
+        ingester = DocumentIngester()
+        
+        from_file = await ingester.ingest_file(str(path), chunk_size=200, chunk_overlap=20)
+        from_memory = await ingester.ingest_content(str(path), content, chunk_size=200, chunk_overlap=20)
+        
+        assert from_memory == from_file
+        with pytest.raises(ValueError, match="Unsupported file type"):
+            await ingester.ingest_content("notes.docx", content)
+    
+    def test_split_evenly_for_worker_processes(self):
+        """Chunks are split into contiguous near-equal slices, in order."""
+        chunks = [f"chunk {i}" for i in range(10)]
+        slices = _split_evenly(chunks, 3)
+        
+        assert [len(s) for s in slices] == [4, 3, 3]
+        assert [c for s in slices for c in s] == chunks
+        assert _split_evenly(chunks[:2], 4) == [["chunk 0"], ["chunk 1"]]
+    
+    @pytest.mark.asyncio
+    async def test_embed_local_gpu_copies_to_host_once(self):
+        """On a GPU device, encode() returns a tensor that is moved to host once."""
+        import numpy as np
+        
+        calls = []
+        
+        class FakeTensor:
+            def __init__(self, n):
+                self.n = n
+            
+            def cpu(self):
+                calls.append("cpu")
+                return self
+            
+            def numpy(self):
+                return np.ones((self.n, 3))
+        
+        class FakeModel:
+            def encode(self, texts, **kwargs):
+                calls.append(kwargs.get("convert_to_tensor"))
+                return FakeTensor(len(texts))
+        
+        ingester = DocumentIngester(device="cuda")
+        ingester._embedding_model = FakeModel()
+        embeddings = await ingester._embed_local(["a", "b"])
+        
+        assert embeddings == [[1.0] * 3] * 2
+        assert calls == [True, "cpu"]
+    
+    def test_resolve_embedding_device(self, monkeypatch):
+        """Explicit devices pass through; 'auto' falls back to CPU without torch."""
+        import sys
+        
+        assert resolve_embedding_device("mps") == "mps"
+        monkeypatch.setitem(sys.modules, "torch", None)
+        assert resolve_embedding_device("auto") == "cpu"
+    
+    @pytest.mark.asyncio
+    async def test_embedding_model_shared_across_instances(self, monkeypatch):
+        """Ingesters and retrievers in one process load the model once."""
+        import sys
+        import types
+        from src.memory import document_ingester
+        from src.memory.retriever import Retriever
+        
+        loads = []
+        
+        class FakeSentenceTransformer:
+            def __init__(self, model_name, device):
+                loads.append((model_name, device))
+            
+            def encode(self, texts, **kwargs):
+                import numpy as np
+                return np.ones((len(texts), 3))
+        
+        fake_module = types.ModuleType("sentence_transformers")
+        fake_module.SentenceTransformer = FakeSentenceTransformer
+        monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+        monkeypatch.setattr(document_ingester, "_MODEL_CACHE", {})
+        
+        first = document_ingester.get_embedding_model(device="cpu")
+        assert document_ingester.get_embedding_model(device="cpu") is first
+        
+        retriever = Retriever()
+        await retriever._embed_local(["query"])
+        assert retriever._embedding_model is first
+        assert loads == [(document_ingester.SENTENCE_TRANSFORMER_MODEL, "cpu")]
@@ -0,0 +1,255 @@
+"""Unit tests for FaissCollection."""
+
+import pytest
+from pathlib import Path
+
+faiss = pytest.importorskip("faiss")
+np = pytest.importorskip("numpy")
+chromadb = pytest.importorskip("chromadb")
+
+from src.memory.faiss_backend import FaissCollection
+
+
+DIM = 384
+
+
+def random_unit_vectors(n, seed=0):
+    """Generate normalized random vectors (like normalized embeddings)."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, DIM)).astype("float32")
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+class TestFaissCollection:
+    """Test suite for FaissCollection."""
+
+    @pytest.fixture
+    def chroma_collection(self, temp_dir):
+        """Create an empty ChromaDB collection."""
+        client = chromadb.PersistentClient(path=temp_dir)
+        return client.create_collection(
+            name="faiss_test",
+            metadata={"hnsw:space": "cosine"}
+        )
+
+    def make_collection(self, chroma_collection, temp_dir, **kwargs):
+        return FaissCollection(
+            chroma_collection,
+            index_path=str(Path(temp_dir) / "faiss_test.faiss"),
+            dimension=DIM,
+            **kwargs
+        )
+
+    def add_vectors(self, collection, vectors, prefix="chunk"):
+        ids = [f"{prefix}_{i}" for i in range(len(vectors))]
+        collection.add(
+            ids=ids,
+            documents=[f"document {i}" for i in range(len(vectors))],
+            embeddings=vectors.tolist(),
+            metadatas=[{"source": f"{prefix}.txt", "chunk_index": i} for i in range(len(vectors))]
+        )
+        return ids
+
+    def test_query_empty_collection(self, chroma_collection, temp_dir):
+        """Querying an empty index returns empty Chroma-shaped results."""
+        collection = self.make_collection(chroma_collection, temp_dir)
+
+        results = collection.query(query_embeddings=[[0.1] * DIM], n_results=5)
+
+        assert results["ids"] == [[]]
+        assert results["distances"] == [[]]
+
+    def test_query_returns_nearest_with_cosine_distance(self, chroma_collection, temp_dir):
+        """Exact (flat) search returns the stored vector first with distance ~0."""
+        collection = self.make_collection(chroma_collection, temp_dir)
+        vectors = random_unit_vectors(50)
+        ids = self.add_vectors(collection, vectors)
+
+        results = collection.query(query_embeddings=[vectors[7].tolist()], n_results=3)
+
+        assert results["ids"][0][0] == ids[7]
+        assert results["documents"][0][0] == "document 7"
+        assert results["metadatas"][0][0]["chunk_index"] == 7
+        assert results["distances"][0][0] == pytest.approx(0.0, abs=1e-5)
+        assert len(results["ids"][0]) == 3
+        assert collection.count() == 50
+
+    def test_duplicate_ids_not_double_indexed(self, chroma_collection, temp_dir):
+        """Re-adding existing IDs doesn't create duplicate vectors."""
+        collection = self.make_collection(chroma_collection, temp_dir)
+        vectors = random_unit_vectors(10)
+        self.add_vectors(collection, vectors)
+        self.add_vectors(collection, vectors)
+
+        assert collection.index.ntotal == 10
+
+    def test_delete_removes_from_index(self, chroma_collection, temp_dir):
+        """Deleted chunks are no longer returned by queries."""
+        collection = self.make_collection(chroma_collection, temp_dir)
+        vectors = random_unit_vectors(20)
+        ids = self.add_vectors(collection, vectors)
+
+        collection.delete(ids=[ids[3]])
+        results = collection.query(query_embeddings=[vectors[3].tolist()], n_results=20)
+
+        assert ids[3] not in results["ids"][0]
+        assert collection.index.ntotal == 19
+        assert collection.count() == 19
+
+    def test_index_persists_and_rebuilds(self, chroma_collection, temp_dir):
+        """Index is reloaded from disk, and rebuilt from ChromaDB when stale."""
+        collection = self.make_collection(chroma_collection, temp_dir)
+        vectors = random_unit_vectors(15)
+        self.add_vectors(collection, vectors)
+
+        reloaded = self.make_collection(chroma_collection, temp_dir)
+        assert reloaded.index.ntotal == 15
+
+        # Simulate a stale index file (e.g. crash between Chroma and FAISS writes)
+        Path(temp_dir, "faiss_test.faiss").unlink()
+        rebuilt = self.make_collection(chroma_collection, temp_dir)
+        assert rebuilt.index.ntotal == 15
+
+    def test_trains_ivf_at_threshold(self, chroma_collection, temp_dir):
+        """Crossing train_threshold trains an IVF+PQ index over all vectors."""
+        collection = self.make_collection(
+            chroma_collection, temp_dir, train_threshold=300, nprobe=8,
+            index_factory="IVF8,PQ8x4"  # Small codebooks keep training fast
+        )
+        vectors = random_unit_vectors(400)
+        self.add_vectors(collection, vectors[:200], prefix="a")
+        assert not collection.is_trained_ivf
+
+        self.add_vectors(collection, vectors[200:], prefix="b")
+
+        stats = collection.index_stats()
+        assert collection.is_trained_ivf
+        assert stats["ntotal"] == 400
+        assert stats["nprobe"] == 8
+
+        results = collection.query(query_embeddings=[vectors[250].tolist()], n_results=10)
+        assert len(results["ids"][0]) > 0
+
+    def test_cuda_falls_back_to_cpu_without_gpu(self, chroma_collection, temp_dir):
+        """device='cuda' degrades to CPU search when no GPU is available."""
+        if faiss.get_num_gpus() > 0:
+            pytest.skip("GPU available")
+        collection = self.make_collection(
+            chroma_collection, temp_dir, device="cuda", index_type="cagra"
+        )
+        vectors = random_unit_vectors(10)
+        ids = self.add_vectors(collection, vectors)
+
+        results = collection.query(query_embeddings=[vectors[2].tolist()], n_results=1)
+
+        assert collection.device == "cpu"
+        assert collection.index_type == "auto"
+        assert collection.index_stats()["num_gpus"] == 0
+        assert results["ids"][0] == [ids[2]]
+
+    def test_sq8_quantization(self, chroma_collection, temp_dir):
+        """SQ8 stores 1 byte per dimension and still finds the nearest vector."""
+        collection = self.make_collection(chroma_collection, temp_dir, quantization="sq8")
+        vectors = random_unit_vectors(50)
+        ids = self.add_vectors(collection, vectors)
+
+        results = collection.query(query_embeddings=[vectors[11].tolist()], n_results=1)
+        stats = collection.index_stats()
+
+        assert results["ids"][0] == [ids[11]]
+        assert results["distances"][0][0] == pytest.approx(0.0, abs=0.02)
+        assert stats["quantization"] == "sq8"
+        assert stats["bytes_per_vector"] == DIM
+
+    def test_pq_quantization_trains_at_threshold(self, chroma_collection, temp_dir):
+        """PQ stays exact below train_threshold, then compresses to PQ codes."""
+        collection = self.make_collection(
+            chroma_collection, temp_dir, quantization="pq", train_threshold=300,
+            index_factory="IDMap2,PQ8x4"  # Small codebooks keep training fast
+        )
+        vectors = random_unit_vectors(300)
+        self.add_vectors(collection, vectors[:100], prefix="a")
+        assert collection.index_stats()["bytes_per_vector"] == DIM * 4
+
+        self.add_vectors(collection, vectors[100:], prefix="b")
+        stats = collection.index_stats()
+
+        assert collection.is_trained
+        assert not collection.is_trained_ivf
+        assert stats["ntotal"] == 300
+        assert stats["bytes_per_vector"] == 4
+        results = collection.query(query_embeddings=[vectors[150].tolist()], n_results=5)
+        assert len(results["ids"][0]) == 5
+
+    def test_pq_default_factory(self, chroma_collection, temp_dir):
+        """Default PQ uses one byte per 6-dim sub-vector (64 bytes for 384 dims)."""
+        collection = self.make_collection(chroma_collection, temp_dir, quantization="pq")
+
+        assert collection._trained_factory(20000) == "IDMap2,PQ64"
+
+    def test_quantization_change_rebuilds_index(self, chroma_collection, temp_dir):
+        """A persisted index built with another quantization is rebuilt."""
+        collection = self.make_collection(chroma_collection, temp_dir, quantization="flat")
+        self.add_vectors(collection, random_unit_vectors(10))
+
+        reloaded = self.make_collection(chroma_collection, temp_dir, quantization="sq8")
+
+        assert reloaded.index_stats()["bytes_per_vector"] == DIM
+        assert reloaded.index.ntotal == 10
+
+    def test_hnsw_index(self, chroma_collection, temp_dir):
+        """index_type='hnsw' searches an HNSW graph and rebuilds it on delete."""
+        collection = self.make_collection(chroma_collection, temp_dir, index_type="hnsw")
+        vectors = random_unit_vectors(100)
+        ids = self.add_vectors(collection, vectors)
+
+        results = collection.query(query_embeddings=[vectors[42].tolist()], n_results=1)
+        assert results["ids"][0] == [ids[42]]
+        assert isinstance(collection._base_index(collection.index), faiss.IndexHNSW)
+        assert collection.index_stats()["bytes_per_vector"] == DIM * 4
+
+        collection.delete(ids=[ids[42]])
+        results = collection.query(query_embeddings=[vectors[42].tolist()], n_results=5)
+        assert ids[42] not in results["ids"][0]
+        assert collection.index.ntotal == 99
+
+        reloaded = self.make_collection(chroma_collection, temp_dir, index_type="hnsw")
+        assert reloaded.index.ntotal == 99
+        assert isinstance(reloaded._base_index(reloaded.index), faiss.IndexHNSW)
+
+    def test_invalid_quantization(self, chroma_collection, temp_dir):
+        """Unknown quantization modes are rejected."""
+        with pytest.raises(ValueError, match="Invalid quantization"):
+            self.make_collection(chroma_collection, temp_dir, quantization="int4")
+
+    def test_invalid_device(self, chroma_collection, temp_dir):
+        """Unknown devices are rejected."""
+        with pytest.raises(ValueError, match="Invalid device"):
+            self.make_collection(chroma_collection, temp_dir, device="tpu")
+
+
+class TestRAGServerFaissBackend:
+    """RAGServer wiring for backend='faiss'."""
+
+    def test_faiss_backend_stats(self, temp_dir):
+        """RAGServer wraps tier collections and reports index stats."""
+        from src.memory.rag_server import RAGServer
+
+        server = RAGServer(persist_directory=temp_dir, backend="faiss")
+        stats = server.get_stats()
+
+        assert stats["backend"] == "faiss"
+        assert set(stats["index_stats"]) == {"core", "reference", "ephemeral"}
+        assert all(s["ntotal"] == 0 for s in stats["index_stats"].values())
+        assert {t: s["quantization"] for t, s in stats["index_stats"].items()} == {
+            "core": "flat", "reference": "sq8", "ephemeral": "pq"
+        }
+        assert isinstance(server.collections["core"], FaissCollection)
+
+    def test_invalid_backend(self, temp_dir):
+        """Unknown backends are rejected."""
+        from src.memory.rag_server import RAGServer
+
+        with pytest.raises(ValueError, match="Invalid backend"):
+            RAGServer(persist_directory=temp_dir, backend="annoy")
@@ -0,0 +1,227 @@
+"""Unit tests for FlatCollection."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+chromadb = pytest.importorskip("chromadb")
+
+from src.memory.flat_backend import FlatCollection
+
+
+DIM = 384
+
+
+def random_unit_vectors(n, seed=0):
+    """Generate normalized random vectors (like normalized embeddings)."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, DIM)).astype("float32")
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+class TestFlatCollection:
+    """Test suite for FlatCollection."""
+
+    @pytest.fixture
+    def chroma_collection(self, temp_dir):
+        """Create an empty ChromaDB collection."""
+        client = chromadb.PersistentClient(path=temp_dir)
+        return client.create_collection(
+            name="flat_test",
+            metadata={"hnsw:space": "cosine"}
+        )
+
+    def add_vectors(self, collection, vectors, prefix="chunk"):
+        ids = [f"{prefix}_{i}" for i in range(len(vectors))]
+        collection.add(
+            ids=ids,
+            documents=[f"document {i}" for i in range(len(vectors))],
+            embeddings=vectors.tolist(),
+            metadatas=[{"source": f"{prefix}.txt", "chunk_index": i} for i in range(len(vectors))]
+        )
+        return ids
+
+    def test_query_empty_collection(self, chroma_collection):
+        """Querying an empty collection returns empty Chroma-shaped results."""
+        collection = FlatCollection(chroma_collection)
+
+        results = collection.query(query_embeddings=[[0.1] * DIM], n_results=5)
+
+        assert results["ids"] == [[]]
+        assert results["distances"] == [[]]
+
+    def test_query_returns_sorted_top_k(self, chroma_collection):
+        """Results are the k nearest, best first, with cosine distances."""
+        collection = FlatCollection(chroma_collection)
+        vectors = random_unit_vectors(50)
+        ids = self.add_vectors(collection, vectors)
+
+        results = collection.query(query_embeddings=[vectors[7].tolist()], n_results=5)
+
+        expected = np.argsort(vectors @ vectors[7])[::-1][:5]
+        assert results["ids"][0] == [ids[i] for i in expected]
+        assert results["documents"][0][0] == "document 7"
+        assert results["metadatas"][0][0]["chunk_index"] == 7
+        assert results["distances"][0][0] == pytest.approx(0.0, abs=1e-5)
+        assert results["distances"][0] == sorted(results["distances"][0])
+
+    def test_loads_from_chroma_and_tracks_deletes(self, chroma_collection):
+        """The cache is loaded from ChromaDB and stays in sync on delete."""
+        vectors = random_unit_vectors(20)
+        ids = self.add_vectors(FlatCollection(chroma_collection), vectors)
+
+        collection = FlatCollection(chroma_collection)
+        assert collection.count() == 20
+
+        collection.delete(ids=[ids[3]])
+        results = collection.query(query_embeddings=[vectors[3].tolist()], n_results=20)
+
+        assert ids[3] not in results["ids"][0]
+        assert collection.count() == chroma_collection.count() == 19
+
+    def test_duplicate_ids_not_double_indexed(self, chroma_collection):
+        """Re-adding existing IDs doesn't create duplicate rows."""
+        collection = FlatCollection(chroma_collection)
+        vectors = random_unit_vectors(10)
+        self.add_vectors(collection, vectors)
+        self.add_vectors(collection, vectors)
+
+        assert collection.index_stats()["ntotal"] == 10
+
+    def test_cache_persists_and_memory_maps(self, chroma_collection, temp_dir, monkeypatch):
+        """Reloads come from the memory-mapped cache, not ChromaDB embeddings."""
+        cache_path = f"{temp_dir}/flat_test.flat"
+        vectors = random_unit_vectors(30)
+        ids = self.add_vectors(FlatCollection(chroma_collection, cache_path=cache_path), vectors)
+
+        def fail_load(self):
+            raise AssertionError("cache should have been used")
+        monkeypatch.setattr(FlatCollection, "_load_from_chroma", fail_load)
+        reloaded = FlatCollection(chroma_collection, cache_path=cache_path)
+
+        assert isinstance(reloaded._matrix, np.memmap)
+        results = reloaded.query(query_embeddings=[vectors[5].tolist()], n_results=1)
+        assert results["ids"][0] == [ids[5]]
+        assert results["metadatas"][0][0]["chunk_index"] == 5
+
+        monkeypatch.undo()
+        reloaded.delete(ids=[ids[0]])
+        assert FlatCollection(chroma_collection, cache_path=cache_path).count() == 29
+
+    def test_cache_rows_readable_without_orjson(self, chroma_collection, temp_dir, monkeypatch):
+        """Rows written with orjson load with the stdlib json fallback, and back."""
+        from src.memory import flat_backend
+        cache_path = f"{temp_dir}/flat_test.flat"
+        collection = FlatCollection(chroma_collection, cache_path=cache_path)
+        collection.add(
+            ids=["café"],
+            documents=["Déjà vu"],
+            embeddings=random_unit_vectors(1).tolist(),
+            metadatas=[{"source": "naïve.txt"}]
+        )
+
+        monkeypatch.setattr(flat_backend, "orjson", None)
+        reloaded = FlatCollection(chroma_collection, cache_path=cache_path)
+        assert isinstance(reloaded._matrix, np.memmap)
+        assert reloaded._documents == ["Déjà vu"]
+        assert reloaded._metadatas == [{"source": "naïve.txt"}]
+
+        reloaded._save_cache()  # Rewritten with stdlib json
+        monkeypatch.undo()
+        assert FlatCollection(chroma_collection, cache_path=cache_path)._ids == ["café"]
+
+    def test_stale_cache_rebuilds(self, chroma_collection, temp_dir):
+        """A cache out of sync with ChromaDB is rebuilt from ChromaDB."""
+        cache_path = f"{temp_dir}/flat_test.flat"
+        FlatCollection(chroma_collection, cache_path=cache_path)  # Empty cache
+        self.add_vectors(chroma_collection, random_unit_vectors(10))  # Bypasses the cache
+
+        collection = FlatCollection(chroma_collection, cache_path=cache_path)
+
+        assert collection.count() == 10
+        assert not isinstance(collection._matrix, np.memmap)
+
+    def test_float16_matches_float32_ranking(self, chroma_collection, temp_dir):
+        """float16 storage halves the matrix and keeps the same top results."""
+        vectors = random_unit_vectors(200)
+        self.add_vectors(chroma_collection, vectors)
+        full = FlatCollection(chroma_collection)
+        half = FlatCollection(chroma_collection, cache_path=f"{temp_dir}/half.flat", dtype="float16")
+
+        query = [vectors[42].tolist()]
+        full_results = full.query(query_embeddings=query, n_results=5)
+        half_results = half.query(query_embeddings=query, n_results=5)
+
+        assert half._matrix.dtype == np.float16
+        assert half.index_stats()["memory_bytes"] * 2 == full.index_stats()["memory_bytes"]
+        assert half_results["ids"][0][0] == full_results["ids"][0][0]
+        assert half_results["distances"][0] == pytest.approx(full_results["distances"][0], abs=1e-3)
+
+        # A float32 cache for the same path is rebuilt rather than reused
+        assert FlatCollection(chroma_collection, cache_path=f"{temp_dir}/half.flat")._matrix.dtype == np.float32
+
+    def test_blockwise_top_k_with_unnormalized_vectors(self, chroma_collection, monkeypatch):
+        """Block-merged top-k equals a full cosine sort, without normalized storage."""
+        from src.memory import flat_backend
+        monkeypatch.setattr(flat_backend, "QUERY_BLOCK_ROWS", 16)
+        unit = random_unit_vectors(100)
+        scales = np.random.default_rng(1).uniform(0.5, 3.0, (100, 1)).astype("float32")
+        collection = FlatCollection(chroma_collection)
+        ids = self.add_vectors(collection, unit * scales)
+
+        queries = random_unit_vectors(3, seed=2)
+        results = collection.query(query_embeddings=(queries * 2).tolist(), n_results=7)
+
+        for q, query in enumerate(queries):
+            expected = np.argsort(unit @ query)[::-1][:7]
+            assert results["ids"][q] == [ids[i] for i in expected]
+            assert results["distances"][q] == pytest.approx(1.0 - (unit @ query)[expected], abs=1e-5)
+
+        # The single-query specialization gives the same results
+        single = collection.query(query_embeddings=[queries[1].tolist()], n_results=7)
+        assert single["ids"][0] == results["ids"][1]
+        assert single["distances"][0] == pytest.approx(results["distances"][1], abs=1e-6)
+
+        # Norms cached at the first query stay in sync with adds and deletes
+        collection.delete(ids=[ids[0]])
+        self.add_vectors(collection, unit[:2] * 5, prefix="extra")
+        assert np.allclose(collection._inv_norms, collection._row_inv_norms(collection._matrix))
+
+    def test_int8_matches_float32_ranking(self, chroma_collection, temp_dir):
+        """int8 rows are a quarter of the size and score within quantization error."""
+        vectors = random_unit_vectors(200)
+        self.add_vectors(chroma_collection, vectors)
+        full = FlatCollection(chroma_collection)
+        quantized = FlatCollection(chroma_collection, cache_path=f"{temp_dir}/q8.flat", dtype="int8")
+
+        query = [vectors[42].tolist()]
+        full_results = full.query(query_embeddings=query, n_results=5)
+        q8_results = quantized.query(query_embeddings=query, n_results=5)
+
+        assert quantized._matrix.dtype == np.int8
+        assert np.abs(quantized._matrix).max(axis=1).tolist() == [127] * 200
+        assert quantized.index_stats()["memory_bytes"] * 4 == full.index_stats()["memory_bytes"]
+        assert q8_results["ids"][0][0] == full_results["ids"][0][0]
+        assert q8_results["distances"][0] == pytest.approx(full_results["distances"][0], abs=2e-2)
+
+        reloaded = FlatCollection(chroma_collection, cache_path=f"{temp_dir}/q8.flat", dtype="int8")
+        assert isinstance(reloaded._matrix, np.memmap)
+
+    def test_invalid_dtype(self, chroma_collection):
+        with pytest.raises(ValueError, match="Invalid dtype"):
+            FlatCollection(chroma_collection, dtype="int4")
+
+
+class TestRAGServerFlatBackend:
+    """RAGServer wiring for backend='flat'."""
+
+    def test_flat_backend_stats(self, temp_dir):
+        """RAGServer wraps tier collections and reports index stats."""
+        from src.memory.rag_server import RAGServer
+
+        server = RAGServer(persist_directory=temp_dir, backend="flat")
+        stats = server.get_stats()
+
+        assert stats["backend"] == "flat"
+        assert set(stats["index_stats"]) == {"core", "reference", "ephemeral"}
+        assert isinstance(server.collections["core"], FlatCollection)
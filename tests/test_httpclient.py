@@ -0,0 +1,46 @@
+"""Unit tests for the shared HTTP client."""
+
+import asyncio
+import pytest
+
+from src.common.httpclient import get_shared_client, close_shared_client
+
+
+class TestSharedClient:
+    """Test suite for get_shared_client / close_shared_client."""
+
+    @pytest.mark.asyncio
+    async def test_same_client_within_loop(self):
+        """Repeated calls on one event loop reuse the same pooled client."""
+        client = get_shared_client()
+        try:
+            assert get_shared_client() is client
+        finally:
+            await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_recreated_after_close(self):
+        """A closed shared client is replaced on next use."""
+        client = get_shared_client()
+        await close_shared_client()
+
+        new_client = get_shared_client()
+        try:
+            assert client.is_closed
+            assert new_client is not client
+            assert not new_client.is_closed
+        finally:
+            await close_shared_client()
+
+    def test_separate_client_per_event_loop(self):
+        """Each event loop gets its own client (connections are loop-bound)."""
+        async def grab():
+            client = get_shared_client()
+            await close_shared_client()
+            return client
+
+        assert asyncio.run(grab()) is not asyncio.run(grab())
+
+    def test_requires_running_loop(self):
+        with pytest.raises(RuntimeError):
+            get_shared_client()
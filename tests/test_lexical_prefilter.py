@@ -0,0 +1,61 @@
+"""Unit tests for LexicalPrefilter."""
+
+import pytest
+
+from src.memory.lexical_prefilter import LexicalPrefilter, terms
+from src.memory.retriever import Retriever
+
+
+class TestLexicalPrefilter:
+    """Test suite for LexicalPrefilter."""
+
+    def test_terms_drop_stopwords_and_stem(self):
+        assert terms("What are the Recipes?") == {"recip"}
+
+    def test_may_match(self):
+        """Only queries with no content term in the corpus are rejected."""
+        prefilter = LexicalPrefilter(lambda: ["Italian recipes and pasta dishes", None])
+
+        assert prefilter.may_match("pasta recipe")
+        assert not prefilter.may_match("rocket science")
+        assert prefilter.may_match("what is it")  # No content terms: can't tell
+
+    def test_invalidate_rebuilds_vocabulary(self):
+        documents = ["pasta"]
+        prefilter = LexicalPrefilter(lambda: documents)
+        assert not prefilter.may_match("rocket")
+
+        documents.append("rocket science")
+        assert not prefilter.may_match("rocket")  # Vocabulary is cached
+        prefilter.invalidate()
+        assert prefilter.may_match("rocket")
+
+    def test_large_corpus_lets_every_query_through(self):
+        prefilter = LexicalPrefilter(lambda: ["pasta"] * 3, max_chunks=2)
+        assert prefilter.may_match("rocket")
+
+    def test_invalid_max_chunks(self):
+        with pytest.raises(ValueError, match="Invalid max_chunks"):
+            LexicalPrefilter(list, max_chunks=0)
+
+    @pytest.mark.asyncio
+    async def test_retriever_skips_embedding(self):
+        """A rejected query returns [] without embedding or querying."""
+        class MockCollection:
+            def count(self):
+                return 1
+
+            def query(self, **kwargs):
+                raise AssertionError("collection should not be queried")
+
+        retriever = Retriever(
+            MockCollection(),
+            lexical_prefilter=LexicalPrefilter(lambda: ["Italian pasta"])
+        )
+
+        async def mock_embed(query):
+            raise AssertionError("query should not be embedded")
+
+        retriever._embed_query = mock_embed
+
+        assert await retriever.retrieve("quantum physics") == []
@@ -0,0 +1,61 @@
+"""Unit tests for LocalBrain (Ollama HTTP calls are mocked)."""
+
+import json
+import pytest
+import httpx
+
+from src.brain.local_brain import LocalBrain
+
+
+def ollama_stream(fragments):
+    """Build an Ollama /api/generate streaming body (one JSON object per line)."""
+    lines = [json.dumps({"response": f, "done": False}) for f in fragments]
+    lines.append(json.dumps({"response": "", "done": True}))
+    return "\n".join(lines) + "\n"
+
+
+class TestLocalBrainStreaming:
+    """Test suite for LocalBrain.think_stream."""
+
+    @pytest.mark.asyncio
+    async def test_think_stream_yields_fragments(self):
+        """Fragments are yielded in order, with leading whitespace stripped."""
+        requests = []
+
+        def handler(request):
+            requests.append(json.loads(request.content))
+            return httpx.Response(200, text=ollama_stream(["  Hello", ",", " world", "!"]))
+
+        brain = LocalBrain()
+        brain._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            fragments = [f async for f in brain.think_stream("Hi", system_prompt="Be brief.")]
+        finally:
+            await brain._client.aclose()
+
+        assert fragments == ["Hello", ",", " world", "!"]
+        assert requests[0]["stream"] is True
+        assert requests[0]["prompt"].startswith("Be brief.")
+
+    @pytest.mark.asyncio
+    async def test_think_stream_http_error(self):
+        """HTTP errors from Ollama are raised to the caller."""
+        def handler(request):
+            return httpx.Response(404, text="model not found")
+
+        brain = LocalBrain()
+        brain._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                async for _ in brain.think_stream("Hi"):
+                    pass
+        finally:
+            await brain._client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_think_stream_requires_context_manager(self):
+        """Streaming without an open client fails clearly."""
+        brain = LocalBrain()
+        with pytest.raises(RuntimeError):
+            async for _ in brain.think_stream("Hi"):
+                pass
@@ -1,10 +1,11 @@
 """Unit tests for MetadataTracker."""
 
 import pytest
+import sqlite3
 import tempfile
 import time
 from pathlib import Path
-from src.memory.metadata_tracker import MetadataTracker
+from src.memory.metadata_tracker import MetadataTracker, _EXPIRES_AT_SQL
 
 
 class TestMetadataTracker:
@@ -175,6 +176,17 @@ class TestMetadataTracker:
         assert expired[0]['document_id'] == doc_id
         assert expired[0]['chunk_ids'] == chunk_ids
     
+    def test_expiry_check_uses_index(self, tracker):
+        """Expired-document lookup is an index search, not a table scan."""
+        conn = sqlite3.connect(str(tracker.db_path))
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT id FROM documents "
+            f"WHERE {_EXPIRES_AT_SQL} < julianday('now')"
+        ).fetchall()
+        conn.close()
+        
+        assert any("idx_documents_expires_at" in row[-1] for row in plan)
+    
     def test_delete_document(self, tracker, sample_file):
         """Test document deletion."""
         doc_id = tracker.register_document(sample_file, tier="core")
@@ -0,0 +1,81 @@
+"""Unit tests for OnnxEmbedder (ONNX Runtime session is faked)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+tokenizers = pytest.importorskip("tokenizers")
+
+from src.memory.onnx_embedder import OnnxEmbedder, mean_pool
+from src.memory.document_ingester import DocumentIngester
+
+
+def make_tokenizer():
+    """Whitespace word-level tokenizer with [PAD]=0."""
+    from tokenizers import Tokenizer, models, pre_tokenizers
+
+    vocab = {"[PAD]": 0, "[UNK]": 1, "hello": 2, "world": 3, "pi": 4}
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.enable_padding()
+    return tokenizer
+
+
+class FakeSession:
+    """Returns one-hot token embeddings and records input shapes."""
+
+    def __init__(self, dim=8):
+        self.dim = dim
+        self.shapes = []
+
+    def run(self, output_names, feeds):
+        input_ids = feeds["input_ids"]
+        self.shapes.append(input_ids.shape)
+        return [np.eye(self.dim, dtype=np.float32)[input_ids]]
+
+
+def make_embedder(session):
+    embedder = OnnxEmbedder.__new__(OnnxEmbedder)
+    embedder.session = session
+    embedder.input_names = {"input_ids", "attention_mask"}
+    embedder.tokenizer = make_tokenizer()
+    return embedder
+
+
+class TestOnnxEmbedder:
+    """Test suite for OnnxEmbedder."""
+
+    def test_mean_pool_ignores_padding(self):
+        """Padding tokens don't contribute to the pooled vector."""
+        hidden = np.array([[[1.0, 0.0], [0.0, 1.0], [9.0, 9.0]]], dtype=np.float32)
+        mask = np.array([[1, 1, 0]])
+
+        pooled = mean_pool(hidden, mask, normalize=False)
+        normalized = mean_pool(hidden, mask)
+
+        assert pooled.tolist() == [[0.5, 0.5]]
+        assert np.linalg.norm(normalized[0]) == pytest.approx(1.0)
+
+    def test_encode_batches_and_pads_to_longest(self):
+        """Each batch is padded to its own longest text, not a fixed length."""
+        session = FakeSession()
+        embedder = make_embedder(session)
+
+        embeddings = embedder.encode(
+            ["hello", "hello world pi", "world", "pi"], batch_size=2
+        )
+
+        assert embeddings.shape == (4, 8)
+        assert session.shapes == [(2, 3), (2, 1)]
+        assert embeddings[0].argmax() == 2
+        assert np.linalg.norm(embeddings, axis=1) == pytest.approx([1.0] * 4)
+
+    def test_missing_model_dir(self, temp_dir):
+        """A missing export points at the export script."""
+        pytest.importorskip("onnxruntime")
+        with pytest.raises(FileNotFoundError, match="export_onnx_embedder"):
+            OnnxEmbedder(temp_dir)
+
+    def test_invalid_backend(self):
+        """Unknown embedder backends are rejected."""
+        with pytest.raises(ValueError, match="Invalid embedder_backend"):
+            DocumentIngester(embedder_backend="openvino")
@@ -0,0 +1,59 @@
+"""Unit tests for RAGDaemon and RAGDaemonClient."""
+
+import threading
+import pytest
+
+from src.memory.rag_daemon import RAGDaemon, RAGDaemonClient
+
+
+class FakeRAGServer:
+    """Records calls instead of touching ChromaDB."""
+
+    def __init__(self):
+        self.ingested = []
+
+    def get_stats(self):
+        return {"total_chunks": 3, "tiering_enabled": True}
+
+    async def cleanup_expired(self):
+        return {"expired_count": 1, "chunks_deleted": 2, "message": "done"}
+
+    async def ingest_documents(self, file_paths, tier="reference", **kwargs):
+        self.ingested.append((file_paths, tier))
+        return {"success": True, "chunks_ingested": 5}
+
+
+class TestRAGDaemon:
+    """Test suite for the RAG daemon HTTP interface."""
+
+    @pytest.fixture
+    def daemon(self):
+        """Run a daemon on a free port in a background thread."""
+        daemon = RAGDaemon(rag_server=FakeRAGServer(), port=0)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        yield daemon
+        daemon.shutdown()
+        thread.join(timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_endpoints(self, daemon):
+        """Stats, cleanup and ingest are served from the daemon's RAGServer."""
+        client = RAGDaemonClient(port=daemon.port)
+
+        assert await client.is_running()
+        assert (await client.get_stats())["total_chunks"] == 3
+        assert (await client.cleanup_expired())["chunks_deleted"] == 2
+
+        result = await client.ingest_documents(["notes.md"], tier="core")
+        assert result["chunks_ingested"] == 5
+        assert daemon.rag_server.ingested == [(["notes.md"], "core")]
+
+    @pytest.mark.asyncio
+    async def test_is_running_false_without_daemon(self, daemon):
+        """Clients detect a missing daemon so callers can fall back."""
+        port = daemon.port
+        daemon.shutdown()
+        daemon.httpd.server_close()
+
+        assert not await RAGDaemonClient(port=port).is_running()
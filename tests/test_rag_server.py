@@ -5,7 +5,9 @@ import asyncio
 import tempfile
 import shutil
 from pathlib import Path
-from src.memory.rag_server import RAGServer
+import numpy as np
+from src.memory.document_ingester import ChunkBatch
+from src.memory.rag_server import RAGServer, get_default_rag_server
 
 
 class TestRAGServer:
@@ -137,3 +139,264 @@ class TestRAGServer:
         stats_after = rag_server.get_stats()
         assert stats_after["total_chunks"] == 0
 
+    
+    def test_add_in_batches(self, rag_server):
+        """Chunks are added in batch_size slices, in order, as array views."""
+        calls = []
+        slices = []
+        
+        class RecordingCollection:
+            def add(self, ids, documents, embeddings, metadatas):
+                calls.append(list(ids))
+                slices.append(embeddings)
+        
+        batch = ChunkBatch()
+        for i in range(5):
+            batch.append(f"chunk_{i}", f"doc {i}", {"chunk_index": i})
+        batch.embeddings = np.zeros((5, 3), dtype=np.float32)
+        ids = batch.ids
+        rag_server._add_in_batches(RecordingCollection(), batch, batch_size=2)
+        
+        assert calls == [ids[0:2], ids[2:4], ids[4:5]]
+        # No per-element Python floats: ChromaDB gets float32 views of the batch
+        assert all(
+            isinstance(part, np.ndarray) and part.dtype == np.float32
+            and np.shares_memory(part, batch.embeddings)
+            for part in slices
+        )
+    
+    @pytest.mark.asyncio
+    async def test_ingest_documents_invalid_batch_size(self, rag_server, sample_text_file):
+        """Non-positive batch sizes are rejected."""
+        with pytest.raises(ValueError, match="Invalid batch_size"):
+            await rag_server.ingest_documents([sample_text_file], batch_size=0)
+        with pytest.raises(ValueError, match="Invalid embed_batch_size"):
+            await rag_server.ingest_documents([sample_text_file], embed_batch_size=0)
+    
+    @pytest.mark.asyncio
+    async def test_ingest_documents_loads_files_concurrently(self, rag_server, temp_dir, monkeypatch):
+        """Files are loaded concurrently; a failing file doesn't stop the others."""
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def fake_ingest_file(file_path, chunk_size, chunk_overlap, pdf_executor=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if file_path.endswith("bad.txt"):
+                raise ValueError("Unsupported file type")
+            return [f"text from {file_path}"], [{"source": file_path}]
+        
+        async def fake_embed_chunks(chunks, jobs=1, as_array=False, batch_size=None):
+            return np.array([[1.0] + [0.0] * 383 for _ in chunks], dtype=np.float32)
+        
+        monkeypatch.setattr(rag_server.ingester, "ingest_file", fake_ingest_file)
+        monkeypatch.setattr(rag_server.ingester, "embed_chunks", fake_embed_chunks)
+        
+        file_paths = []
+        for name in ["a.txt", "bad.txt", "b.txt"]:
+            path = Path(temp_dir) / name
+            path.write_text(name)
+            file_paths.append(str(path))
+        
+        result = await rag_server.ingest_documents(file_paths)
+        
+        assert max_in_flight == 3
+        assert result["chunks_ingested"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_ingest_documents_parses_pdfs_in_processes(self, rag_server, temp_dir, monkeypatch):
+        """With jobs > 1 and several PDFs, PDF extraction gets a process pool."""
+        from concurrent.futures import ProcessPoolExecutor
+        executors = {}
+        
+        async def fake_ingest_file(file_path, chunk_size, chunk_overlap, pdf_executor=None):
+            executors[Path(file_path).name] = pdf_executor
+            return [f"text from {file_path}"], [{"source": file_path}]
+        
+        async def fake_embed_chunks(chunks, jobs=1, as_array=False, batch_size=None):
+            return np.array([[1.0] + [0.0] * 383 for _ in chunks], dtype=np.float32)
+        
+        monkeypatch.setattr(rag_server.ingester, "ingest_file", fake_ingest_file)
+        monkeypatch.setattr(rag_server.ingester, "embed_chunks", fake_embed_chunks)
+        
+        file_paths = []
+        for name in ["a.pdf", "b.pdf", "c.txt"]:
+            path = Path(temp_dir) / name
+            path.write_text(name)
+            file_paths.append(str(path))
+        
+        await rag_server.ingest_documents(file_paths, jobs=2)
+        assert isinstance(executors["a.pdf"], ProcessPoolExecutor)
+        assert executors["a.pdf"] is executors["b.pdf"]
+        
+        await rag_server.ingest_documents(file_paths)
+        assert executors["a.pdf"] is None
+    
+    @pytest.mark.asyncio
+    async def test_ingest_documents_from_memory(self, rag_server, temp_dir, monkeypatch):
+        """(path, content) items are chunked from memory and stored under that path."""
+        async def fake_embed_chunks(chunks, jobs=1, as_array=False, batch_size=None):
+            return np.array([[1.0] + [0.0] * 383 for _ in chunks], dtype=np.float32)
+        
+        monkeypatch.setattr(rag_server.ingester, "embed_chunks", fake_embed_chunks)
+        
+        file_path = str(Path(temp_dir) / "never_written.txt")
+        result = await rag_server.ingest_documents([(file_path, b"Pironman5 MAX case notes.")])
+        
+        assert result["chunks_ingested"] == 1
+        assert not Path(file_path).exists()
+        stored = rag_server.collections["reference"].get(where={"file_path": file_path})
+        assert stored["documents"] == ["Pironman5 MAX case notes."]
+        assert stored["metadatas"][0]["source"] == "never_written.txt"
+        assert rag_server.metadata_tracker.get_document_id(file_path) is not None
+    
+    def test_ephemeral_writes_no_chroma_files(self, temp_rag_dir):
+        """Ephemeral servers keep ChromaDB in memory."""
+        server = RAGServer(
+            persist_directory=temp_rag_dir,
+            collection_name="test_ephemeral",
+            ephemeral=True
+        )
+        
+        assert server.get_stats()["total_chunks"] == 0
+        assert not (Path(temp_rag_dir) / "chroma.sqlite3").exists()
+    
+    def test_embedder_backend_from_environment(self, temp_rag_dir, monkeypatch):
+        """MINI_JARVIS_EMBEDDER picks the embedder when none is passed."""
+        monkeypatch.setenv("MINI_JARVIS_EMBEDDER", "onnx-int8")
+        server = RAGServer(persist_directory=temp_rag_dir, ephemeral=True)
+        assert server.ingester.embedder_backend == "onnx-int8"
+        assert server.retriever.embedder_backend == "onnx-int8"
+        
+        explicit = RAGServer(
+            persist_directory=temp_rag_dir,
+            ephemeral=True,
+            embedder_backend="sentence-transformers"
+        )
+        assert explicit.ingester.embedder_backend == "sentence-transformers"
+    
+    @pytest.mark.asyncio
+    async def test_embedding_model_survives_server_restart(self, temp_rag_dir, monkeypatch):
+        """A new RAGServer in the same process reuses the loaded model."""
+        import gc
+        import sys
+        import types
+        from src.memory import document_ingester
+        
+        loads = []
+        
+        class FakeSentenceTransformer:
+            def __init__(self, model_name, device):
+                loads.append(model_name)
+            
+            def encode(self, texts, **kwargs):
+                return np.ones((len(texts), 384))
+        
+        fake_module = types.ModuleType("sentence_transformers")
+        fake_module.SentenceTransformer = FakeSentenceTransformer
+        monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+        monkeypatch.setattr(document_ingester, "_MODEL_CACHE", {})
+        
+        server1 = RAGServer(persist_directory=temp_rag_dir, ephemeral=True)
+        await server1.retriever._embed_local(["query"])
+        model = server1.retriever._embedding_model
+        del server1
+        gc.collect()
+        
+        server2 = RAGServer(persist_directory=temp_rag_dir, ephemeral=True)
+        await server2.retriever._embed_local(["query"])
+        
+        assert server2.retriever._embedding_model is model
+        assert len(loads) == 1
+    
+    @pytest.mark.asyncio
+    async def test_close_releases_persistent_client(self, temp_rag_dir):
+        """A closed server's data is visible to a new server on the same path."""
+        async with RAGServer(persist_directory=temp_rag_dir, enable_tiering=False) as server1:
+            server1.collection.add(
+                ids=["chunk_0"],
+                documents=["persisted"],
+                embeddings=[[0.1] * 384]
+            )
+        assert server1.collection is None
+        
+        server2 = RAGServer(persist_directory=temp_rag_dir, enable_tiering=False)
+        assert server2.collection.count() == 1
+        await server2.close()
+    
+    @pytest.mark.asyncio
+    async def test_default_rag_server_is_shared(self, temp_rag_dir):
+        """Equivalent arguments share one server until it is closed."""
+        server = get_default_rag_server(persist_directory=temp_rag_dir, collection_name="shared")
+        
+        assert get_default_rag_server(
+            persist_directory=temp_rag_dir, collection_name="shared", enable_tiering=True
+        ) is server
+        other = get_default_rag_server(persist_directory=temp_rag_dir, collection_name="other")
+        assert other is not server
+        
+        await server.close()
+        reopened = get_default_rag_server(persist_directory=temp_rag_dir, collection_name="shared")
+        assert reopened is not server
+        await reopened.close()
+        await other.close()
+    
+    def test_hnsw_params_on_new_and_existing_collections(self, temp_rag_dir):
+        """HNSW params go into new collections; ef_search is updated on reopen."""
+        server = RAGServer(persist_directory=temp_rag_dir, enable_tiering=False, hnsw_m=12)
+        metadata = server.collection.metadata
+        assert metadata["hnsw:M"] == 12
+        assert metadata["hnsw:construction_ef"] == 64
+        assert metadata["hnsw:search_ef"] == 16
+        
+        reopened = RAGServer(persist_directory=temp_rag_dir, enable_tiering=False, hnsw_ef_search=8)
+        configuration = reopened.client.get_collection(reopened.collection_name).configuration
+        assert configuration["hnsw"]["ef_search"] == 8
+        assert configuration["hnsw"]["max_neighbors"] == 12
+        
+        with pytest.raises(ValueError, match="Invalid hnsw_ef_search"):
+            RAGServer(persist_directory=temp_rag_dir, hnsw_ef_search=0)
+    
+    def test_delete_file(self, temp_rag_dir):
+        """Only chunks ingested from the given file are deleted."""
+        server = RAGServer(persist_directory=temp_rag_dir, ephemeral=True, collection_name="delete_file")
+        server.collections["core"].add(
+            ids=["a_0", "a_1", "b_0"],
+            documents=["a", "a", "b"],
+            embeddings=[[0.1] * 384] * 3,
+            metadatas=[{"file_path": "/tmp/a.txt"}] * 2 + [{"file_path": "/tmp/b.txt"}]
+        )
+        
+        assert server.delete_file("/tmp/a.txt") == 2
+        assert server.collections["core"].get()["ids"] == ["b_0"]
+        assert server.delete_file("/tmp/missing.txt") == 0
+    
+    def test_copy_file(self, temp_rag_dir):
+        """Copied chunks keep their text and embeddings under the new path and tier."""
+        server = RAGServer(persist_directory=temp_rag_dir, ephemeral=True, collection_name="copy_file")
+        server.collections["reference"].add(
+            ids=["a_0", "a_1"],
+            documents=["first", "second"],
+            embeddings=[[0.1] * 384, [0.2] * 384],
+            metadatas=[
+                {"file_path": "/tmp/a.txt", "source": "a.txt", "chunk_index": i, "tier": "reference"}
+                for i in range(2)
+            ]
+        )
+        
+        assert server.copy_file("/tmp/a.txt", "/tmp/b.txt", "abc", tier="ephemeral") == 2
+        assert server.copy_file("/tmp/missing.txt", "/tmp/c.txt", "abc") == 0
+        
+        copied = server.collections["ephemeral"].get(
+            where={"file_path": "/tmp/b.txt"}, include=["documents", "embeddings", "metadatas"]
+        )
+        by_index = sorted(zip(copied["metadatas"], copied["documents"], copied["embeddings"]),
+                          key=lambda row: row[0]["chunk_index"])
+        assert [document for _, document, _ in by_index] == ["first", "second"]
+        assert by_index[1][2][0] == pytest.approx(0.2)
+        assert {(m["tier"], m["source"]) for m, _, _ in by_index} == {("ephemeral", "b.txt")}
+        assert server.metadata_tracker.get_document_id("/tmp/b.txt") is not None
+        assert server.collections["reference"].count() == 2
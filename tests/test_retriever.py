@@ -83,6 +83,26 @@ class TestRetriever:
         
         assert len(chunks) == 0
     
+    @pytest.mark.asyncio
+    async def test_retrieve_empty_collections_skip_embedding(self):
+        """Empty collections return [] without embedding the query or querying."""
+        class CountedEmptyCollection:
+            def count(self):
+                return 0
+            
+            def query(self, query_embeddings, n_results):
+                raise AssertionError("empty collection should not be queried")
+        
+        async def fail_embed(query):
+            raise AssertionError("query should not be embedded")
+        
+        for retriever in [
+            Retriever(CountedEmptyCollection()),
+            Retriever(None, collections={"core": CountedEmptyCollection(), "reference": CountedEmptyCollection()})
+        ]:
+            retriever._embed_query = fail_embed
+            assert await retriever.retrieve("any query", top_k=5) == []
+    
     def test_format_context(self):
         """Test formatting context from chunks."""
         retriever = Retriever(None)  # Collection not needed for this test
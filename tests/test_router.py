@@ -0,0 +1,53 @@
+"""Unit tests for Router and KeywordMatcher."""
+
+import pytest
+
+from src.brain import router as router_module
+from src.brain.router import Router, KeywordMatcher, InferenceTarget
+
+
+class TestKeywordMatcher:
+    """Test suite for KeywordMatcher."""
+
+    def test_counts_distinct_overlapping_keywords(self):
+        """Overlapping keywords each count once, repeats don't add."""
+        matcher = KeywordMatcher(["search", "web search", "search the web"])
+
+        assert matcher.count("web search: search the web, search again") == 3
+        assert matcher.count("nothing relevant") == 0
+
+    def test_substring_fallback_matches_automaton(self, monkeypatch):
+        """The fallback scan gives the same counts as the automaton."""
+        text = "please analyze and compare the weather forecast for today"
+        with_automaton = KeywordMatcher(Router.COMPLEX_KEYWORDS + Router.TOOL_KEYWORDS)
+
+        monkeypatch.setattr(router_module, "ahocorasick", None)
+        fallback = KeywordMatcher(Router.COMPLEX_KEYWORDS + Router.TOOL_KEYWORDS)
+
+        assert fallback.count(text) == with_automaton.count(text) == 5
+
+
+    def test_search_is_case_insensitive(self):
+        """search() finds keywords without lower-casing the text first."""
+        matcher = KeywordMatcher(["turn on", "weather"])
+
+        assert matcher.search("Please TURN ON the lights") == "turn on"
+        assert matcher.search("What's the Weather?") == "weather"
+        assert matcher.search("Tell me a joke") is None
+
+
+class TestRouter:
+    """Test suite for Router heuristics."""
+
+    @pytest.mark.parametrize("query, expected", [
+        ("What is 2 + 2?", InferenceTarget.LOCAL),
+        ("What's the weather in Paris?", InferenceTarget.CLOUD),
+        ("Analyze and compare these two designs", InferenceTarget.CLOUD),
+        ("Tell me a joke", InferenceTarget.LOCAL),
+    ])
+    def test_route(self, query, expected):
+        assert Router().route(query) == expected
+
+    def test_force_target(self):
+        router = Router()
+        assert router.route("weather", force_target=InferenceTarget.LOCAL) == InferenceTarget.LOCAL
@@ -0,0 +1,90 @@
+"""Unit tests for SemanticCache."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.memory.retriever import Retriever
+from src.memory.semantic_cache import SemanticCache
+
+
+def unit(vector):
+    vector = np.asarray(vector, dtype=np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache."""
+
+    def test_hit_on_near_duplicate_query(self):
+        """A query above the threshold returns the cached chunks."""
+        cache = SemanticCache(threshold=0.92)
+        chunks = [{"text": "Pironman5 MAX case", "score": 0.8}]
+        cache.put(unit([1.0, 0.0, 0.0]), (5, 0.0), chunks)
+
+        assert cache.get(unit([1.0, 0.1, 0.0]), (5, 0.0)) == chunks
+        assert cache.get(unit([0.0, 1.0, 0.0]), (5, 0.0)) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_parameters_must_match(self):
+        """Results cached for one top_k/min_score aren't reused for another."""
+        cache = SemanticCache()
+        cache.put(unit([1.0, 0.0]), (5, 0.0), [{"text": "a"}])
+
+        assert cache.get(unit([1.0, 0.0]), (10, 0.0)) is None
+        assert cache.get(unit([1.0, 0.0]), (5, 0.0)) == [{"text": "a"}]
+
+    def test_evicts_least_recently_used(self):
+        """A full cache evicts the entry not hit for longest."""
+        cache = SemanticCache(max_entries=2)
+        cache.put(unit([1.0, 0.0, 0.0]), 5, ["x"])
+        cache.put(unit([0.0, 1.0, 0.0]), 5, ["y"])
+        cache.get(unit([1.0, 0.0, 0.0]), 5)  # x is now most recently used
+        cache.put(unit([0.0, 0.0, 1.0]), 5, ["z"])
+
+        assert len(cache) == 2
+        assert cache.get(unit([1.0, 0.0, 0.0]), 5) == ["x"]
+        assert cache.get(unit([0.0, 1.0, 0.0]), 5) is None
+        assert cache.get(unit([0.0, 0.0, 1.0]), 5) == ["z"]
+
+    def test_clear(self):
+        cache = SemanticCache()
+        cache.put(unit([1.0, 0.0]), 5, ["x"])
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get(unit([1.0, 0.0]), 5) is None
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="Invalid max_entries"):
+            SemanticCache(max_entries=0)
+        with pytest.raises(ValueError, match="Invalid threshold"):
+            SemanticCache(threshold=1.5)
+
+    @pytest.mark.asyncio
+    async def test_retriever_skips_search_on_hit(self):
+        """A cache hit in Retriever skips querying the collection."""
+        queries = []
+
+        class MockCollection:
+            def query(self, query_embeddings, n_results):
+                queries.append(n_results)
+                return {
+                    "ids": [["doc1"]],
+                    "documents": [["Document about AI"]],
+                    "metadatas": [[{"source": "test1.txt"}]],
+                    "distances": [[0.1]]
+                }
+
+        retriever = Retriever(MockCollection(), semantic_cache=SemanticCache())
+
+        async def mock_embed(query):
+            return unit([1.0] * 384)
+
+        retriever._embed_query = mock_embed
+
+        first = await retriever.retrieve("What is AI?", top_k=3)
+        second = await retriever.retrieve("what is AI", top_k=3)
+
+        assert second == first
+        assert queries == [3]